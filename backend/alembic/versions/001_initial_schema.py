@@ -10,9 +10,70 @@ This migration creates the initial database schema including:
 - call_transcripts: Dialogue entries during calls
 - extracted_entities: Named entities from transcripts
 - performance_metrics: Operator performance tracking
+- metric_definitions: Lookup table of performance metric names
+- performance_metric_rollups: Per-session metric aggregates kept by trigger
 
-All tables use UUID primary keys and include proper indexes and constraints.
+training_scenarios and call_sessions use UUID primary keys since their IDs
+are exposed to clients. The high-volume child tables (call_transcripts,
+extracted_entities, performance_metrics) use ``BIGINT GENERATED ALWAYS AS
+IDENTITY`` keys, which are half the width of a UUID in every index entry and
+always append in order.
+
+UUID primary keys default to time-ordered UUIDv7 values generated by the server
+through ``uuid_generate_v7()``. Sequential keys are appended to the rightmost
+B-tree page instead of landing on random pages, which keeps the primary key
+indexes compact on insert-heavy tables. The function is created here in plain
+PL/pgSQL on top of the built-in ``gen_random_uuid()`` (PostgreSQL >= 13), so no
+extension is required. On PostgreSQL >= 18 it can be swapped for the native
+``uuidv7()``; with the ``pg_uuidv7`` extension installed the extension's
+function of the same name takes precedence.
+
+JSONB columns that are filtered on (``training_scenarios.scenario_script`` and
+``call_sessions.metadata``) carry GIN ``jsonb_path_ops`` indexes. These only
+serve containment predicates, so lookups must be written as
+``scenario_script @> '{"key": "value"}'::jsonb`` rather than
+``scenario_script->>'key' = 'value'`` to use the index.
+
+``call_sessions.metadata`` is reserved for ad-hoc keys. Once a metadata key is
+used in more than one query, promote it to a typed column (with an index if it
+is filtered on) instead of extracting it from JSONB; ``notes`` was promoted
+this way. ``emergency_type`` and ``initial_emotional_state``, which the create
+scenario API requires or defaults, are exposed as ``GENERATED ALWAYS ...
+STORED`` columns with B-tree indexes, so writers keep sending only the JSON
+and scenario filters can use the columns.
+
+``call_transcripts`` is the fastest-growing table and is range-partitioned by
+month on ``created_at``. Its primary key is ``(id, created_at)`` because a
+partitioned table's unique constraints must include the partition key, and
+``extracted_entities`` references it through the same pair of columns.
+``extracted_entities`` is partitioned on that copied ``transcript_created_at``
+with the same monthly bounds, so a month of transcripts and their entities
+live in matching partitions and are detached together.
+
+Confidence scores are stored as ``SMALLINT`` basis points (score x 10000) in
+``confidence_bp`` columns instead of 8-byte floats; the ORM exposes them as a
+``confidence_score`` fraction.
+
+Columns of the high-volume tables are declared in descending alignment order
+(8-byte BIGINT/TIMESTAMP/FLOAT, then UUID, 4-byte enums/integers, SMALLINT,
+and variable-length TEXT/VARCHAR/JSONB last) so rows carry no alignment
+padding. Keep that order when adding columns; check with
+``SELECT pg_column_size(t) FROM call_transcripts t``.
+
+Timestamps: ``started_at``/``ended_at`` on call_sessions are exposed to clients
+and stay ``TIMESTAMPTZ``. Internal bookkeeping columns (``created_at``,
+``updated_at``, ``measured_at`` and ``transcript_created_at``) are plain
+``TIMESTAMP`` holding UTC, defaulting to ``now() AT TIME ZONE 'utc'``, which
+avoids per-row time zone conversion. The columns carry no offset, so every
+value written to them must already be UTC; prefer leaving them to the server
+default, and convert an aware value to UTC before dropping its ``tzinfo``.
+
+``training_scenarios.caller_profile`` is only ever read back whole to configure
+the simulated caller, so it is stored as plain ``JSON`` (validated text) and
+skips the binary JSONB transform on write. Rule of thumb: JSONB when the
+column is queried with ``@>``, JSON when it is blob storage only.
 """
+from datetime import date, timedelta
 from typing import Sequence, Union
 
 from alembic import op
@@ -26,123 +87,313 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _create_enum(name: str, values: Sequence[str]) -> None:
+    """Create a PostgreSQL enum type unless it already exists, so re-runs are safe."""
+    labels = ", ".join(f"'{value}'" for value in values)
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = '{name}') THEN
+                CREATE TYPE {name} AS ENUM ({labels});
+            END IF;
+        END
+        $$
+    """)
+
+
+# Number of monthly partitions created ahead of the current one
+TRANSCRIPT_PARTITION_MONTHS_AHEAD = 3
+
+# Both tables are insert-only, so autovacuum never triggers on dead tuples.
+# Vacuum the active partition after 5% new rows (default 20%) to keep its
+# visibility map current for index-only scans.
+PARTITION_STORAGE_PARAMS = "autovacuum_vacuum_insert_scale_factor = 0.05"
+
+
+def _create_monthly_partitions(table_name: str) -> None:
+    """
+    Create monthly range partitions for call_transcripts or extracted_entities.
+
+    Partitions cover the current month plus TRANSCRIPT_PARTITION_MONTHS_AHEAD
+    months, and a DEFAULT partition catches anything outside them so inserts
+    never fail. Later months should be created ahead of time by a scheduled
+    job, e.g. with pg_cron:
+
+        SELECT cron.schedule('transcript_partitions', '0 0 25 * *', $$
+            DO $do$
+            DECLARE
+                start_date date := date_trunc('month', now() + interval '1 month');
+                parent text;
+            BEGIN
+                FOREACH parent IN ARRAY ARRAY['call_transcripts', 'extracted_entities'] LOOP
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I '
+                        'FOR VALUES FROM (%L) TO (%L) '
+                        'WITH (autovacuum_vacuum_insert_scale_factor = 0.05)',
+                        parent || '_' || to_char(start_date, 'YYYY_MM'), parent,
+                        start_date, start_date + interval '1 month'
+                    );
+                END LOOP;
+            END
+            $do$
+        $$);
+
+    Old months are archived by detaching the extracted_entities partition
+    first, then the call_transcripts one
+    (``ALTER TABLE call_transcripts DETACH PARTITION call_transcripts_YYYY_MM``)
+    and dropping both, which is constant-time unlike ``DELETE``.
+    """
+    start = date.today().replace(day=1)
+    for _ in range(TRANSCRIPT_PARTITION_MONTHS_AHEAD + 1):
+        end = (start + timedelta(days=32)).replace(day=1)
+        op.execute(
+            f"CREATE TABLE {table_name}_{start:%Y_%m} PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}') "
+            f"WITH ({PARTITION_STORAGE_PARAMS})"
+        )
+        start = end
+
+    op.execute(f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT")
+
+
 def upgrade() -> None:
     """Create all initial tables and indexes."""
 
+    # UUIDv7 generator: 48-bit unix epoch milliseconds followed by random bits,
+    # with the version (7) and variant bits set over a random v4 UUID
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        BEGIN
+            RETURN encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        END
+        $$ LANGUAGE plpgsql VOLATILE
+    """)
+
     # Create enum types
-    op.execute("CREATE TYPE difficulty_level_enum AS ENUM ('easy', 'medium', 'hard')")
-    op.execute("CREATE TYPE call_session_status_enum AS ENUM ('active', 'completed', 'terminated', 'error')")
-    op.execute("CREATE TYPE speaker_enum AS ENUM ('operator', 'caller')")
+    _create_enum('difficulty_level_enum', ['easy', 'medium', 'hard'])
+    _create_enum('call_session_status_enum', ['active', 'completed', 'terminated', 'error'])
+    _create_enum('speaker_enum', ['operator', 'caller'])
+    _create_enum('entity_type_enum', [
+        'WEAPON', 'INJURY', 'LOCATION', 'PERSON', 'VEHICLE', 'MEDICAL', 'TIME_REFERENCE',
+        'GPE', 'LOC', 'FAC', 'ORG', 'DATE', 'TIME', 'CARDINAL',
+    ])
+    _create_enum('emotional_state_enum', ['calm', 'neutral', 'anxious', 'fearful', 'panicked', 'hysterical'])
 
     # Create training_scenarios table
     op.create_table(
         'training_scenarios',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Unique identifier for the scenario'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False, comment='Unique identifier for the scenario'),
         sa.Column('name', sa.String(length=200), nullable=False, comment='Human-readable scenario name'),
         sa.Column('description', sa.Text(), nullable=False, comment='Detailed description of the scenario'),
-        sa.Column('caller_profile', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Caller personality, background, and emotional state'),
+        sa.Column('caller_profile', postgresql.JSON(astext_type=sa.Text()), nullable=False, comment='Caller personality, background, and emotional state'),
         sa.Column('scenario_script', postgresql.JSONB(astext_type=sa.Text()), nullable=False, comment='Initial conditions and expected dialogue flow'),
+        sa.Column('emergency_type', sa.Text(), sa.Computed("scenario_script->>'emergency_type'", persisted=True), nullable=True, comment="Generated from scenario_script->>'emergency_type'"),
+        sa.Column('initial_emotional_state', sa.Text(), sa.Computed("caller_profile->>'initial_emotional_state'", persisted=True), nullable=True, comment="Generated from caller_profile->>'initial_emotional_state'"),
         sa.Column('difficulty_level', sa.Enum('easy', 'medium', 'hard', name='difficulty_level_enum', create_type=False), nullable=False, comment='Difficulty rating for the scenario'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true', comment='Whether this scenario is available for training'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='When the scenario was created'),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='When the scenario was last updated'),
+        sa.Column('created_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='When the scenario was created'),
+        sa.Column('updated_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='When the scenario was last updated'),
         sa.PrimaryKeyConstraint('id'),
         comment='Pre-configured training scenarios for operator practice'
     )
     op.create_index('ix_training_scenarios_difficulty_active', 'training_scenarios', ['difficulty_level', 'is_active'])
+    op.execute("CREATE INDEX ix_training_scenarios_script_gin ON training_scenarios USING gin (scenario_script jsonb_path_ops)")
+    op.create_index('ix_training_scenarios_emergency_type', 'training_scenarios', ['emergency_type'])
+    op.create_index('ix_training_scenarios_initial_emotional_state', 'training_scenarios', ['initial_emotional_state'])
 
     # Create call_sessions table
     op.create_table(
         'call_sessions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Unique identifier for the call session'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('uuid_generate_v7()'), nullable=False, comment='Unique identifier for the call session'),
         sa.Column('operator_id', sa.String(length=100), nullable=False, comment='Identifier for the operator trainee'),
         sa.Column('scenario_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the training scenario used'),
         sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='When the call session started'),
         sa.Column('ended_at', sa.DateTime(timezone=True), nullable=True, comment='When the call session ended'),
         sa.Column('duration_ms', sa.Integer(), nullable=True, comment='Total duration of call in milliseconds'),
         sa.Column('status', sa.Enum('active', 'completed', 'terminated', 'error', name='call_session_status_enum', create_type=False), nullable=False, comment='Current status of the call session'),
-        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Flexible storage for additional session data'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record creation timestamp'),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record last update timestamp'),
+        sa.Column('notes', sa.Text(), nullable=True, comment='Operator notes recorded when the call ended'),
+        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Ad-hoc session data; keys used in queries are promoted to columns'),
+        sa.Column('created_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='Record creation timestamp'),
+        sa.Column('updated_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='Record last update timestamp'),
         sa.ForeignKeyConstraint(['scenario_id'], ['training_scenarios.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
         comment='Training call sessions with operators'
     )
-    op.create_index('ix_call_sessions_operator_id', 'call_sessions', ['operator_id'])
     op.create_index('ix_call_sessions_operator_started', 'call_sessions', ['operator_id', 'started_at'])
+    op.create_index('ix_call_sessions_scenario_id', 'call_sessions', ['scenario_id'])
+    op.execute("CREATE INDEX ix_call_sessions_active ON call_sessions (scenario_id, started_at) WHERE status = 'active'")
+    op.execute("CREATE INDEX ix_call_sessions_metadata_gin ON call_sessions USING gin (metadata jsonb_path_ops)")
 
     # Create call_transcripts table
     op.create_table(
         'call_transcripts',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Unique identifier for the transcript entry'),
-        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the call session'),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False, comment='Unique identifier for the transcript entry'),
+        sa.Column('created_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='Record creation timestamp (partition key)'),
         sa.Column('timestamp_ms', sa.BigInteger(), nullable=False, comment='Milliseconds from call start when this was spoken'),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the call session'),
         sa.Column('speaker', sa.Enum('operator', 'caller', name='speaker_enum', create_type=False), nullable=False, comment='Who spoke this line (operator or caller)'),
+        sa.Column('emotional_state', sa.Enum('calm', 'neutral', 'anxious', 'fearful', 'panicked', 'hysterical', name='emotional_state_enum', create_type=False), nullable=True, comment='Detected emotional state (calm, anxious, panicked, hysterical)'),
+        sa.Column('confidence_bp', sa.SmallInteger(), nullable=True, comment='Confidence score of transcription in basis points (0 to 10000)'),
         sa.Column('text', sa.Text(), nullable=False, comment='Transcribed text of what was said'),
         sa.Column('audio_url', sa.String(length=500), nullable=True, comment='S3 URL to audio recording of this utterance'),
-        sa.Column('emotional_state', sa.String(length=20), nullable=True, comment='Detected emotional state (calm, anxious, panicked, hysterical)'),
-        sa.Column('confidence_score', sa.Float(), nullable=True, comment='Confidence score of transcription (0.0 to 1.0)'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record creation timestamp'),
         sa.ForeignKeyConstraint(['session_id'], ['call_sessions.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        comment='Dialogue entries during call sessions'
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        sa.CheckConstraint('confidence_bp BETWEEN 0 AND 10000', name='ck_call_transcripts_confidence_bp'),
+        sa.CheckConstraint('timestamp_ms >= 0', name='ck_call_transcripts_timestamp_ms'),
+        comment='Dialogue entries during call sessions',
+        postgresql_partition_by='RANGE (created_at)'
     )
+    # Serves WHERE session_id = ? ORDER BY timestamp_ms as an ordered range scan
+    # (no sort). text is deliberately not INCLUDEd: utterances can exceed the
+    # B-tree tuple size limit, and without it no transcript read is index-only.
     op.create_index('ix_call_transcripts_session_timestamp', 'call_transcripts', ['session_id', 'timestamp_ms'])
+    op.execute("CREATE INDEX ix_call_transcripts_created_at_brin ON call_transcripts USING brin (created_at) WITH (pages_per_range = 32)")
+    _create_monthly_partitions('call_transcripts')
 
     # Create extracted_entities table
     op.create_table(
         'extracted_entities',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Unique identifier for the entity'),
-        sa.Column('transcript_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the transcript containing this entity'),
-        sa.Column('entity_type', sa.String(length=50), nullable=False, comment='Type of entity (WEAPON, INJURY, LOCATION, PERSON, VEHICLE, TIME_REFERENCE)'),
-        sa.Column('entity_value', sa.Text(), nullable=False, comment='The actual text value of the entity'),
-        sa.Column('confidence_score', sa.Float(), nullable=False, comment='Confidence score of entity extraction (0.0 to 1.0)'),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False, comment='Unique identifier for the entity'),
+        sa.Column('transcript_id', sa.BigInteger(), nullable=False, comment='Reference to the transcript containing this entity'),
+        sa.Column('transcript_created_at', sa.DateTime(timezone=False), nullable=False, comment='Partition key of the referenced transcript (and of this table)'),
+        sa.Column('created_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='Record creation timestamp'),
+        sa.Column('entity_type', sa.Enum('WEAPON', 'INJURY', 'LOCATION', 'PERSON', 'VEHICLE', 'MEDICAL', 'TIME_REFERENCE', 'GPE', 'LOC', 'FAC', 'ORG', 'DATE', 'TIME', 'CARDINAL', name='entity_type_enum', create_type=False), nullable=False, comment='Type of entity (WEAPON, INJURY, LOCATION, PERSON, VEHICLE, TIME_REFERENCE)'),
         sa.Column('start_char', sa.Integer(), nullable=False, comment='Starting character position in transcript text'),
         sa.Column('end_char', sa.Integer(), nullable=False, comment='Ending character position in transcript text'),
+        sa.Column('confidence_bp', sa.SmallInteger(), nullable=False, comment='Confidence score of entity extraction in basis points (0 to 10000)'),
+        sa.Column('entity_value', sa.Text(), nullable=False, comment='The actual text value of the entity'),
         sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True, comment='Additional entity-specific data'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='Record creation timestamp'),
-        sa.ForeignKeyConstraint(['transcript_id'], ['call_transcripts.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        comment='Named entities extracted from transcripts'
+        sa.ForeignKeyConstraint(['transcript_id', 'transcript_created_at'], ['call_transcripts.id', 'call_transcripts.created_at'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', 'transcript_created_at'),
+        sa.CheckConstraint('confidence_bp BETWEEN 0 AND 10000', name='ck_extracted_entities_confidence_bp'),
+        sa.CheckConstraint('start_char >= 0 AND end_char >= start_char', name='ck_extracted_entities_char_range'),
+        comment='Named entities extracted from transcripts',
+        postgresql_partition_by='RANGE (transcript_created_at)'
     )
     op.create_index('ix_extracted_entities_transcript_type', 'extracted_entities', ['transcript_id', 'entity_type'])
+    _create_monthly_partitions('extracted_entities')
+
+    # Create metric_definitions lookup table
+    op.create_table(
+        'metric_definitions',
+        sa.Column('id', sa.SmallInteger(), sa.Identity(always=True), nullable=False, comment='Unique identifier for the metric definition'),
+        sa.Column('name', sa.String(length=100), nullable=False, comment='Name of the metric (response_time, empathy_score, info_gathered, etc.)'),
+        sa.Column('description', sa.Text(), nullable=True, comment='What the metric measures and how it is scored'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+        comment='Lookup table of performance metric names'
+    )
 
     # Create performance_metrics table
     op.create_table(
         'performance_metrics',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, comment='Unique identifier for the metric'),
-        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the call session'),
-        sa.Column('metric_name', sa.String(length=100), nullable=False, comment='Name of the metric (response_time, empathy_score, info_gathered, etc.)'),
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False, comment='Unique identifier for the metric'),
         sa.Column('metric_value', sa.Float(), nullable=False, comment='Numeric value of the metric'),
-        sa.Column('measured_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False, comment='When this metric was measured'),
+        sa.Column('measured_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='When this metric was measured'),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the call session'),
+        sa.Column('metric_id', sa.SmallInteger(), nullable=False, comment='Reference to the metric definition'),
         sa.ForeignKeyConstraint(['session_id'], ['call_sessions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['metric_id'], ['metric_definitions.id']),
         sa.PrimaryKeyConstraint('id'),
         comment='Performance metrics for operator training'
     )
     op.create_index('ix_performance_metrics_session', 'performance_metrics', ['session_id'])
 
+    # Create performance_metric_rollups table, maintained by trigger so
+    # dashboards read per-session aggregates instead of scanning measurements
+    op.create_table(
+        'performance_metric_rollups',
+        sa.Column('sum_value', sa.Float(), nullable=False, comment='Sum of all measured values'),
+        sa.Column('min_value', sa.Float(), nullable=False, comment='Smallest measured value'),
+        sa.Column('max_value', sa.Float(), nullable=False, comment='Largest measured value'),
+        sa.Column('updated_at', sa.DateTime(timezone=False), server_default=sa.text("(now() AT TIME ZONE 'utc')"), nullable=False, comment='When the rollup last absorbed new measurements'),
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), nullable=False, comment='Reference to the call session'),
+        sa.Column('sample_count', sa.Integer(), nullable=False, comment='Number of measurements aggregated'),
+        sa.Column('metric_id', sa.SmallInteger(), nullable=False, comment='Reference to the metric definition'),
+        sa.ForeignKeyConstraint(['session_id'], ['call_sessions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['metric_id'], ['metric_definitions.id']),
+        sa.PrimaryKeyConstraint('session_id', 'metric_id'),
+        comment='Per-session aggregates of performance metrics'
+    )
+    # Statement-level trigger: a batch insert folds into the rollup with one
+    # grouped upsert instead of one upsert per row. Average = sum / count.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION performance_metrics_rollup() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO performance_metric_rollups AS r
+                (session_id, metric_id, sample_count, sum_value, min_value, max_value, updated_at)
+            SELECT session_id, metric_id, count(*), sum(metric_value), min(metric_value), max(metric_value),
+                   now() AT TIME ZONE 'utc'
+            FROM new_rows
+            GROUP BY session_id, metric_id
+            ON CONFLICT (session_id, metric_id) DO UPDATE SET
+                sample_count = r.sample_count + EXCLUDED.sample_count,
+                sum_value = r.sum_value + EXCLUDED.sum_value,
+                min_value = LEAST(r.min_value, EXCLUDED.min_value),
+                max_value = GREATEST(r.max_value, EXCLUDED.max_value),
+                updated_at = EXCLUDED.updated_at;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_performance_metrics_rollup
+            AFTER INSERT ON performance_metrics
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION performance_metrics_rollup()
+    """)
+
+    # Use LZ4 TOAST compression for free-text columns where the server
+    # supports it (PostgreSQL >= 14 built with lz4); otherwise keep pglz.
+    # Partitions created later inherit the setting from call_transcripts.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_settings
+                WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)
+            ) THEN
+                ALTER TABLE call_transcripts ALTER COLUMN text SET COMPRESSION lz4;
+                ALTER TABLE extracted_entities ALTER COLUMN entity_value SET COMPRESSION lz4;
+                ALTER TABLE training_scenarios ALTER COLUMN description SET COMPRESSION lz4;
+            END IF;
+        END
+        $$
+    """)
+
 
 def downgrade() -> None:
     """Drop all tables and enum types."""
 
-    # Drop tables in reverse order (respecting foreign keys)
-    op.drop_index('ix_performance_metrics_session', table_name='performance_metrics')
+    # Drop tables in reverse order (respecting foreign keys). DROP TABLE also
+    # drops the table's indexes, so they are not dropped separately.
+    op.drop_table('performance_metric_rollups')
     op.drop_table('performance_metrics')
-
-    op.drop_index('ix_extracted_entities_transcript_type', table_name='extracted_entities')
+    op.execute("DROP FUNCTION IF EXISTS performance_metrics_rollup()")
+    op.drop_table('metric_definitions')
     op.drop_table('extracted_entities')
-
-    op.drop_index('ix_call_transcripts_session_timestamp', table_name='call_transcripts')
     op.drop_table('call_transcripts')
-
-    op.drop_index('ix_call_sessions_operator_started', table_name='call_sessions')
-    op.drop_index('ix_call_sessions_operator_id', table_name='call_sessions')
     op.drop_table('call_sessions')
-
-    op.drop_index('ix_training_scenarios_difficulty_active', table_name='training_scenarios')
     op.drop_table('training_scenarios')
 
     # Drop enum types
-    op.execute("DROP TYPE speaker_enum")
-    op.execute("DROP TYPE call_session_status_enum")
-    op.execute("DROP TYPE difficulty_level_enum")
+    op.execute("DROP TYPE IF EXISTS emotional_state_enum")
+    op.execute("DROP TYPE IF EXISTS entity_type_enum")
+    op.execute("DROP TYPE IF EXISTS speaker_enum")
+    op.execute("DROP TYPE IF EXISTS call_session_status_enum")
+    op.execute("DROP TYPE IF EXISTS difficulty_level_enum")
+
+    op.execute("DROP FUNCTION uuid_generate_v7()")
@@ -1,29 +1,35 @@
 """REST API routes for call management"""
 
 import logging
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from sqlalchemy.orm import selectinload
+from sqlalchemy import DateTime, cast, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import raiseload
 
-from app.db import get_db
+from app.db import get_db, get_db_readonly
 from app.models import schemas
 from app.models.database import (
     CallSession,
     CallTranscript,
     TrainingScenario,
     CallSessionStatus,
-    DifficultyLevel
+    DifficultyLevel,
+    elapsed_ms
 )
 from app.services.dialogue_manager import dialogue_manager
+from app.services.scenario_cache import scenario_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["calls"])
 
+# Largest transcript page a client may request
+MAX_TRANSCRIPT_PAGE = 1000
+
 
 @router.post("/calls/start", response_model=schemas.CallSessionResponse, status_code=status.HTTP_201_CREATED)
 async def start_call_session(
@@ -37,10 +43,7 @@ async def start_call_session(
     """
     try:
         # Verify scenario exists
-        result = await db.execute(
-            select(TrainingScenario).where(TrainingScenario.id == request.scenario_id)
-        )
-        scenario = result.scalar_one_or_none()
+        scenario = await scenario_cache.get(request.scenario_id, db)
 
         if not scenario:
             raise HTTPException(
@@ -53,7 +56,7 @@ async def start_call_session(
             operator_id=request.operator_id,
             scenario_id=request.scenario_id,
             status=CallSessionStatus.ACTIVE,
-            started_at=datetime.utcnow()
+            started_at=datetime.now(timezone.utc)
         )
 
         db.add(call_session)
@@ -64,23 +67,23 @@ async def start_call_session(
         await dialogue_manager.create_session_context(
             session_id=str(call_session.id),
             scenario_data={
-                "id": str(scenario.id),
-                "name": scenario.name,
-                "description": scenario.description,
-                "scenario_script": scenario.scenario_script,
-                "difficulty_level": scenario.difficulty_level.value
+                "id": scenario["id"],
+                "name": scenario["name"],
+                "description": scenario["description"],
+                "scenario_script": scenario["scenario_script"],
+                "difficulty_level": scenario["difficulty_level"]
             },
-            caller_profile=scenario.caller_profile
+            caller_profile=scenario["caller_profile"]
         )
 
-        logger.info(f"Call session started: {call_session.id}")
+        logger.info("Call session started: %s", call_session.id)
 
         return call_session
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to start call session: {e}")
+        logger.error("Failed to start call session: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start call session: {str(e)}"
@@ -90,14 +93,16 @@ async def start_call_session(
 @router.get("/calls/{call_id}", response_model=schemas.CallSessionResponse)
 async def get_call_session(
     call_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get details of a specific call session.
     """
     try:
         result = await db.execute(
-            select(CallSession).where(CallSession.id == call_id)
+            select(CallSession)
+            .options(raiseload("*"))
+            .where(CallSession.id == call_id)
         )
         call_session = result.scalar_one_or_none()
 
@@ -112,7 +117,7 @@ async def get_call_session(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get call session: {e}")
+        logger.error("Failed to get call session: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get call session: {str(e)}"
@@ -131,105 +136,185 @@ async def end_call_session(
     Marks the session as completed and calculates duration.
     """
     try:
-        # Get call session
+        # Update session in one statement: the status precondition replaces a
+        # pre-flight SELECT and the duration is computed by the database
+        values = {
+            "status": CallSessionStatus.COMPLETED,
+            "ended_at": func.now(),
+            "duration_ms": elapsed_ms(CallSession.started_at),
+        }
+        # Notes have their own column; feedback stays in ad-hoc metadata
+        if request.notes:
+            values["notes"] = request.notes
+        if request.operator_feedback:
+            values["session_metadata"] = func.coalesce(
+                CallSession.session_metadata, cast({}, JSONB)
+            ).op("||")(
+                cast({"operator_feedback": request.operator_feedback}, JSONB)
+            )
+
         result = await db.execute(
-            select(CallSession).where(CallSession.id == call_id)
+            update(CallSession)
+            .where(
+                CallSession.id == call_id,
+                CallSession.status == CallSessionStatus.ACTIVE
+            )
+            .values(**values)
+            .returning(CallSession)
         )
         call_session = result.scalar_one_or_none()
 
         if not call_session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Call session not found: {call_id}"
-            )
+            # Nothing updated: find out whether the session exists at all
+            current_status = (await db.execute(
+                select(CallSession.status).where(CallSession.id == call_id)
+            )).scalar_one_or_none()
+
+            if current_status is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Call session not found: {call_id}"
+                )
 
-        if call_session.status != CallSessionStatus.ACTIVE:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Call session is not active: {call_session.status}"
+                detail=f"Call session is not active: {current_status}"
             )
 
-        # Update session
-        ended_at = datetime.utcnow()
-        duration_ms = int((ended_at - call_session.started_at).total_seconds() * 1000)
-
-        # Update metadata with notes if provided
-        metadata = call_session.metadata or {}
-        if request.notes:
-            metadata["notes"] = request.notes
-        if request.operator_feedback:
-            metadata["operator_feedback"] = request.operator_feedback
-
-        stmt = update(CallSession).where(
-            CallSession.id == call_id
-        ).values(
-            status=CallSessionStatus.COMPLETED,
-            ended_at=ended_at,
-            duration_ms=duration_ms,
-            metadata=metadata
-        )
-        await db.execute(stmt)
         await db.commit()
 
-        # Refresh to get updated values
-        await db.refresh(call_session)
-
         # Clean up dialogue context
         await dialogue_manager.delete_session_context(str(call_id))
 
-        logger.info(f"Call session ended: {call_id}, duration: {duration_ms}ms")
+        logger.info("Call session ended: %s, duration: %sms", call_id, call_session.duration_ms)
 
         return call_session
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to end call session: {e}")
+        logger.error("Failed to end call session: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to end call session: {str(e)}"
         )
 
 
+def transcript_filter(call_id: UUID) -> tuple:
+    """
+    WHERE clauses selecting one session's transcripts.
+
+    call_transcripts is range-partitioned by month on created_at, so a bare
+    session_id filter probes every partition's index. Bounding created_at
+    from below by the session start (a day early, to absorb clock skew
+    between app and database) lets PostgreSQL prune older partitions at
+    execution time.
+    """
+    session_start = (
+        select(func.timezone("utc", CallSession.started_at, type_=DateTime()) - timedelta(days=1))
+        .where(CallSession.id == call_id)
+        .scalar_subquery()
+    )
+    return (
+        CallTranscript.session_id == call_id,
+        CallTranscript.created_at >= session_start,
+    )
+
+
 @router.get("/calls/{call_id}/transcript", response_model=schemas.TranscriptListResponse)
 async def get_call_transcript(
     call_id: UUID,
+    after_timestamp_ms: Optional[int] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TRANSCRIPT_PAGE),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get full transcript for a call session.
+    Get the transcript for a call session.
+
+    Returns the full transcript unless a limit is given. Pages are keyset
+    paginated on (timestamp_ms, id): pass the previous page's
+    next_after_timestamp_ms / next_after_id to continue, so each page is a
+    range scan on ix_call_transcripts_session_timestamp regardless of depth.
     """
-    try:
-        # Verify session exists
-        result = await db.execute(
-            select(CallSession).where(CallSession.id == call_id)
+    if after_id is not None and after_timestamp_ms is None:
+        # Unprocessable Content; the constant's name differs across Starlette versions
+        raise HTTPException(
+            status_code=422,
+            detail="after_id requires after_timestamp_ms"
         )
-        call_session = result.scalar_one_or_none()
 
-        if not call_session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Call session not found: {call_id}"
-            )
+    try:
+        session_transcripts = transcript_filter(call_id)
+        total_count = (await db.execute(
+            select(func.count())
+            .select_from(CallTranscript)
+            .where(*session_transcripts)
+        )).scalar_one()
+
+        # Only an empty transcript needs to tell "no turns yet" from "no session"
+        if total_count == 0:
+            session_exists = (await db.execute(
+                select(select(CallSession.id).where(CallSession.id == call_id).exists())
+            )).scalar()
+            if not session_exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Call session not found: {call_id}"
+                )
 
-        # Get transcripts
-        result = await db.execute(
-            select(CallTranscript)
-            .where(CallTranscript.session_id == call_id)
-            .order_by(CallTranscript.timestamp_ms)
+        page_filters = list(session_transcripts)
+        if after_timestamp_ms is not None:
+            if after_id is None:
+                page_filters.append(CallTranscript.timestamp_ms > after_timestamp_ms)
+            else:
+                # id breaks ties between turns logged at the same timestamp
+                page_filters.append(
+                    tuple_(CallTranscript.timestamp_ms, CallTranscript.id)
+                    > tuple_(after_timestamp_ms, after_id)
+                )
+
+        # Stream plain column tuples straight into the response models instead
+        # of materializing ORM objects first
+        query = (
+            select(
+                CallTranscript.id,
+                CallTranscript.session_id,
+                CallTranscript.timestamp_ms,
+                CallTranscript.speaker,
+                CallTranscript.text,
+                CallTranscript.audio_url,
+                CallTranscript.emotional_state,
+                CallTranscript.confidence_score.label("confidence_score")
+            )
+            .where(*page_filters)
+            .order_by(CallTranscript.timestamp_ms, CallTranscript.id)
+            .execution_options(yield_per=200)
         )
-        transcripts = result.scalars().all()
+        if limit is not None:
+            query = query.limit(limit)
 
-        return schemas.TranscriptListResponse(
+        result = await db.stream(query)
+        transcripts = [
+            schemas.TranscriptEntryResponse.model_validate(row)
+            async for row in result
+        ]
+
+        response = schemas.TranscriptListResponse(
             session_id=call_id,
             transcripts=transcripts,
-            total_count=len(transcripts)
+            total_count=total_count
         )
+        if limit is not None and len(transcripts) == limit:
+            response.next_after_timestamp_ms = transcripts[-1].timestamp_ms
+            response.next_after_id = transcripts[-1].id
+
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get call transcript: {e}")
+        logger.error("Failed to get call transcript: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get call transcript: {str(e)}"
@@ -241,7 +326,7 @@ async def list_scenarios(
     difficulty: str = None,
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     List available training scenarios.
@@ -249,43 +334,65 @@ async def list_scenarios(
     Optionally filter by difficulty level.
     """
     try:
-        # Build query
-        query = select(TrainingScenario)
+        # Build filter shared by the page query and the count
+        filters = []
+        difficulty_key = None
 
         if difficulty:
             try:
                 difficulty_enum = DifficultyLevel(difficulty.lower())
-                query = query.where(TrainingScenario.difficulty_level == difficulty_enum)
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid difficulty level: {difficulty}"
                 )
-
-        query = query.offset(skip).limit(limit)
+            filters.append(TrainingScenario.difficulty_level == difficulty_enum)
+            difficulty_key = difficulty_enum.value
+
+        # Serve the already-serialized page from Redis when cached
+        cached = await scenario_cache.get_list(difficulty_key, skip, limit)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
+        # Select only the summary columns: caller_profile and scenario_script
+        # are detail-view JSONB and dominate the row size
+        query = (
+            select(
+                TrainingScenario.id,
+                TrainingScenario.name,
+                TrainingScenario.description,
+                TrainingScenario.difficulty_level,
+                TrainingScenario.created_at,
+                TrainingScenario.updated_at
+            )
+            .where(*filters)
+            .offset(skip)
+            .limit(limit)
+        )
 
         # Execute query
         result = await db.execute(query)
-        scenarios = result.scalars().all()
+        scenarios = [
+            schemas.TrainingScenarioSummary.model_validate(row)
+            for row in result
+        ]
 
-        # Get total count
-        count_query = select(TrainingScenario)
-        if difficulty:
-            count_query = count_query.where(
-                TrainingScenario.difficulty_level == DifficultyLevel(difficulty.lower())
-            )
-        count_result = await db.execute(count_query)
-        total_count = len(count_result.scalars().all())
+        # Get total count without loading the rows
+        count_query = select(func.count()).select_from(TrainingScenario).where(*filters)
+        total_count = (await db.execute(count_query)).scalar_one()
 
-        return schemas.TrainingScenarioListResponse(
+        response = schemas.TrainingScenarioListResponse(
             scenarios=scenarios,
             total_count=total_count
         )
+        await scenario_cache.set_list(difficulty_key, skip, limit, response.model_dump_json())
+
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list scenarios: {e}")
+        logger.error("Failed to list scenarios: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to list scenarios: {str(e)}"
@@ -319,23 +426,24 @@ async def create_scenario(
             description=request.description,
             caller_profile=request.caller_profile.model_dump(),
             scenario_script=request.scenario_script.model_dump(),
-            difficulty_level=DifficultyLevel(request.difficulty_level),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            difficulty_level=DifficultyLevel(request.difficulty_level)
         )
 
         db.add(scenario)
         await db.commit()
         await db.refresh(scenario)
 
-        logger.info(f"Training scenario created: {scenario.id} - {scenario.name}")
+        # Drop cached list pages (and any stale copy of this scenario)
+        await scenario_cache.invalidate(scenario.id)
+
+        logger.info("Training scenario created: %s - %s", scenario.id, scenario.name)
 
         return scenario
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create scenario: {e}")
+        logger.error("Failed to create scenario: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create scenario: {str(e)}"
@@ -345,16 +453,13 @@ async def create_scenario(
 @router.get("/scenarios/{scenario_id}", response_model=schemas.TrainingScenarioResponse)
 async def get_scenario(
     scenario_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     Get details of a specific training scenario.
     """
     try:
-        result = await db.execute(
-            select(TrainingScenario).where(TrainingScenario.id == scenario_id)
-        )
-        scenario = result.scalar_one_or_none()
+        scenario = await scenario_cache.get(scenario_id, db)
 
         if not scenario:
             raise HTTPException(
@@ -367,7 +472,7 @@ async def get_scenario(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get scenario: {e}")
+        logger.error("Failed to get scenario: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get scenario: {str(e)}"
@@ -1,20 +1,35 @@
 """WebSocket endpoint for real-time call simulation"""
 
+import asyncio
 import logging
-import json
-from typing import Dict, Any
+import orjson
+from typing import Dict, Any, List, Tuple, Union
 from uuid import UUID
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+import redis.asyncio as redis
+from redis.asyncio.client import PubSub
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db, AsyncSessionLocal
+from app.core.config import settings
+from app.db import AsyncSessionLocal
 from app.models import schemas
 from app.services.llm_service import llm_service
 from app.services.tts_service import tts_service
 from app.services.nlp_service import nlp_service
 from app.services.audio_service import audio_service
 from app.services.dialogue_manager import dialogue_manager
-from app.models.database import CallSession, CallTranscript, ExtractedEntity, Speaker
+from app.models.database import (
+    CallSession,
+    CallSessionStatus,
+    CallTranscript,
+    ExtractedEntity,
+    Speaker,
+    elapsed_ms,
+    to_confidence_bp,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +37,126 @@ router = APIRouter()
 
 
 class ConnectionManager:
-    """Manages active WebSocket connections"""
+    """
+    Manages active WebSocket connections.
+
+    Every server-to-client message goes through send_message. When this
+    worker holds the session's socket it is written directly; otherwise it is
+    published to the Redis channel ``ws:{session_id}``, which the worker that
+    owns the socket subscribes to, so any worker can reach any client when
+    running with multiple uvicorn workers. Writes to one socket are
+    serialized by a per-session lock, so forwarded messages never interleave
+    with the handler's own.
+    """
 
     def __init__(self):
+        self.redis_client = None
         self.active_connections: Dict[str, WebSocket] = {}
+        self._send_locks: Dict[str, asyncio.Lock] = {}
+        self._subscriptions: Dict[str, Tuple[PubSub, asyncio.Task]] = {}
+
+    async def initialize(self):
+        """Initialize Redis connection"""
+        try:
+            self.redis_client = await redis.from_url(
+                settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True
+            )
+            logger.info("ConnectionManager initialized with Redis connection")
+        except Exception as e:
+            logger.error("Failed to initialize ConnectionManager: %s", e)
+            raise
+
+    async def close(self):
+        """Close Redis connection"""
+        for session_id in list(self.active_connections):
+            await self.disconnect(session_id)
+        if self.redis_client:
+            await self.redis_client.close()
+            logger.info("ConnectionManager Redis connection closed")
+
+    @staticmethod
+    def _channel(session_id: str) -> str:
+        return f"ws:{session_id}"
 
     async def connect(self, session_id: str, websocket: WebSocket):
-        """Connect a new WebSocket client"""
+        """Connect a new WebSocket client and subscribe to its channel"""
         await websocket.accept()
         self.active_connections[session_id] = websocket
-        logger.info(f"WebSocket connected: {session_id}")
+        self._send_locks[session_id] = asyncio.Lock()
+
+        pubsub = self.redis_client.pubsub()
+        self._subscriptions[session_id] = (pubsub, None)
+        await pubsub.subscribe(self._channel(session_id))
+        task = asyncio.create_task(self._forward(session_id, pubsub))
+        self._subscriptions[session_id] = (pubsub, task)
+
+        logger.info("WebSocket connected: %s", session_id)
+
+    async def disconnect(self, session_id: str):
+        """Disconnect a WebSocket client and drop its subscription"""
+        subscription = self._subscriptions.pop(session_id, None)
+        if subscription:
+            pubsub, task = subscription
+            if task:
+                task.cancel()
+            try:
+                await pubsub.unsubscribe(self._channel(session_id))
+                await pubsub.close()
+            except Exception as e:
+                logger.error("Failed to unsubscribe %s: %s", session_id, e)
 
-    def disconnect(self, session_id: str):
-        """Disconnect a WebSocket client"""
+        self._send_locks.pop(session_id, None)
         if session_id in self.active_connections:
             del self.active_connections[session_id]
-            logger.info(f"WebSocket disconnected: {session_id}")
+            logger.info("WebSocket disconnected: %s", session_id)
+
+    async def _forward(self, session_id: str, pubsub: PubSub):
+        """Write messages published for a session to its socket"""
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    await self._send_text(session_id, message["data"])
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Failed to forward message to %s: %s", session_id, e)
+
+    async def _send_text(self, session_id: str, text: str) -> bool:
+        """Write a text frame if this worker holds the socket"""
+        websocket = self.active_connections.get(session_id)
+        if websocket is None:
+            return False
+        async with self._send_locks[session_id]:
+            await websocket.send_text(text)
+        return True
 
     async def send_message(self, session_id: str, message: Dict[str, Any]):
-        """Send message to specific session"""
-        if session_id in self.active_connections:
-            try:
-                await self.active_connections[session_id].send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to send message to {session_id}: {e}")
+        """
+        Send a message as a JSON text frame, whichever worker holds its socket.
+
+        Encodes with orjson, which is much faster than the stdlib encoder used
+        by ``WebSocket.send_json`` and serializes UUIDs natively. Errors
+        writing to a local socket propagate to the caller, as a direct send
+        would.
+        """
+        text = orjson.dumps(message).decode()
+        if await self._send_text(session_id, text):
+            return
+        try:
+            await self.redis_client.publish(self._channel(session_id), text)
+        except Exception as e:
+            logger.error("Failed to send message to %s: %s", session_id, e)
+
+    async def send_bytes(self, session_id: str, data: bytes):
+        """Send a binary frame to a socket held by this worker"""
+        websocket = self.active_connections.get(session_id)
+        if websocket is None:
+            logger.warning("No local socket for binary frame to %s", session_id)
+            return
+        async with self._send_locks[session_id]:
+            await websocket.send_bytes(data)
 
     async def broadcast(self, session_id: str, message: Dict[str, Any]):
         """Broadcast message to all connections for a session"""
@@ -54,6 +165,16 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# Validates raw client frames into the typed message union
+client_message_adapter = TypeAdapter(schemas.WSClientMessage)
+
+# Insert statements for the per-turn write path, built once at import so the
+# engine's compiled cache is hit on every execution
+INSERT_TRANSCRIPTS = insert(CallTranscript).returning(
+    CallTranscript.id, CallTranscript.created_at, sort_by_parameter_order=True
+)
+INSERT_ENTITIES = insert(ExtractedEntity).returning(ExtractedEntity.id, sort_by_parameter_order=True)
+
 
 @router.websocket("/ws/call/{session_id}")
 async def websocket_endpoint(
@@ -64,26 +185,37 @@ async def websocket_endpoint(
     WebSocket endpoint for real-time call simulation.
 
     Handles:
-    - Audio streaming (base64 encoded chunks)
+    - Audio streaming (binary frames, or legacy base64 JSON chunks)
     - Control messages (mute, hold, terminate)
     - Transcript updates
     - Entity extraction updates
     - Emotional state updates
+
+    Database sessions are opened per operation rather than for the lifetime
+    of the socket, so a pooled connection is never held across the seconds
+    spent waiting on LLM/TTS calls.
     """
-    await manager.connect(session_id, websocket)
+    try:
+        await manager.connect(session_id, websocket)
 
-    # Get database session using context manager
-    async with AsyncSessionLocal() as db:
-        try:
-            # Verify session exists
-            from sqlalchemy import select
-            result = await db.execute(
-                select(CallSession).where(CallSession.id == UUID(session_id))
-            )
-            call_session = result.scalar_one_or_none()
+        # Parse once; handlers receive the UUID for database writes
+        session_uuid = UUID(session_id)
 
-            if not call_session:
-                await websocket.send_json({
+        # Get session context. It exists from call start until the call ends,
+        # so the database is only consulted when it is missing. It is read
+        # once per socket: this handler is the session's only writer, and the
+        # dialogue_manager writes below update it in place.
+        context = await dialogue_manager.get_session_context(session_id)
+        if not context:
+            # Verify session exists
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(CallSession.id).where(CallSession.id == session_uuid)
+                )
+                call_session_id = result.scalar_one_or_none()
+
+            if not call_session_id:
+                await manager.send_message(session_id, {
                     "type": "error",
                     "error_code": "SESSION_NOT_FOUND",
                     "error_message": f"Call session not found: {session_id}"
@@ -91,133 +223,142 @@ async def websocket_endpoint(
                 await websocket.close()
                 return
 
-            # Get session context
-            context = await dialogue_manager.get_session_context(session_id)
-            if not context:
-                await websocket.send_json({
+            await manager.send_message(session_id, {
+                "type": "error",
+                "error_code": "CONTEXT_NOT_FOUND",
+                "error_message": "Session context not found"
+            })
+            await websocket.close()
+            return
+
+        # Send initial greeting from AI caller
+        await send_initial_greeting(websocket, session_id, session_uuid, context)
+
+        # Main message loop
+        # Messages are handled one at a time: the next frame is not read until
+        # the current handler returns, so a fast client is held back by the
+        # transport instead of queueing work on the server.
+        while True:
+            # Receive message from client; binary frames carry raw audio
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            data = frame.get("text")
+            if data is None:
+                data = frame["bytes"]
+
+            # Reject oversized frames before parsing them
+            if exceeds_message_limit(data):
+                await manager.send_message(session_id, {
                     "type": "error",
-                    "error_code": "CONTEXT_NOT_FOUND",
-                    "error_message": "Session context not found"
+                    "error_code": "MESSAGE_TOO_LARGE",
+                    "error_message": f"Message exceeds {settings.ws_max_message_bytes} bytes"
                 })
-                await websocket.close()
-                return
-
-            # Send initial greeting from AI caller
-            await send_initial_greeting(websocket, session_id, context, db)
+                continue
 
-            # Main message loop
-            while True:
-                # Receive message from client
-                data = await websocket.receive_text()
-                message = json.loads(data)
+            if isinstance(data, bytes):
+                await handle_audio_frame(data, session_id, websocket)
+                continue
 
-                message_type = message.get("type")
+            # Decode and validate in one pass into a typed message
+            try:
+                message = client_message_adapter.validate_json(data)
+            except ValidationError as e:
+                logger.warning("Invalid or unknown message: %s", e)
+                continue
 
-                if message_type == "audio_chunk":
-                    await handle_audio_chunk(message, session_id, context, websocket, db)
+            if isinstance(message, schemas.WSClientAudioChunk):
+                await handle_audio_chunk(message, session_id, context, websocket)
 
-                elif message_type == "control":
-                    await handle_control_message(message, session_id, websocket, db)
+            elif isinstance(message, schemas.WSClientControl):
+                await handle_control_message(message, session_id, session_uuid, websocket)
 
-                elif message_type == "transcript":
-                    await handle_transcript_message(message, session_id, context, websocket, db)
+            elif isinstance(message, schemas.WSClientTranscript):
+                await handle_transcript_message(message, session_id, session_uuid, context, websocket)
 
-                else:
-                    logger.warning(f"Unknown message type: {message_type}")
+    except WebSocketDisconnect:
+        logger.info("WebSocket disconnected: %s", session_id)
 
-        except WebSocketDisconnect:
-            logger.info(f"WebSocket disconnected: {session_id}")
-            manager.disconnect(session_id)
+    except Exception as e:
+        logger.error("WebSocket error for session %s: %s", session_id, e)
+        try:
+            await manager.send_message(session_id, {
+                "type": "error",
+                "error_code": "INTERNAL_ERROR",
+                "error_message": str(e)
+            })
+        except:
+            pass
 
-        except Exception as e:
-            logger.error(f"WebSocket error for session {session_id}: {e}")
-            try:
-                await websocket.send_json({
-                    "type": "error",
-                    "error_code": "INTERNAL_ERROR",
-                    "error_message": str(e)
-                })
-            except:
-                pass
-            manager.disconnect(session_id)
+    finally:
+        await manager.disconnect(session_id)
 
 
 async def send_initial_greeting(
     websocket: WebSocket,
     session_id: str,
-    context: Dict[str, Any],
-    db: AsyncSession
+    session_uuid: UUID,
+    context: Dict[str, Any]
 ):
     """Send initial greeting from AI caller"""
     try:
         # Get initial situation from scenario
         scenario = context.get("scenario", {})
-        initial_situation = scenario.get("scenario_script", {}).get("initial_situation", "")
-
-        # Generate initial caller statement
-        conversation_history = []
         caller_profile = context.get("caller_profile", {})
 
-        llm_response = await llm_service.generate_caller_response(
+        # Generate initial caller statement, voicing it as it streams
+        llm_response, speech = await speak_caller_response(
+            websocket,
+            session_id,
+            0,
             conversation_history=[],
             caller_profile=caller_profile,
             scenario_context=scenario.get("scenario_script", {}),
             current_emotional_state=context.get("current_emotional_state", "calm")
         )
 
-        # Generate speech
-        tts_response = await tts_service.synthesize_speech(
-            text=llm_response["response_text"],
-            emotional_state=llm_response["emotional_state"]
+        # Extract entities while the last sentences are synthesized
+        entities, _ = await asyncio.gather(
+            extract_entities(llm_response["response_text"], session_id),
+            speech
         )
 
-        # Save transcript
-        transcript = CallTranscript(
-            session_id=UUID(session_id),
-            timestamp_ms=0,
-            speaker=Speaker.CALLER,
-            text=llm_response["response_text"],
-            emotional_state=llm_response["emotional_state"],
-            confidence_score=llm_response.get("confidence", 0.9)
-        )
-        db.add(transcript)
-        await db.commit()
-        await db.refresh(transcript)
+        # Save transcript and entities in one short transaction
+        async with AsyncSessionLocal() as db:
+            [transcript] = await save_transcripts(db, [
+                transcript_row(
+                    session_id=session_uuid,
+                    timestamp_ms=0,
+                    speaker=Speaker.CALLER,
+                    text=llm_response["response_text"],
+                    emotional_state=llm_response["emotional_state"],
+                    confidence_score=llm_response.get("confidence", 0.9)
+                )
+            ])
+            [entity_ids] = await save_entities(db, [(transcript, entities)])
+            await db.commit()
 
-        # Extract entities
-        await extract_and_save_entities(llm_response["response_text"], transcript.id, session_id, db, websocket)
+        # Write entities, turn and emotional state in one APPLY_BATCH_LUA
+        # call; nothing is read back, the held context is updated in place
+        async with dialogue_manager.pipeline(session_id, context) as dm:
+            dm.add_extracted_entities(entity_pairs(entities))
+            dm.add_conversation_turn("caller", llm_response["response_text"])
+            dm.update_emotional_state(llm_response["emotional_state"])
 
-        # Update dialogue manager
-        await dialogue_manager.add_conversation_turn(
-            session_id,
-            "caller",
-            llm_response["response_text"]
-        )
-        await dialogue_manager.update_emotional_state(
-            session_id,
-            llm_response["emotional_state"]
-        )
+        await send_entity_updates(session_id, entity_ids, entities, websocket)
 
         # Send to client
-        await websocket.send_json({
+        await manager.send_message(session_id, {
             "type": "transcript_update",
             "session_id": session_id,
-            "transcript_id": str(transcript.id),
+            "transcript_id": transcript.id,
             "speaker": "caller",
             "text": llm_response["response_text"],
             "timestamp_ms": 0,
             "confidence_score": llm_response.get("confidence", 0.9)
         })
 
-        await websocket.send_json({
-            "type": "audio_chunk",
-            "session_id": session_id,
-            "audio_data": tts_response["audio_data"],
-            "timestamp_ms": 0,
-            "duration_ms": tts_response["duration_ms"]
-        })
-
-        await websocket.send_json({
+        await manager.send_message(session_id, {
             "type": "emotional_state",
             "session_id": session_id,
             "state": llm_response["emotional_state"],
@@ -226,25 +367,139 @@ async def send_initial_greeting(
         })
 
     except Exception as e:
-        logger.error(f"Failed to send initial greeting: {e}")
+        logger.error("Failed to send initial greeting: %s", e)
         raise
 
 
+def exceeds_message_limit(data: Union[str, bytes]) -> bool:
+    """
+    Whether a WebSocket message is over ws_max_message_bytes.
+
+    Text frames arrive decoded and a character takes one to four bytes in
+    UTF-8, so the string is only re-encoded to count its bytes when its
+    length alone can't settle the check.
+    """
+    limit = settings.ws_max_message_bytes
+    if isinstance(data, bytes) or len(data) > limit:
+        return len(data) > limit
+    if len(data) * 4 <= limit:
+        return False
+    return len(data.encode("utf-8")) > limit
+
+
+async def speak_caller_response(
+    websocket: WebSocket,
+    session_id: str,
+    timestamp_ms: int,
+    **generate_kwargs: Any
+) -> Tuple[Dict[str, Any], asyncio.Task]:
+    """
+    Generate the AI caller response and stream its speech to the client.
+
+    Each sentence is sent to TTS as soon as the LLM has streamed it, and its
+    audio goes out once it and every earlier sentence are synthesized, so
+    the caller starts speaking before the completion finishes. Clients that
+    connect with ``?audio_format=binary`` get each sentence as a binary
+    AUDIO_FRAME_HEADER frame instead of a base64 audio_chunk message.
+
+    Returns:
+        Tuple of (LLM response, task that finishes once all audio is sent)
+    """
+    syntheses: asyncio.Queue = asyncio.Queue()
+    binary = websocket.query_params.get("audio_format") == "binary"
+
+    def on_sentence(sentence: str, emotional_state: str) -> None:
+        syntheses.put_nowait(asyncio.create_task(tts_service.synthesize_speech(
+            text=sentence,
+            emotional_state=emotional_state
+        )))
+
+    async def send_speech() -> None:
+        offset_ms = 0
+        seq = 0
+        try:
+            while (synthesis := await syntheses.get()) is not None:
+                tts_response = await synthesis
+                if binary:
+                    await manager.send_bytes(session_id, audio_service.pack_audio_frame(
+                        tts_response["audio_bytes"], timestamp_ms + offset_ms, seq
+                    ))
+                else:
+                    # Encoded per sentence as it goes out; binary sockets
+                    # never pay for base64 at all
+                    await manager.send_message(session_id, {
+                        "type": "audio_chunk",
+                        "session_id": session_id,
+                        "audio_data": audio_service.encode_audio(tts_response["audio_bytes"]),
+                        "timestamp_ms": timestamp_ms + offset_ms,
+                        "duration_ms": tts_response["duration_ms"]
+                    })
+                offset_ms += tts_response["duration_ms"]
+                seq += 1
+        except BaseException:
+            # Don't leave later sentences synthesizing for nobody
+            while not syntheses.empty():
+                if (synthesis := syntheses.get_nowait()) is not None:
+                    synthesis.cancel()
+            raise
+
+    speech = asyncio.create_task(send_speech())
+    try:
+        llm_response = await llm_service.generate_caller_response(
+            **generate_kwargs,
+            on_sentence=on_sentence
+        )
+    except BaseException:
+        speech.cancel()
+        raise
+    finally:
+        syntheses.put_nowait(None)
+
+    return llm_response, speech
+
+
+async def handle_audio_frame(
+    frame: bytes,
+    session_id: str,
+    websocket: WebSocket
+):
+    """
+    Handle a binary audio frame from the operator.
+
+    The frame is an AUDIO_FRAME_HEADER preamble followed by raw audio, which
+    skips the base64 inflation and decode of JSON audio_chunk messages.
+    """
+    try:
+        timestamp_ms, seq, audio = audio_service.unpack_audio_frame(frame)
+    except ValueError as e:
+        await manager.send_message(session_id, {
+            "type": "error",
+            "error_code": "INVALID_AUDIO",
+            "error_message": str(e)
+        })
+        return
+
+    # In a real implementation, you would:
+    # 1. Use speech-to-text to transcribe operator audio
+    # 2. For now, we'll assume transcript is sent separately
+
+    logger.debug("Received audio frame %s (%s bytes) for session %s", seq, len(audio), session_id)
+
+
 async def handle_audio_chunk(
-    message: Dict[str, Any],
+    message: schemas.WSClientAudioChunk,
     session_id: str,
     context: Dict[str, Any],
-    websocket: WebSocket,
-    db: AsyncSession
+    websocket: WebSocket
 ):
-    """Handle incoming audio chunk from operator"""
+    """Handle incoming base64 audio chunk from operator (legacy JSON path)"""
     try:
-        audio_data = message.get("audio_data")
-        timestamp_ms = message.get("timestamp_ms", 0)
+        audio_data = message.audio_data
+        timestamp_ms = message.timestamp_ms
 
         # Validate audio chunk
         if not audio_service.validate_audio_chunk(audio_data):
-            await websocket.send_json({
+            await manager.send_message(session_id, {
                 "type": "error",
                 "error_code": "INVALID_AUDIO",
                 "error_message": "Invalid audio chunk"
@@ -255,116 +510,124 @@ async def handle_audio_chunk(
         # 1. Use speech-to-text to transcribe operator audio
         # 2. For now, we'll assume transcript is sent separately
 
-        logger.debug(f"Received audio chunk for session {session_id}")
+        logger.debug("Received audio chunk for session %s", session_id)
 
     except Exception as e:
-        logger.error(f"Error handling audio chunk: {e}")
+        logger.error("Error handling audio chunk: %s", e)
 
 
 async def handle_transcript_message(
-    message: Dict[str, Any],
+    message: schemas.WSClientTranscript,
     session_id: str,
+    session_uuid: UUID,
     context: Dict[str, Any],
-    websocket: WebSocket,
-    db: AsyncSession
+    websocket: WebSocket
 ):
     """Handle transcript message (operator speech)"""
+    # Turns without a client timestamp can't be told apart from a retry, so
+    # only timestamped turns are deduplicated
+    claimed = False
+    committed = False
     try:
-        text = message.get("text", "")
-        timestamp_ms = message.get("timestamp_ms", 0)
+        text = message.text
+        timestamp_ms = message.timestamp_ms or 0
 
         if not text:
             return
 
-        # Save operator transcript
-        transcript = CallTranscript(
-            session_id=UUID(session_id),
-            timestamp_ms=timestamp_ms,
-            speaker=Speaker.OPERATOR,
-            text=text,
-            confidence_score=0.95
-        )
-        db.add(transcript)
-        await db.commit()
-        await db.refresh(transcript)
-
-        # Extract entities from operator speech
-        await extract_and_save_entities(text, transcript.id, session_id, db, websocket)
-
-        # Update conversation history
-        await dialogue_manager.add_conversation_turn(session_id, "operator", text)
-
-        # Generate AI caller response
-        conversation_history = await dialogue_manager.get_conversation_history(session_id, max_turns=10)
-        caller_profile = context.get("caller_profile", {})
-        scenario_context = context.get("scenario", {}).get("scenario_script", {})
-        current_emotional_state = context.get("current_emotional_state", "calm")
-
-        llm_response = await llm_service.generate_caller_response(
-            conversation_history=conversation_history,
-            caller_profile=caller_profile,
-            scenario_context=scenario_context,
-            current_emotional_state=current_emotional_state
-        )
-
-        # Generate speech for caller response
-        tts_response = await tts_service.synthesize_speech(
-            text=llm_response["response_text"],
-            emotional_state=llm_response["emotional_state"]
-        )
+        # A redelivered turn is already being answered or was stored
+        if message.timestamp_ms is not None:
+            if not await dialogue_manager.claim_operator_turn(session_id, message.timestamp_ms):
+                logger.info("Skipping duplicate operator turn at %sms for session %s", timestamp_ms, session_id)
+                await manager.send_message(session_id, {
+                    "type": "turn_ignored",
+                    "session_id": session_id,
+                    "reason": "duplicate",
+                    "timestamp_ms": timestamp_ms
+                })
+                return
+            claimed = True
+
+        # The operator turn is only written to Redis with the caller's reply
+        # once both are stored; if anything fails first the batch is
+        # dropped, so a retried turn doesn't enter the history twice
+        async with dialogue_manager.pipeline(session_id, context) as dm:
+            dm.add_conversation_turn("operator", text)
+            conversation_history = await dm.get_conversation_history(max_turns=10)
+
+            # Generate AI caller response
+            caller_profile = context.get("caller_profile", {})
+            scenario_context = context.get("scenario", {}).get("scenario_script", {})
+            current_emotional_state = context.get("current_emotional_state", "calm")
+
+            # Extract entities from operator speech while the LLM responds
+            (llm_response, speech), operator_entities = await asyncio.gather(
+                speak_caller_response(
+                    websocket,
+                    session_id,
+                    timestamp_ms + 1000,
+                    conversation_history=conversation_history,
+                    caller_profile=caller_profile,
+                    scenario_context=scenario_context,
+                    current_emotional_state=current_emotional_state
+                ),
+                extract_entities(text, session_id)
+            )
 
-        # Save caller transcript
-        caller_transcript = CallTranscript(
-            session_id=UUID(session_id),
-            timestamp_ms=timestamp_ms + 1000,  # Add small delay
-            speaker=Speaker.CALLER,
-            text=llm_response["response_text"],
-            emotional_state=llm_response["emotional_state"],
-            confidence_score=llm_response.get("confidence", 0.9)
-        )
-        db.add(caller_transcript)
-        await db.commit()
-        await db.refresh(caller_transcript)
-
-        # Extract entities from caller response
-        await extract_and_save_entities(
-            llm_response["response_text"],
-            caller_transcript.id,
-            session_id,
-            db,
-            websocket
-        )
+            # Extract caller entities while the last sentences are synthesized
+            caller_entities, _ = await asyncio.gather(
+                extract_entities(llm_response["response_text"], session_id),
+                speech
+            )
 
-        # Update dialogue manager
-        await dialogue_manager.add_conversation_turn(
-            session_id,
-            "caller",
-            llm_response["response_text"]
-        )
-        await dialogue_manager.update_emotional_state(
-            session_id,
-            llm_response["emotional_state"]
-        )
+            # Persist both transcripts and then all their entities: two
+            # batched statements in one short transaction
+            async with AsyncSessionLocal() as db:
+                transcript, caller_transcript = await save_transcripts(db, [
+                    transcript_row(
+                        session_id=session_uuid,
+                        timestamp_ms=timestamp_ms,
+                        speaker=Speaker.OPERATOR,
+                        text=text,
+                        confidence_score=0.95
+                    ),
+                    transcript_row(
+                        session_id=session_uuid,
+                        timestamp_ms=timestamp_ms + 1000,  # Add small delay
+                        speaker=Speaker.CALLER,
+                        text=llm_response["response_text"],
+                        emotional_state=llm_response["emotional_state"],
+                        confidence_score=llm_response.get("confidence", 0.9)
+                    ),
+                ])
+                operator_entity_ids, caller_entity_ids = await save_entities(db, [
+                    (transcript, operator_entities),
+                    (caller_transcript, caller_entities),
+                ])
+
+                await db.commit()
+                committed = True
+
+            # Written with the operator turn in one script call on exit
+            dm.add_extracted_entities(entity_pairs(operator_entities) + entity_pairs(caller_entities))
+            dm.add_conversation_turn("caller", llm_response["response_text"])
+            dm.update_emotional_state(llm_response["emotional_state"])
+
+        await send_entity_updates(session_id, operator_entity_ids, operator_entities, websocket)
+        await send_entity_updates(session_id, caller_entity_ids, caller_entities, websocket)
 
         # Send responses to client
-        await websocket.send_json({
+        await manager.send_message(session_id, {
             "type": "transcript_update",
             "session_id": session_id,
-            "transcript_id": str(caller_transcript.id),
+            "transcript_id": caller_transcript.id,
             "speaker": "caller",
             "text": llm_response["response_text"],
             "timestamp_ms": timestamp_ms + 1000,
             "confidence_score": llm_response.get("confidence", 0.9)
         })
 
-        await websocket.send_json({
-            "type": "audio_chunk",
-            "session_id": session_id,
-            "audio_data": tts_response["audio_data"],
-            "timestamp_ms": timestamp_ms + 1000
-        })
-
-        await websocket.send_json({
+        await manager.send_message(session_id, {
             "type": "emotional_state",
             "session_id": session_id,
             "state": llm_response["emotional_state"],
@@ -373,8 +636,11 @@ async def handle_transcript_message(
         })
 
     except Exception as e:
-        logger.error(f"Error handling transcript message: {e}")
-        await websocket.send_json({
+        logger.error("Error handling transcript message: %s", e)
+        # Nothing was stored, so let the client's retry of this turn through
+        if claimed and not committed:
+            await dialogue_manager.release_operator_turn(session_id, message.timestamp_ms)
+        await manager.send_message(session_id, {
             "type": "error",
             "error_code": "PROCESSING_ERROR",
             "error_message": str(e)
@@ -382,35 +648,34 @@ async def handle_transcript_message(
 
 
 async def handle_control_message(
-    message: Dict[str, Any],
+    message: schemas.WSClientControl,
     session_id: str,
-    websocket: WebSocket,
-    db: AsyncSession
+    session_uuid: UUID,
+    websocket: WebSocket
 ):
     """Handle control messages (mute, hold, terminate)"""
     try:
-        action = message.get("action")
-        logger.info(f"Control action '{action}' for session {session_id}")
+        action = message.action
+        logger.info("Control action '%s' for session %s", action, session_id)
 
         if action == "terminate":
-            # Update session status
-            from sqlalchemy import select, update
-            from app.models.database import CallSessionStatus
-            from datetime import datetime
-
-            stmt = update(CallSession).where(
-                CallSession.id == UUID(session_id)
-            ).values(
-                status=CallSessionStatus.TERMINATED,
-                ended_at=datetime.utcnow()
-            )
-            await db.execute(stmt)
-            await db.commit()
+            # Update session status; only an active session can be terminated
+            async with AsyncSessionLocal() as db:
+                stmt = update(CallSession).where(
+                    CallSession.id == session_uuid,
+                    CallSession.status == CallSessionStatus.ACTIVE
+                ).values(
+                    status=CallSessionStatus.TERMINATED,
+                    ended_at=func.now(),
+                    duration_ms=elapsed_ms(CallSession.started_at)
+                )
+                await db.execute(stmt)
+                await db.commit()
 
             # Clean up session context
             await dialogue_manager.delete_session_context(session_id)
 
-            await websocket.send_json({
+            await manager.send_message(session_id, {
                 "type": "control_ack",
                 "action": action,
                 "status": "success"
@@ -421,63 +686,111 @@ async def handle_control_message(
 
         else:
             # Acknowledge other control actions
-            await websocket.send_json({
+            await manager.send_message(session_id, {
                 "type": "control_ack",
                 "action": action,
                 "status": "success"
             })
 
     except Exception as e:
-        logger.error(f"Error handling control message: {e}")
+        logger.error("Error handling control message: %s", e)
 
 
-async def extract_and_save_entities(
-    text: str,
-    transcript_id: UUID,
-    session_id: str,
-    db: AsyncSession,
-    websocket: WebSocket
-):
-    """Extract entities from text and save to database"""
+def transcript_row(confidence_score: float, **values: Any) -> Dict[str, Any]:
+    """Insert parameters for one transcript entry"""
+    return {"confidence_bp": to_confidence_bp(confidence_score), **values}
+
+
+async def save_transcripts(db: AsyncSession, rows: List[Dict[str, Any]]) -> List[Row]:
+    """
+    Insert transcript entries with a single batched INSERT ... RETURNING.
+
+    The generated id and created_at come back without a refresh; the caller
+    owns the transaction and commits.
+
+    Returns:
+        Rows with ``id`` and ``created_at``, in the same order as ``rows``
+    """
+    result = await db.execute(INSERT_TRANSCRIPTS, rows)
+    return list(result.all())
+
+
+async def extract_entities(text: str, session_id: str) -> List[Dict[str, Any]]:
+    """Extract entities from text without touching the database"""
     try:
-        # Extract entities
         extraction_result = await nlp_service.extract_entities(
             text=text,
             session_id=session_id,
             timestamp_ms=0
         )
+        return extraction_result.get("entities", [])
 
-        # Save entities to database
-        for entity_data in extraction_result.get("entities", []):
-            entity = ExtractedEntity(
-                transcript_id=transcript_id,
-                entity_type=entity_data["entity_type"],
-                entity_value=entity_data["entity_value"],
-                confidence_score=entity_data["confidence_score"],
-                start_char=entity_data["start_char"],
-                end_char=entity_data["end_char"],
-                metadata=entity_data.get("metadata", {})
-            )
-            db.add(entity)
+    except Exception as e:
+        logger.error("Error extracting entities: %s", e)
+        return []
 
-            # Update dialogue manager
-            await dialogue_manager.add_extracted_entity(
-                session_id,
-                entity_data["entity_type"],
-                entity_data["entity_value"]
-            )
 
-            # Send entity update to client
-            await websocket.send_json({
+async def save_entities(
+    db: AsyncSession,
+    batches: List[Tuple[Row, List[Dict[str, Any]]]]
+) -> List[List[int]]:
+    """
+    Stage extracted entities for several transcripts with a single bulk INSERT.
+
+    Does not commit; the caller commits once for the whole turn.
+
+    Args:
+        batches: (transcript key row, entities) pairs
+
+    Returns:
+        Generated entity ids per batch, in the same order as its entities
+    """
+    rows = [
+        {
+            "transcript_id": transcript.id,
+            "transcript_created_at": transcript.created_at,
+            "entity_type": entity_data["entity_type"],
+            "entity_value": entity_data["entity_value"],
+            "confidence_bp": to_confidence_bp(entity_data["confidence_score"]),
+            "start_char": entity_data["start_char"],
+            "end_char": entity_data["end_char"],
+            "entity_metadata": entity_data.get("metadata", {})
+        }
+        for transcript, entities in batches
+        for entity_data in entities
+    ]
+    if not rows:
+        return [[] for _ in batches]
+
+    result = await db.execute(INSERT_ENTITIES, rows)
+    entity_ids = iter(result.scalars().all())
+    return [[next(entity_ids) for _ in entities] for _, entities in batches]
+
+
+def entity_pairs(entities: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """(entity_type, entity_value) pairs for the dialogue context"""
+    return [(entity_data["entity_type"], entity_data["entity_value"]) for entity_data in entities]
+
+
+async def send_entity_updates(
+    session_id: str,
+    entity_ids: List[int],
+    entities: List[Dict[str, Any]],
+    websocket: WebSocket
+):
+    """Send saved entities to the client, in extraction order"""
+    try:
+        # One socket's frames go out one at a time regardless, so
+        # concurrent sends would only make the order depend on scheduling
+        for entity_id, entity_data in zip(entity_ids, entities):
+            await manager.send_message(session_id, {
                 "type": "entity_update",
                 "session_id": session_id,
-                "entity_id": str(entity.id),
+                "entity_id": entity_id,
                 "entity_type": entity_data["entity_type"],
                 "entity_value": entity_data["entity_value"],
                 "confidence_score": entity_data["confidence_score"]
             })
 
-        await db.commit()
-
     except Exception as e:
-        logger.error(f"Error extracting and saving entities: {e}")
+        logger.error("Error sending entity updates: %s", e)
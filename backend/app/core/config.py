@@ -1,6 +1,8 @@
 """Application configuration management using Pydantic Settings"""
 
-from typing import List, Optional
+import logging
+from functools import cached_property, lru_cache
+from typing import Any, FrozenSet, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -22,6 +24,13 @@ class Settings(BaseSettings):
     db_host: str = Field(default="postgresql-service", alias="DB_HOST")
     db_port: int = Field(default=5432, alias="DB_PORT")
     db_name: str = Field(default="training_db", alias="DB_NAME")
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    # Prepared statements cached per connection; set 0 behind a pgbouncer
+    # running in transaction pooling mode
+    db_statement_cache_size: int = Field(default=1024, alias="DB_STATEMENT_CACHE_SIZE")
+    sql_echo: bool = Field(default=False, alias="SQL_ECHO")
 
     # Redis Configuration
     redis_url: str = Field(..., alias="REDIS_URL")
@@ -29,6 +38,8 @@ class Settings(BaseSettings):
     redis_port: int = Field(default=6379, alias="REDIS_PORT")
     redis_password: Optional[str] = Field(default="", alias="REDIS_PASSWORD")
     redis_db: int = Field(default=0, alias="REDIS_DB")
+    # Connection pool size of the dialogue manager's client
+    redis_max_connections: int = Field(default=64, alias="REDIS_MAX_CONNECTIONS")
 
     # S3/MinIO Configuration
     s3_endpoint: str = Field(..., alias="S3_ENDPOINT")
@@ -43,6 +54,8 @@ class Settings(BaseSettings):
     tts_model: str = Field(default="tts_models/en/ljspeech/tacotron2-DDC", alias="TTS_MODEL")
     tts_vocoder: str = Field(default="vocoder_models/en/ljspeech/hifigan_v2", alias="TTS_VOCODER")
     tts_sample_rate: int = Field(default=22050, alias="TTS_SAMPLE_RATE")
+    # Synthesized clips kept in memory per worker
+    tts_cache_size: int = Field(default=256, alias="TTS_CACHE_SIZE")
 
     # Application Configuration
     backend_host: str = Field(default="0.0.0.0", alias="BACKEND_HOST")
@@ -61,20 +74,35 @@ class Settings(BaseSettings):
 
     # Session Configuration
     session_ttl: int = Field(default=3600, alias="SESSION_TTL")
+    # Conversation turns kept per session; older turns are trimmed in Redis
+    max_history_turns: int = Field(default=200, alias="MAX_HISTORY_TURNS")
+    scenario_cache_ttl: int = Field(default=300, alias="SCENARIO_CACHE_TTL")
+    scenario_list_cache_ttl: int = Field(default=60, alias="SCENARIO_LIST_CACHE_TTL")
+    ws_max_message_bytes: int = Field(default=768 * 1024, alias="WS_MAX_MESSAGE_BYTES")
     max_concurrent_calls: int = Field(default=50, alias="MAX_CONCURRENT_CALLS")
     rate_limit_llm_per_minute: int = Field(default=10, alias="RATE_LIMIT_LLM_PER_MINUTE")
 
     # CORS Configuration
     cors_origins: str = Field(default="http://localhost:3000,http://localhost:8000", alias="CORS_ORIGINS")
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string"""
+        """Parse CORS origins from comma-separated string (once per instance)"""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    @property
+    @cached_property
+    def cors_origins_set(self) -> FrozenSet[str]:
+        """CORS origins as a frozenset for O(1) membership checks"""
+        return frozenset(self.cors_origins_list)
+
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric logging level for LOG_LEVEL"""
+        return logging.getLevelNamesMapping()[self.log_level.upper()]
+
+    @cached_property
     def async_database_url(self) -> str:
-        """Get async database URL for SQLAlchemy"""
+        """Get async database URL for SQLAlchemy (once per instance)"""
         return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
 
     model_config = SettingsConfigDict(
@@ -85,5 +113,15 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings on first use and reuse them for the process"""
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps ``from app.core.config import settings`` working while deferring
+    # .env parsing and validation until the settings are first needed
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
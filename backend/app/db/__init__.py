@@ -7,7 +7,9 @@ from app.db.base import (
     drop_db,
     engine,
     get_db,
+    get_db_readonly,
     init_db,
+    ping_db,
 )
 
 __all__ = [
@@ -16,5 +18,7 @@ __all__ = [
     "drop_db",
     "engine",
     "get_db",
+    "get_db_readonly",
     "init_db",
+    "ping_db",
 ]
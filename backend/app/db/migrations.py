@@ -0,0 +1,95 @@
+"""
+Helpers for writing Alembic migrations against large tables.
+
+Adding a column to a populated table must not rewrite it. Since PostgreSQL 11,
+``ALTER TABLE t ADD COLUMN c type DEFAULT const NOT NULL`` is a catalog-only
+change as long as the default is not volatile: the constant is stored once and
+returned for existing rows. Use ``safe_add_column`` for that case.
+
+Never use volatile defaults (``now()``, ``gen_random_uuid()``,
+``uuid_generate_v7()``, ``nextval()``...) in ``ADD COLUMN`` on tables with more
+than ~100k rows. Instead:
+
+1. add the column as nullable without a default,
+2. backfill it in batches (``UPDATE ... WHERE id BETWEEN ...``), committing
+   between batches,
+3. ``ALTER TABLE t ALTER COLUMN c SET DEFAULT ...`` for new rows, then
+   ``SET NOT NULL`` once every row is filled.
+
+These helpers live here rather than in ``alembic/versions/`` because Alembic
+loads every module in that directory as a revision.
+"""
+import re
+from typing import Optional, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Functions whose value differs per row or per call. A default built from any
+# of them would be evaluated for every existing row and force a table rewrite.
+VOLATILE_DEFAULT_PATTERN = re.compile(
+    r"\b(now|clock_timestamp|statement_timestamp|transaction_timestamp|timeofday"
+    r"|current_timestamp|current_date|current_time|localtimestamp|localtime"
+    r"|random|gen_random_uuid|uuid_generate_v\w*|nextval)\b",
+    re.IGNORECASE,
+)
+
+ConstantDefault = Union[bool, int, float, str, sa.TextClause]
+
+
+def _render_default(default: ConstantDefault) -> Union[str, sa.TextClause]:
+    """
+    Convert a constant default to a ``server_default`` value.
+
+    Raises:
+        ValueError: If the default is not a constant expression
+    """
+    if isinstance(default, bool):
+        return sa.text("true" if default else "false")
+    if isinstance(default, (int, float)):
+        return sa.text(repr(default))
+    if isinstance(default, str):
+        # Plain strings are rendered as quoted literals by SQLAlchemy
+        return default
+    if isinstance(default, sa.TextClause):
+        if VOLATILE_DEFAULT_PATTERN.search(default.text):
+            raise ValueError(
+                f"Default {default.text!r} is volatile; add the column as nullable, "
+                "backfill in batches, then SET DEFAULT and SET NOT NULL"
+            )
+        return default
+    raise ValueError(f"Unsupported default for safe_add_column: {default!r}")
+
+
+def safe_add_column(
+    table_name: str,
+    column_name: str,
+    type_: sa.types.TypeEngine,
+    default: ConstantDefault,
+    comment: Optional[str] = None,
+) -> None:
+    """
+    Add a NOT NULL column with a constant default without rewriting the table.
+
+    Emits ``ALTER TABLE t ADD COLUMN c type DEFAULT const NOT NULL``.
+
+    Args:
+        table_name: Table to alter
+        column_name: Name of the new column
+        type_: SQLAlchemy column type
+        default: Python constant or ``sa.text()`` expression without volatile functions
+        comment: Optional column comment
+
+    Raises:
+        ValueError: If the default is volatile or not a constant
+    """
+    op.add_column(
+        table_name,
+        sa.Column(
+            column_name,
+            type_,
+            server_default=_render_default(default),
+            nullable=False,
+            comment=comment,
+        ),
+    )
@@ -10,12 +10,13 @@ Provides helper functions for database operations including:
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import AsyncSessionLocal, engine
+from app.db.base import AsyncSessionLocal, engine, ping_db
 from app.models.database import (
     Base,
     CallSession,
@@ -34,14 +35,10 @@ async def check_database_connection() -> bool:
     Returns:
         bool: True if connection is successful, False otherwise
     """
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+    if await ping_db():
         logger.info("Database connection successful")
         return True
-    except Exception as e:
-        logger.error(f"Database connection failed: {e}")
-        return False
+    return False
 
 
 async def create_tables() -> None:
@@ -55,7 +52,7 @@ async def create_tables() -> None:
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully")
     except Exception as e:
-        logger.error(f"Failed to create tables: {e}")
+        logger.error("Failed to create tables: %s", e)
         raise
 
 
@@ -70,210 +67,224 @@ async def drop_tables() -> None:
             await conn.run_sync(Base.metadata.drop_all)
         logger.info("Database tables dropped successfully")
     except Exception as e:
-        logger.error(f"Failed to drop tables: {e}")
+        logger.error("Failed to drop tables: %s", e)
         raise
 
 
-async def seed_training_scenarios(session: Optional[AsyncSession] = None) -> None:
+# Rows inserted by seed_training_scenarios. Built once at import and never
+# mutated; the insert only reads them.
+_SEED_SCENARIOS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "Domestic Violence Call",
+        "description": "A frightened caller reports ongoing domestic violence situation with potential weapon involved.",
+        "difficulty_level": DifficultyLevel.MEDIUM,
+        "caller_profile": {
+            "emotional_state": "fearful",
+            "background": "Female, mid-30s, lives with abusive partner",
+            "personality": "Hesitant to provide details, afraid of being overheard",
+            "communication_style": "Whispering, speaking in fragments, easily startled"
+        },
+        "scenario_script": {
+            "initial_state": {
+                "caller_location": "Locked in bathroom",
+                "threat_level": "High - partner is intoxicated and has threatened violence",
+                "time_of_day": "Late evening",
+                "background_noise": "Occasional shouting, door banging"
+            },
+            "key_entities": [
+                {"type": "LOCATION", "value": "123 Oak Street, Apartment 4B"},
+                {"type": "PERSON", "value": "John (partner)"},
+                {"type": "WEAPON", "value": "Baseball bat"},
+                {"type": "INJURY", "value": "Bruising on arms from earlier"}
+            ],
+            "expected_flow": [
+                "Caller whispers for help",
+                "Operator should speak calmly and quietly",
+                "Extract location information carefully",
+                "Assess immediate danger",
+                "Keep caller on line until help arrives",
+                "Provide safety instructions (stay locked in safe room)"
+            ]
+        },
+        "is_active": True
+    },
+    {
+        "name": "Medical Emergency - Heart Attack",
+        "description": "Panicked caller reporting family member having chest pain and difficulty breathing.",
+        "difficulty_level": DifficultyLevel.HARD,
+        "caller_profile": {
+            "emotional_state": "panicked",
+            "background": "Adult son calling about elderly father",
+            "personality": "Frantic, talking rapidly, struggling to follow instructions",
+            "communication_style": "Speaking loudly and quickly, interrupting with updates"
+        },
+        "scenario_script": {
+            "initial_state": {
+                "caller_location": "Home residence",
+                "threat_level": "Critical - potential cardiac arrest",
+                "time_of_day": "Morning",
+                "background_noise": "Groaning, labored breathing"
+            },
+            "key_entities": [
+                {"type": "LOCATION", "value": "456 Maple Drive"},
+                {"type": "PERSON", "value": "Father, age 67"},
+                {"type": "INJURY", "value": "Severe chest pain, shortness of breath, sweating"},
+                {"type": "TIME_REFERENCE", "value": "Symptoms started 10 minutes ago"}
+            ],
+            "expected_flow": [
+                "Caller frantically describes symptoms",
+                "Operator must remain calm and assertive",
+                "Get exact location and callback number",
+                "Assess consciousness and breathing",
+                "Provide CPR instructions if needed",
+                "Guide caller to give aspirin if available",
+                "Keep caller calm and prepared for paramedics"
+            ]
+        },
+        "is_active": True
+    },
+    {
+        "name": "Car Accident - Minor Injuries",
+        "description": "Witness reporting a two-car collision with minor injuries at an intersection.",
+        "difficulty_level": DifficultyLevel.EASY,
+        "caller_profile": {
+            "emotional_state": "calm",
+            "background": "Bystander who witnessed the accident",
+            "personality": "Helpful, observant, able to provide clear details",
+            "communication_style": "Speaking clearly, willing to stay and help"
+        },
+        "scenario_script": {
+            "initial_state": {
+                "caller_location": "At the scene as witness",
+                "threat_level": "Low - minor injuries, no fire",
+                "time_of_day": "Afternoon",
+                "background_noise": "Traffic sounds, people talking"
+            },
+            "key_entities": [
+                {"type": "LOCATION", "value": "Intersection of Main St and 5th Ave"},
+                {"type": "VEHICLE", "value": "Red sedan and blue pickup truck"},
+                {"type": "INJURY", "value": "One driver has cut on forehead"},
+                {"type": "PERSON", "value": "Two drivers involved"}
+            ],
+            "expected_flow": [
+                "Caller calmly reports accident",
+                "Operator gets location and number of vehicles",
+                "Assess injuries and hazards",
+                "Determine if anyone is trapped",
+                "Ask about fuel leaks or fire",
+                "Keep caller to direct emergency vehicles if needed"
+            ]
+        },
+        "is_active": True
+    },
+    {
+        "name": "Active Shooter Report",
+        "description": "Multiple callers reporting gunshots and active shooter at a school.",
+        "difficulty_level": DifficultyLevel.HARD,
+        "caller_profile": {
+            "emotional_state": "hysterical",
+            "background": "Teacher hiding in classroom with students",
+            "personality": "Terrified, trying to stay quiet while reporting",
+            "communication_style": "Whispered, fragmented sentences, crying"
+        },
+        "scenario_script": {
+            "initial_state": {
+                "caller_location": "Classroom, barricaded inside",
+                "threat_level": "Critical - active shooter situation",
+                "time_of_day": "School hours",
+                "background_noise": "Distant gunshots, screaming, running footsteps"
+            },
+            "key_entities": [
+                {"type": "LOCATION", "value": "Roosevelt High School, Building C, Room 204"},
+                {"type": "WEAPON", "value": "Gunshots heard"},
+                {"type": "PERSON", "value": "Unknown shooter, approximately 15 students in room"},
+                {"type": "INJURY", "value": "Unknown casualties"}
+            ],
+            "expected_flow": [
+                "Caller reports shots fired",
+                "Operator must remain extremely calm and authoritative",
+                "Get precise location within building",
+                "Determine if caller is safe/hidden",
+                "Instruct to stay quiet and hidden",
+                "Get description of shooter if available",
+                "Keep line open but silent if necessary",
+                "Coordinate with multiple agencies"
+            ]
+        },
+        "is_active": True
+    },
+    {
+        "name": "Burglary in Progress",
+        "description": "Homeowner reports hearing someone breaking into their house while they hide upstairs.",
+        "difficulty_level": DifficultyLevel.MEDIUM,
+        "caller_profile": {
+            "emotional_state": "anxious",
+            "background": "Homeowner alone, awakened by breaking glass",
+            "personality": "Scared but trying to stay composed",
+            "communication_style": "Whispering urgently, asking for immediate help"
+        },
+        "scenario_script": {
+            "initial_state": {
+                "caller_location": "Upstairs bedroom, door locked",
+                "threat_level": "High - intruder in home",
+                "time_of_day": "Late night, 2 AM",
+                "background_noise": "Glass breaking, footsteps downstairs, items being moved"
+            },
+            "key_entities": [
+                {"type": "LOCATION", "value": "789 Pine Street"},
+                {"type": "PERSON", "value": "Unknown number of intruders"},
+                {"type": "TIME_REFERENCE", "value": "Breaking in now"},
+                {"type": "WEAPON", "value": "Unknown if armed"}
+            ],
+            "expected_flow": [
+                "Caller whispers about break-in",
+                "Operator speaks softly and calmly",
+                "Get address and confirm caller is safe",
+                "Determine caller's exact location in house",
+                "Advise to stay quiet and hidden",
+                "Ask about weapons in home (for officer safety)",
+                "Get description of sounds/movements",
+                "Keep caller on line until police arrive",
+                "Advise when officers are on scene"
+            ]
+        },
+        "is_active": True
+    }
+)
+
+
+async def seed_training_scenarios(session: Optional[AsyncSession] = None) -> List[UUID]:
     """
     Seed the database with sample training scenarios.
 
     Args:
         session: Optional database session. If None, creates a new session.
+
+    Returns:
+        List[UUID]: IDs of the inserted scenarios, in seed order
     """
     should_close = session is None
     if session is None:
         session = AsyncSessionLocal()
 
     try:
-        scenarios = [
-            TrainingScenario(
-                name="Domestic Violence Call",
-                description="A frightened caller reports ongoing domestic violence situation with potential weapon involved.",
-                difficulty_level=DifficultyLevel.MEDIUM,
-                caller_profile={
-                    "emotional_state": "fearful",
-                    "background": "Female, mid-30s, lives with abusive partner",
-                    "personality": "Hesitant to provide details, afraid of being overheard",
-                    "communication_style": "Whispering, speaking in fragments, easily startled"
-                },
-                scenario_script={
-                    "initial_state": {
-                        "caller_location": "Locked in bathroom",
-                        "threat_level": "High - partner is intoxicated and has threatened violence",
-                        "time_of_day": "Late evening",
-                        "background_noise": "Occasional shouting, door banging"
-                    },
-                    "key_entities": [
-                        {"type": "LOCATION", "value": "123 Oak Street, Apartment 4B"},
-                        {"type": "PERSON", "value": "John (partner)"},
-                        {"type": "WEAPON", "value": "Baseball bat"},
-                        {"type": "INJURY", "value": "Bruising on arms from earlier"}
-                    ],
-                    "expected_flow": [
-                        "Caller whispers for help",
-                        "Operator should speak calmly and quietly",
-                        "Extract location information carefully",
-                        "Assess immediate danger",
-                        "Keep caller on line until help arrives",
-                        "Provide safety instructions (stay locked in safe room)"
-                    ]
-                },
-                is_active=True
-            ),
-            TrainingScenario(
-                name="Medical Emergency - Heart Attack",
-                description="Panicked caller reporting family member having chest pain and difficulty breathing.",
-                difficulty_level=DifficultyLevel.HARD,
-                caller_profile={
-                    "emotional_state": "panicked",
-                    "background": "Adult son calling about elderly father",
-                    "personality": "Frantic, talking rapidly, struggling to follow instructions",
-                    "communication_style": "Speaking loudly and quickly, interrupting with updates"
-                },
-                scenario_script={
-                    "initial_state": {
-                        "caller_location": "Home residence",
-                        "threat_level": "Critical - potential cardiac arrest",
-                        "time_of_day": "Morning",
-                        "background_noise": "Groaning, labored breathing"
-                    },
-                    "key_entities": [
-                        {"type": "LOCATION", "value": "456 Maple Drive"},
-                        {"type": "PERSON", "value": "Father, age 67"},
-                        {"type": "INJURY", "value": "Severe chest pain, shortness of breath, sweating"},
-                        {"type": "TIME_REFERENCE", "value": "Symptoms started 10 minutes ago"}
-                    ],
-                    "expected_flow": [
-                        "Caller frantically describes symptoms",
-                        "Operator must remain calm and assertive",
-                        "Get exact location and callback number",
-                        "Assess consciousness and breathing",
-                        "Provide CPR instructions if needed",
-                        "Guide caller to give aspirin if available",
-                        "Keep caller calm and prepared for paramedics"
-                    ]
-                },
-                is_active=True
-            ),
-            TrainingScenario(
-                name="Car Accident - Minor Injuries",
-                description="Witness reporting a two-car collision with minor injuries at an intersection.",
-                difficulty_level=DifficultyLevel.EASY,
-                caller_profile={
-                    "emotional_state": "calm",
-                    "background": "Bystander who witnessed the accident",
-                    "personality": "Helpful, observant, able to provide clear details",
-                    "communication_style": "Speaking clearly, willing to stay and help"
-                },
-                scenario_script={
-                    "initial_state": {
-                        "caller_location": "At the scene as witness",
-                        "threat_level": "Low - minor injuries, no fire",
-                        "time_of_day": "Afternoon",
-                        "background_noise": "Traffic sounds, people talking"
-                    },
-                    "key_entities": [
-                        {"type": "LOCATION", "value": "Intersection of Main St and 5th Ave"},
-                        {"type": "VEHICLE", "value": "Red sedan and blue pickup truck"},
-                        {"type": "INJURY", "value": "One driver has cut on forehead"},
-                        {"type": "PERSON", "value": "Two drivers involved"}
-                    ],
-                    "expected_flow": [
-                        "Caller calmly reports accident",
-                        "Operator gets location and number of vehicles",
-                        "Assess injuries and hazards",
-                        "Determine if anyone is trapped",
-                        "Ask about fuel leaks or fire",
-                        "Keep caller to direct emergency vehicles if needed"
-                    ]
-                },
-                is_active=True
-            ),
-            TrainingScenario(
-                name="Active Shooter Report",
-                description="Multiple callers reporting gunshots and active shooter at a school.",
-                difficulty_level=DifficultyLevel.HARD,
-                caller_profile={
-                    "emotional_state": "hysterical",
-                    "background": "Teacher hiding in classroom with students",
-                    "personality": "Terrified, trying to stay quiet while reporting",
-                    "communication_style": "Whispered, fragmented sentences, crying"
-                },
-                scenario_script={
-                    "initial_state": {
-                        "caller_location": "Classroom, barricaded inside",
-                        "threat_level": "Critical - active shooter situation",
-                        "time_of_day": "School hours",
-                        "background_noise": "Distant gunshots, screaming, running footsteps"
-                    },
-                    "key_entities": [
-                        {"type": "LOCATION", "value": "Roosevelt High School, Building C, Room 204"},
-                        {"type": "WEAPON", "value": "Gunshots heard"},
-                        {"type": "PERSON", "value": "Unknown shooter, approximately 15 students in room"},
-                        {"type": "INJURY", "value": "Unknown casualties"}
-                    ],
-                    "expected_flow": [
-                        "Caller reports shots fired",
-                        "Operator must remain extremely calm and authoritative",
-                        "Get precise location within building",
-                        "Determine if caller is safe/hidden",
-                        "Instruct to stay quiet and hidden",
-                        "Get description of shooter if available",
-                        "Keep line open but silent if necessary",
-                        "Coordinate with multiple agencies"
-                    ]
-                },
-                is_active=True
-            ),
-            TrainingScenario(
-                name="Burglary in Progress",
-                description="Homeowner reports hearing someone breaking into their house while they hide upstairs.",
-                difficulty_level=DifficultyLevel.MEDIUM,
-                caller_profile={
-                    "emotional_state": "anxious",
-                    "background": "Homeowner alone, awakened by breaking glass",
-                    "personality": "Scared but trying to stay composed",
-                    "communication_style": "Whispering urgently, asking for immediate help"
-                },
-                scenario_script={
-                    "initial_state": {
-                        "caller_location": "Upstairs bedroom, door locked",
-                        "threat_level": "High - intruder in home",
-                        "time_of_day": "Late night, 2 AM",
-                        "background_noise": "Glass breaking, footsteps downstairs, items being moved"
-                    },
-                    "key_entities": [
-                        {"type": "LOCATION", "value": "789 Pine Street"},
-                        {"type": "PERSON", "value": "Unknown number of intruders"},
-                        {"type": "TIME_REFERENCE", "value": "Breaking in now"},
-                        {"type": "WEAPON", "value": "Unknown if armed"}
-                    ],
-                    "expected_flow": [
-                        "Caller whispers about break-in",
-                        "Operator speaks softly and calmly",
-                        "Get address and confirm caller is safe",
-                        "Determine caller's exact location in house",
-                        "Advise to stay quiet and hidden",
-                        "Ask about weapons in home (for officer safety)",
-                        "Get description of sounds/movements",
-                        "Keep caller on line until police arrive",
-                        "Advise when officers are on scene"
-                    ]
-                },
-                is_active=True
-            )
-        ]
+        scenarios = list(_SEED_SCENARIOS)
 
-        for scenario in scenarios:
-            session.add(scenario)
+        # One executemany INSERT instead of per-object unit-of-work bookkeeping;
+        # generated IDs come back in the same round-trip
+        result = await session.execute(
+            insert(TrainingScenario).returning(TrainingScenario.id, sort_by_parameter_order=True),
+            scenarios
+        )
+        scenario_ids = list(result.scalars())
 
         await session.commit()
-        logger.info(f"Successfully seeded {len(scenarios)} training scenarios")
+        logger.info("Successfully seeded %s training scenarios", len(scenario_ids))
+        return scenario_ids
 
     except Exception as e:
         await session.rollback()
-        logger.error(f"Failed to seed training scenarios: {e}")
+        logger.error("Failed to seed training scenarios: %s", e)
         raise
     finally:
         if should_close:
@@ -325,7 +336,7 @@ async def get_database_info() -> dict:
                 "sessions": session_count or 0,
             }
         except Exception as e:
-            logger.error(f"Failed to get database info: {e}")
+            logger.error("Failed to get database info: %s", e)
             return {
                 "connection": "FAILED",
                 "error": str(e)
@@ -1,25 +1,56 @@
 """Main FastAPI application for 911 Operator Training Simulator"""
 
+import asyncio
 import logging
+import queue
 from contextlib import asynccontextmanager
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Awaitable, Callable, Dict, Tuple
+import httpx
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import configure_mappers
 
 from app.core.config import settings
 from app.models import schemas
 from app.api.routes import calls, websocket
-from app.db import init_db, engine
+from app.db import init_db, engine, ping_db
 from app.services.dialogue_manager import dialogue_manager
+from app.services.scenario_cache import scenario_cache
 from app.services.storage_service import storage_service
+from app.services.llm_service import llm_service
 from app.services.tts_service import tts_service
+from app.services.nlp_service import nlp_service
 
-# Configure logging
+class _RawQueueHandler(QueueHandler):
+    """
+    Enqueue log records as they are, leaving formatting to the listener.
+
+    QueueHandler.prepare formats the message (and any traceback) in the
+    thread that logs, which here is the event loop; skipping it moves that
+    work to the listener thread. Records
+    are formatted a moment later, so log arguments must not be mutated after
+    the call, which lazy ``%s`` logging of values already satisfies.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Configure logging. Handlers on the event loop only enqueue records; a
+# listener thread formats them and does the blocking stream writes
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+log_listener = QueueListener(_log_queue, _log_stream)
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=settings.log_level_int,
+    handlers=[_RawQueueHandler(_log_queue)]
 )
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 
@@ -32,18 +63,49 @@ async def lifespan(app: FastAPI):
     logger.info("Starting 911 Operator Training Simulator Backend...")
 
     try:
+        # Models are imported with app.db; resolve relationships and compile
+        # mappers now rather than on the first request's query
+        configure_mappers()
+
         # Initialize database
         logger.info("Initializing database connection...")
         await init_db()
 
+        # Shared HTTP client for LLM/TTS calls so TCP+TLS connections are
+        # reused across websocket turns instead of opened per request.
+        # HTTP/2 is negotiated over TLS (OpenRouter), multiplexing concurrent
+        # LLM calls on one connection; plain-HTTP TTS stays on HTTP/1.1.
+        logger.info("Initializing HTTP client...")
+        app.state.http = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=60
+            )
+        )
+        llm_service.initialize(app.state.http)
+        tts_service.initialize(app.state.http)
+
         # Initialize dialogue manager (Redis)
         logger.info("Initializing dialogue manager...")
         await dialogue_manager.initialize()
+        await scenario_cache.initialize()
+
+        # Initialize WebSocket fan-out (Redis pub/sub)
+        await websocket.manager.initialize()
+
+        # Start batching spaCy NER requests
+        nlp_service.initialize()
+
+        # Check the recordings bucket off the import path
+        await storage_service.initialize()
 
         logger.info("Application startup complete!")
 
     except Exception as e:
-        logger.error(f"Startup failed: {e}")
+        logger.error("Startup failed: %s", e)
         raise
 
     yield
@@ -54,6 +116,12 @@ async def lifespan(app: FastAPI):
     try:
         # Close dialogue manager (Redis)
         await dialogue_manager.close()
+        await scenario_cache.close()
+        await websocket.manager.close()
+        await nlp_service.close()
+
+        # Close shared HTTP client
+        await app.state.http.aclose()
 
         # Close database connections
         await engine.dispose()
@@ -61,7 +129,10 @@ async def lifespan(app: FastAPI):
         logger.info("Application shutdown complete")
 
     except Exception as e:
-        logger.error(f"Shutdown error: {e}")
+        logger.error("Shutdown error: %s", e)
+
+    # Flush queued log records
+    log_listener.stop()
 
 
 # Create FastAPI application
@@ -69,13 +140,15 @@ app = FastAPI(
     title="911 Operator Training Simulator API",
     description="Backend API for AI-powered 911 operator training simulation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Configure CORS. Starlette checks ``origin in allow_origins`` on every
+# request, so pass a frozenset rather than a list.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=settings.cors_origins_set,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -87,6 +160,19 @@ app.include_router(calls.router)
 app.include_router(websocket.router)
 
 
+# Probe timestamps only need second resolution; reuse one datetime per second
+_last_timestamp: Tuple[int, datetime] = (0, datetime.fromtimestamp(0, timezone.utc))
+
+
+def _probe_timestamp() -> datetime:
+    """Current UTC time truncated to the second, cached for that second"""
+    global _last_timestamp
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, datetime.fromtimestamp(second, timezone.utc))
+    return _last_timestamp[1]
+
+
 # Health check endpoints
 @app.get("/health", response_model=schemas.HealthCheckResponse, tags=["health"])
 async def health_check():
@@ -97,42 +183,57 @@ async def health_check():
     """
     return schemas.HealthCheckResponse(
         status="healthy",
-        timestamp=datetime.utcnow(),
+        timestamp=_probe_timestamp(),
         version="1.0.0"
     )
 
 
-@app.get("/ready", response_model=schemas.ReadinessCheckResponse, tags=["health"])
-async def readiness_check():
-    """
-    Readiness check endpoint.
-
-    Verifies all external dependencies are available.
-    """
-    # Check database
-    database_ready = True
-    try:
-        from sqlalchemy import text
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        database_ready = False
-
-    # Check Redis
-    redis_ready = True
+async def _check_redis() -> bool:
+    """Check that Redis answers a PING"""
     try:
         if dialogue_manager.redis_client:
             await dialogue_manager.redis_client.ping()
+        return True
     except Exception as e:
-        logger.error(f"Redis health check failed: {e}")
-        redis_ready = False
+        logger.error("Redis health check failed: %s", e)
+        return False
+
+
+# Seconds a readiness result is reused; probes polling faster than this
+# don't each hit PostgreSQL, Redis, S3 and TTS
+READY_CACHE_TTL = 2.0
+_ready_cache: Dict[str, Tuple[float, bool]] = {}
+
 
-    # Check S3
-    s3_ready = await storage_service.health_check()
+async def _cached_check(name: str, check: Callable[[], Awaitable[bool]]) -> bool:
+    """Run a dependency check, reusing its result for READY_CACHE_TTL seconds"""
+    now = time.monotonic()
+    checked_at, ok = _ready_cache.get(name, (0.0, False))
+    if now - checked_at < READY_CACHE_TTL:
+        return ok
+    ok = await check()
+    _ready_cache[name] = (time.monotonic(), ok)
+    return ok
 
-    # Check TTS
-    tts_ready = await tts_service.health_check()
+
+@app.get("/ready", response_model=schemas.ReadinessCheckResponse, tags=["health"])
+async def readiness_check():
+    """
+    Readiness check endpoint.
+
+    Verifies all external dependencies are available. The checks are
+    independent and run concurrently, so latency is that of the slowest one.
+    """
+    results = await asyncio.gather(
+        _cached_check("database", ping_db),
+        _cached_check("redis", _check_redis),
+        _cached_check("s3", storage_service.health_check),
+        _cached_check("tts", tts_service.health_check),
+        return_exceptions=True
+    )
+    database_ready, redis_ready, s3_ready, tts_ready = (
+        result is True for result in results
+    )
 
     # Overall status
     all_ready = database_ready and redis_ready and s3_ready and tts_ready
@@ -144,7 +245,7 @@ async def readiness_check():
         redis=redis_ready,
         s3=s3_ready,
         tts=tts_ready,
-        timestamp=datetime.utcnow()
+        timestamp=_probe_timestamp()
     )
 
 
@@ -170,8 +271,8 @@ async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled errors.
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -183,10 +284,18 @@ async def global_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
+    reload = settings.environment == "development"
     uvicorn.run(
         "app.main:app",
         host=settings.backend_host,
         port=settings.backend_port,
-        reload=settings.environment == "development",
-        log_level=settings.log_level.lower()
+        loop="uvloop",
+        http="httptools",
+        # uvicorn ignores workers when reloading
+        workers=1 if reload else settings.backend_workers,
+        reload=reload,
+        log_level=settings.log_level.lower(),
+        # Access lines are formatted and written synchronously on every
+        # request, so they are only kept for local development
+        access_log=reload
     )
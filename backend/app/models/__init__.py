@@ -7,7 +7,11 @@ from app.models.database import (
     CallSessionStatus,
     CallTranscript,
     DifficultyLevel,
+    EmotionalState,
+    EntityType,
     ExtractedEntity,
+    MetricDefinition,
+    PerformanceMetricRollup,
     PerformanceMetrics,
     Speaker,
     TrainingScenario,
@@ -19,7 +23,11 @@ __all__ = [
     "CallSessionStatus",
     "CallTranscript",
     "DifficultyLevel",
+    "EmotionalState",
+    "EntityType",
     "ExtractedEntity",
+    "MetricDefinition",
+    "PerformanceMetricRollup",
     "PerformanceMetrics",
     "Speaker",
     "TrainingScenario",
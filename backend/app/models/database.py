@@ -7,29 +7,93 @@ This module defines SQLAlchemy ORM models for the application including:
 - ExtractedEntity: Named entities extracted from transcripts
 - TrainingScenario: Pre-configured training scenarios
 - PerformanceMetrics: Metrics tracking operator performance
+- MetricDefinition: Lookup table of performance metric names
+- PerformanceMetricRollup: Per-session metric aggregates maintained by trigger
+
+Internal bookkeeping timestamps (created_at, updated_at, measured_at) are
+TIMESTAMP columns holding naive UTC values; only the client-facing
+started_at/ended_at columns on CallSession are time zone aware.
 """
 import enum
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    DDL,
     BigInteger,
     Boolean,
+    CheckConstraint,
+    Computed,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    ForeignKeyConstraint,
+    Identity,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
+    cast,
+    event,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql import func
 
 
+# Server-side default for internal TIMESTAMP (no time zone) columns, which
+# always hold UTC
+UTC_NOW = text("(now() AT TIME ZONE 'utc')")
+
+
+# Confidence scores are persisted as basis points: 0.9 -> 9000
+CONFIDENCE_SCALE = 10000
+
+
+def to_confidence_bp(score: Optional[float]) -> Optional[int]:
+    """Convert a 0.0-1.0 confidence score to basis points for ``confidence_bp``."""
+    return None if score is None else round(score * CONFIDENCE_SCALE)
+
+
+def elapsed_ms(start) -> ColumnElement[int]:
+    """SQL expression for the whole milliseconds between ``start`` and ``now()``."""
+    return cast(func.extract("epoch", func.now() - start) * 1000, Integer)
+
+
+def enum_values(enum_cls) -> list[str]:
+    """
+    ``values_callable`` for ``Enum`` columns: persist member values, not names.
+
+    The PostgreSQL enum types carry the lowercase values ('active'), and the
+    str-mixin members compare equal to them, so rows load straight into the
+    right member without a name lookup.
+    """
+    return [member.value for member in enum_cls]
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48 bits hold the unix epoch in milliseconds, so keys generated
+    in sequence sort in insertion order and append to the right edge of the
+    primary key index. Mirrors the ``uuid_generate_v7()`` server default
+    created by the initial migration.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     pass
@@ -57,6 +121,61 @@ class DifficultyLevel(str, enum.Enum):
     HARD = "hard"
 
 
+class EntityType(str, enum.Enum):
+    """Type of an entity extracted from a transcript."""
+    # Emergency-specific entities
+    WEAPON = "WEAPON"
+    INJURY = "INJURY"
+    LOCATION = "LOCATION"
+    PERSON = "PERSON"
+    VEHICLE = "VEHICLE"
+    MEDICAL = "MEDICAL"
+    TIME_REFERENCE = "TIME_REFERENCE"
+    # spaCy named entity labels
+    GPE = "GPE"
+    LOC = "LOC"
+    FAC = "FAC"
+    ORG = "ORG"
+    DATE = "DATE"
+    TIME = "TIME"
+    CARDINAL = "CARDINAL"
+
+
+class EmotionalState(str, enum.Enum):
+    """Detected emotional state of a speaker."""
+    CALM = "calm"
+    NEUTRAL = "neutral"
+    ANXIOUS = "anxious"
+    FEARFUL = "fearful"
+    PANICKED = "panicked"
+    HYSTERICAL = "hysterical"
+
+
+class ConfidenceScoreMixin:
+    """
+    Exposes a ``confidence_bp`` basis-point column as a 0.0-1.0 score.
+
+    Confidence is stored as a SMALLINT scaled by CONFIDENCE_SCALE (2 bytes
+    instead of an 8-byte float); ``confidence_score`` converts on read and
+    write and can be used in queries.
+    """
+
+    @hybrid_property
+    def confidence_score(self) -> Optional[float]:
+        if self.confidence_bp is None:
+            return None
+        return self.confidence_bp / CONFIDENCE_SCALE
+
+    @confidence_score.inplace.setter
+    def _confidence_score_setter(self, value: Optional[float]) -> None:
+        self.confidence_bp = to_confidence_bp(value)
+
+    @confidence_score.inplace.expression
+    @classmethod
+    def _confidence_score_expression(cls):
+        return cls.confidence_bp / CONFIDENCE_SCALE
+
+
 class TrainingScenario(Base):
     """
     Training scenarios for 911 operator simulation.
@@ -66,13 +185,21 @@ class TrainingScenario(Base):
     __tablename__ = "training_scenarios"
     __table_args__ = (
         Index("ix_training_scenarios_difficulty_active", "difficulty_level", "is_active"),
+        Index(
+            "ix_training_scenarios_script_gin",
+            "scenario_script",
+            postgresql_using="gin",
+            postgresql_ops={"scenario_script": "jsonb_path_ops"},
+        ),
+        Index("ix_training_scenarios_emergency_type", "emergency_type"),
+        Index("ix_training_scenarios_initial_emotional_state", "initial_emotional_state"),
         {"comment": "Pre-configured training scenarios for operator practice"}
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="Unique identifier for the scenario"
     )
     name: Mapped[str] = mapped_column(
@@ -86,7 +213,7 @@ class TrainingScenario(Base):
         comment="Detailed description of the scenario"
     )
     caller_profile: Mapped[dict] = mapped_column(
-        JSONB,
+        JSON,
         nullable=False,
         comment="Caller personality, background, and emotional state"
     )
@@ -95,8 +222,23 @@ class TrainingScenario(Base):
         nullable=False,
         comment="Initial conditions and expected dialogue flow"
     )
+    # Keys every API-created scenario carries (ScenarioScript.emergency_type,
+    # CallerProfile.initial_emotional_state), promoted to generated columns
+    # so filtering on them is a B-tree equality scan instead of a JSON
+    # lookup; maintained by PostgreSQL. The seeded scenarios use an older
+    # layout without these keys and hold NULL
+    emergency_type: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed("scenario_script->>'emergency_type'", persisted=True),
+        comment="Generated from scenario_script->>'emergency_type'"
+    )
+    initial_emotional_state: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed("caller_profile->>'initial_emotional_state'", persisted=True),
+        comment="Generated from caller_profile->>'initial_emotional_state'"
+    )
     difficulty_level: Mapped[DifficultyLevel] = mapped_column(
-        Enum(DifficultyLevel, name="difficulty_level_enum", create_type=True),
+        Enum(DifficultyLevel, name="difficulty_level_enum", create_type=True, values_callable=enum_values),
         nullable=False,
         comment="Difficulty rating for the scenario"
     )
@@ -107,15 +249,15 @@ class TrainingScenario(Base):
         comment="Whether this scenario is available for training"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
         nullable=False,
         comment="When the scenario was created"
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
+        onupdate=UTC_NOW,
         nullable=False,
         comment="When the scenario was last updated"
     )
@@ -139,19 +281,31 @@ class CallSession(Base):
     __tablename__ = "call_sessions"
     __table_args__ = (
         Index("ix_call_sessions_operator_started", "operator_id", "started_at"),
+        Index("ix_call_sessions_scenario_id", "scenario_id"),
+        Index(
+            "ix_call_sessions_active",
+            "scenario_id",
+            "started_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_call_sessions_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
         {"comment": "Training call sessions with operators"}
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="Unique identifier for the call session"
     )
     operator_id: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,
         comment="Identifier for the operator trainee"
     )
     scenario_id: Mapped[uuid.UUID] = mapped_column(
@@ -177,36 +331,48 @@ class CallSession(Base):
         comment="Total duration of call in milliseconds"
     )
     status: Mapped[CallSessionStatus] = mapped_column(
-        Enum(CallSessionStatus, name="call_session_status_enum", create_type=True),
+        Enum(CallSessionStatus, name="call_session_status_enum", create_type=True, values_callable=enum_values),
         nullable=False,
         default=CallSessionStatus.ACTIVE,
         comment="Current status of the call session"
     )
-    metadata: Mapped[Optional[dict]] = mapped_column(
+    notes: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Operator notes recorded when the call ended"
+    )
+    # Ad-hoc keys only: promote a key to its own column once it is queried.
+    # The attribute is not named "metadata", which Declarative reserves for
+    # the MetaData instance.
+    session_metadata: Mapped[Optional[dict]] = mapped_column(
+        "metadata",
         JSONB,
         nullable=True,
-        comment="Flexible storage for additional session data"
+        comment="Ad-hoc session data; keys used in queries are promoted to columns"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
         nullable=False,
         comment="Record creation timestamp"
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
+        onupdate=UTC_NOW,
         nullable=False,
         comment="Record last update timestamp"
     )
 
     # Relationships
     scenario: Mapped["TrainingScenario"] = relationship(back_populates="call_sessions")
+    # Collections never lazy load: a response touching them without an
+    # explicit selectinload raises instead of issuing one query per parent
     transcripts: Mapped[list["CallTranscript"]] = relationship(
         back_populates="session",
         cascade="all, delete-orphan",
-        order_by="CallTranscript.timestamp_ms"
+        order_by="CallTranscript.timestamp_ms",
+        lazy="raise"
     )
     performance_metrics: Mapped[list["PerformanceMetrics"]] = relationship(
         back_populates="session",
@@ -217,7 +383,7 @@ class CallSession(Base):
         return f"<CallSession(id={self.id}, operator={self.operator_id}, status={self.status.value})>"
 
 
-class CallTranscript(Base):
+class CallTranscript(ConfidenceScoreMixin, Base):
     """
     Individual dialogue entries during a call session.
 
@@ -225,32 +391,71 @@ class CallTranscript(Base):
     """
     __tablename__ = "call_transcripts"
     __table_args__ = (
+        CheckConstraint("confidence_bp BETWEEN 0 AND 10000", name="ck_call_transcripts_confidence_bp"),
+        CheckConstraint("timestamp_ms >= 0", name="ck_call_transcripts_timestamp_ms"),
+        # Ordered range scan for per-session transcript reads; text is not
+        # INCLUDEd since it can exceed the B-tree tuple size limit
         Index("ix_call_transcripts_session_timestamp", "session_id", "timestamp_ms"),
-        {"comment": "Dialogue entries during call sessions"}
-    )
-
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+        Index(
+            "ix_call_transcripts_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {
+            "comment": "Dialogue entries during call sessions",
+            "postgresql_partition_by": "RANGE (created_at)",
+        }
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # Part of a composite key, so it must be marked as the generated
+        # column for insertmanyvalues to use it as the sort sentinel and
+        # batch INSERT ... RETURNING instead of running one row at a time
+        autoincrement=True,
         comment="Unique identifier for the transcript entry"
     )
-    session_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("call_sessions.id", ondelete="CASCADE"),
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        primary_key=True,
+        server_default=UTC_NOW,
         nullable=False,
-        comment="Reference to the call session"
+        comment="Record creation timestamp (partition key)"
     )
     timestamp_ms: Mapped[int] = mapped_column(
         BigInteger,
         nullable=False,
         comment="Milliseconds from call start when this was spoken"
     )
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("call_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Reference to the call session"
+    )
     speaker: Mapped[Speaker] = mapped_column(
-        Enum(Speaker, name="speaker_enum", create_type=True),
+        Enum(Speaker, name="speaker_enum", create_type=True, values_callable=enum_values),
         nullable=False,
         comment="Who spoke this line (operator or caller)"
     )
+    emotional_state: Mapped[Optional[EmotionalState]] = mapped_column(
+        Enum(
+            EmotionalState,
+            name="emotional_state_enum",
+            create_type=True,
+            values_callable=enum_values,
+        ),
+        nullable=True,
+        comment="Detected emotional state (calm, anxious, panicked, hysterical)"
+    )
+    confidence_bp: Mapped[Optional[int]] = mapped_column(
+        SmallInteger,
+        nullable=True,
+        comment="Confidence score of transcription in basis points (0 to 10000)"
+    )
     text: Mapped[str] = mapped_column(
         Text,
         nullable=False,
@@ -261,28 +466,14 @@ class CallTranscript(Base):
         nullable=True,
         comment="S3 URL to audio recording of this utterance"
     )
-    emotional_state: Mapped[Optional[str]] = mapped_column(
-        String(20),
-        nullable=True,
-        comment="Detected emotional state (calm, anxious, panicked, hysterical)"
-    )
-    confidence_score: Mapped[Optional[float]] = mapped_column(
-        Float,
-        nullable=True,
-        comment="Confidence score of transcription (0.0 to 1.0)"
-    )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-        comment="Record creation timestamp"
-    )
 
     # Relationships
     session: Mapped["CallSession"] = relationship(back_populates="transcripts")
     extracted_entities: Mapped[list["ExtractedEntity"]] = relationship(
         back_populates="transcript",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="ExtractedEntity.start_char",
+        lazy="raise"
     )
 
     def __repr__(self) -> str:
@@ -290,7 +481,16 @@ class CallTranscript(Base):
         return f"<CallTranscript(id={self.id}, speaker={self.speaker.value}, text='{preview}')>"
 
 
-class ExtractedEntity(Base):
+# call_transcripts is range-partitioned by month in migrations; give tables
+# created through create_all a catch-all partition so inserts have a target.
+event.listen(
+    CallTranscript.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS call_transcripts_default PARTITION OF call_transcripts DEFAULT"),
+)
+
+
+class ExtractedEntity(ConfidenceScoreMixin, Base):
     """
     Named entities extracted from call transcripts.
 
@@ -298,36 +498,49 @@ class ExtractedEntity(Base):
     """
     __tablename__ = "extracted_entities"
     __table_args__ = (
+        ForeignKeyConstraint(
+            ["transcript_id", "transcript_created_at"],
+            ["call_transcripts.id", "call_transcripts.created_at"],
+            ondelete="CASCADE",
+        ),
+        CheckConstraint("confidence_bp BETWEEN 0 AND 10000", name="ck_extracted_entities_confidence_bp"),
+        CheckConstraint("start_char >= 0 AND end_char >= start_char", name="ck_extracted_entities_char_range"),
         Index("ix_extracted_entities_transcript_type", "transcript_id", "entity_type"),
-        {"comment": "Named entities extracted from transcripts"}
+        {
+            "comment": "Named entities extracted from transcripts",
+            "postgresql_partition_by": "RANGE (transcript_created_at)",
+        }
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # Sort sentinel for batched inserts, as on CallTranscript.id
+        autoincrement=True,
         comment="Unique identifier for the entity"
     )
-    transcript_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("call_transcripts.id", ondelete="CASCADE"),
+    transcript_id: Mapped[int] = mapped_column(
+        BigInteger,
         nullable=False,
         comment="Reference to the transcript containing this entity"
     )
-    entity_type: Mapped[str] = mapped_column(
-        String(50),
+    transcript_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        primary_key=True,
         nullable=False,
-        comment="Type of entity (WEAPON, INJURY, LOCATION, PERSON, VEHICLE, TIME_REFERENCE)"
+        comment="Partition key of the referenced transcript (and of this table)"
     )
-    entity_value: Mapped[str] = mapped_column(
-        Text,
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
         nullable=False,
-        comment="The actual text value of the entity"
+        comment="Record creation timestamp"
     )
-    confidence_score: Mapped[float] = mapped_column(
-        Float,
+    entity_type: Mapped[EntityType] = mapped_column(
+        Enum(EntityType, name="entity_type_enum", create_type=True, values_callable=enum_values),
         nullable=False,
-        comment="Confidence score of entity extraction (0.0 to 1.0)"
+        comment="Type of entity (WEAPON, INJURY, LOCATION, PERSON, VEHICLE, TIME_REFERENCE)"
     )
     start_char: Mapped[int] = mapped_column(
         Integer,
@@ -339,23 +552,36 @@ class ExtractedEntity(Base):
         nullable=False,
         comment="Ending character position in transcript text"
     )
-    metadata: Mapped[Optional[dict]] = mapped_column(
+    confidence_bp: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        comment="Confidence score of entity extraction in basis points (0 to 10000)"
+    )
+    entity_value: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="The actual text value of the entity"
+    )
+    entity_metadata: Mapped[Optional[dict]] = mapped_column(
+        "metadata",
         JSONB,
         nullable=True,
         comment="Additional entity-specific data"
     )
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        nullable=False,
-        comment="Record creation timestamp"
-    )
 
     # Relationships
     transcript: Mapped["CallTranscript"] = relationship(back_populates="extracted_entities")
 
     def __repr__(self) -> str:
-        return f"<ExtractedEntity(id={self.id}, type={self.entity_type}, value='{self.entity_value}')>"
+        return f"<ExtractedEntity(id={self.id}, type={self.entity_type.value}, value='{self.entity_value}')>"
+
+
+# extracted_entities is partitioned alongside call_transcripts in migrations
+event.listen(
+    ExtractedEntity.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS extracted_entities_default PARTITION OF extracted_entities DEFAULT"),
+)
 
 
 class PerformanceMetrics(Base):
@@ -370,37 +596,171 @@ class PerformanceMetrics(Base):
         {"comment": "Performance metrics for operator training"}
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
         comment="Unique identifier for the metric"
     )
+    metric_value: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Numeric value of the metric"
+    )
+    measured_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=UTC_NOW,
+        comment="When this metric was measured"
+    )
     session_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("call_sessions.id", ondelete="CASCADE"),
         nullable=False,
         comment="Reference to the call session"
     )
-    metric_name: Mapped[str] = mapped_column(
+    metric_id: Mapped[int] = mapped_column(
+        SmallInteger,
+        ForeignKey("metric_definitions.id"),
+        nullable=False,
+        comment="Reference to the metric definition"
+    )
+
+    # Relationships
+    session: Mapped["CallSession"] = relationship(back_populates="performance_metrics")
+    definition: Mapped["MetricDefinition"] = relationship(back_populates="measurements")
+
+    def __repr__(self) -> str:
+        return f"<PerformanceMetrics(id={self.id}, metric_id={self.metric_id}, value={self.metric_value})>"
+
+
+class MetricDefinition(Base):
+    """
+    Lookup table of performance metric names.
+
+    Metrics reference a definition by SMALLINT key instead of repeating the
+    metric name on every measurement row.
+    """
+    __tablename__ = "metric_definitions"
+    __table_args__ = {"comment": "Lookup table of performance metric names"}
+
+    id: Mapped[int] = mapped_column(
+        SmallInteger,
+        Identity(always=True),
+        primary_key=True,
+        comment="Unique identifier for the metric definition"
+    )
+    name: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
+        unique=True,
         comment="Name of the metric (response_time, empathy_score, info_gathered, etc.)"
     )
-    metric_value: Mapped[float] = mapped_column(
+    description: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="What the metric measures and how it is scored"
+    )
+
+    # Relationships
+    measurements: Mapped[list["PerformanceMetrics"]] = relationship(back_populates="definition")
+
+    def __repr__(self) -> str:
+        return f"<MetricDefinition(id={self.id}, name='{self.name}')>"
+
+
+class PerformanceMetricRollup(Base):
+    """
+    Per-session aggregate of performance metrics.
+
+    Maintained by a statement-level trigger on performance_metrics so
+    dashboards read one row per (session, metric) instead of aggregating
+    every measurement.
+    """
+    __tablename__ = "performance_metric_rollups"
+    __table_args__ = {"comment": "Per-session aggregates of performance metrics"}
+
+    sum_value: Mapped[float] = mapped_column(
         Float,
         nullable=False,
-        comment="Numeric value of the metric"
+        comment="Sum of all measured values"
     )
-    measured_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+    min_value: Mapped[float] = mapped_column(
+        Float,
         nullable=False,
-        server_default=func.now(),
-        comment="When this metric was measured"
+        comment="Smallest measured value"
+    )
+    max_value: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Largest measured value"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        server_default=UTC_NOW,
+        nullable=False,
+        comment="When the rollup last absorbed new measurements"
+    )
+    session_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("call_sessions.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Reference to the call session"
+    )
+    sample_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of measurements aggregated"
+    )
+    metric_id: Mapped[int] = mapped_column(
+        SmallInteger,
+        ForeignKey("metric_definitions.id"),
+        primary_key=True,
+        comment="Reference to the metric definition"
     )
 
-    # Relationships
-    session: Mapped["CallSession"] = relationship(back_populates="performance_metrics")
+    @property
+    def avg_value(self) -> float:
+        """Mean of all measured values"""
+        return self.sum_value / self.sample_count
 
     def __repr__(self) -> str:
-        return f"<PerformanceMetrics(id={self.id}, metric={self.metric_name}, value={self.metric_value})>"
+        return f"<PerformanceMetricRollup(session_id={self.session_id}, metric_id={self.metric_id}, count={self.sample_count})>"
+
+
+# Keep performance_metric_rollups current for tables created through
+# create_all; migrations install the same function and trigger. asyncpg
+# prepares each DDL, so every listener carries exactly one statement.
+event.listen(
+    PerformanceMetrics.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE FUNCTION performance_metrics_rollup() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO performance_metric_rollups AS r
+                (session_id, metric_id, sample_count, sum_value, min_value, max_value, updated_at)
+            SELECT session_id, metric_id, count(*), sum(metric_value), min(metric_value), max(metric_value),
+                   now() AT TIME ZONE 'utc'
+            FROM new_rows
+            GROUP BY session_id, metric_id
+            ON CONFLICT (session_id, metric_id) DO UPDATE SET
+                sample_count = r.sample_count + EXCLUDED.sample_count,
+                sum_value = r.sum_value + EXCLUDED.sum_value,
+                min_value = LEAST(r.min_value, EXCLUDED.min_value),
+                max_value = GREATEST(r.max_value, EXCLUDED.max_value),
+                updated_at = EXCLUDED.updated_at;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """),
+)
+event.listen(
+    PerformanceMetrics.__table__,
+    "after_create",
+    DDL("""
+        CREATE OR REPLACE TRIGGER trg_performance_metrics_rollup
+            AFTER INSERT ON performance_metrics
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION performance_metrics_rollup()
+    """),
+)
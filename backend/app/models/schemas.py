@@ -1,9 +1,9 @@
 """Pydantic schemas for request/response validation"""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Literal
+from typing import Annotated, Optional, List, Dict, Any, Literal, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 
 
 # WebSocket Message Schemas
@@ -29,7 +29,7 @@ class WSControlMessage(WSMessageBase):
 class WSTranscriptUpdate(WSMessageBase):
     """WebSocket transcript update message"""
     type: Literal["transcript_update"] = "transcript_update"
-    transcript_id: UUID
+    transcript_id: int
     speaker: Literal["operator", "caller"]
     text: str
     timestamp_ms: int
@@ -39,7 +39,7 @@ class WSTranscriptUpdate(WSMessageBase):
 class WSEntityUpdate(WSMessageBase):
     """WebSocket entity extraction update"""
     type: Literal["entity_update"] = "entity_update"
-    entity_id: UUID
+    entity_id: int
     entity_type: str
     entity_value: str
     confidence_score: float
@@ -60,6 +60,36 @@ class WSError(WSMessageBase):
     error_message: str
 
 
+# Client -> server WebSocket messages. Parsed straight from the raw frame
+# with a TypeAdapter; fields default the same way the handlers always did.
+class WSClientAudioChunk(BaseModel):
+    """Operator audio chunk sent by the client"""
+    type: Literal["audio_chunk"]
+    audio_data: str = ""
+    timestamp_ms: int = 0
+
+
+class WSClientControl(BaseModel):
+    """Control command sent by the client"""
+    type: Literal["control"]
+    action: Optional[str] = None
+
+
+class WSClientTranscript(BaseModel):
+    """Operator transcript sent by the client"""
+    type: Literal["transcript"]
+    text: str = ""
+    # Milliseconds since call start; also the key retries are deduplicated
+    # by, so turns sent without it are never treated as duplicates
+    timestamp_ms: Optional[int] = None
+
+
+WSClientMessage = Annotated[
+    Union[WSClientAudioChunk, WSClientControl, WSClientTranscript],
+    Field(discriminator="type")
+]
+
+
 # Call Session Schemas
 class CallSessionCreate(BaseModel):
     """Schema for creating a new call session"""
@@ -76,7 +106,11 @@ class CallSessionResponse(BaseModel):
     ended_at: Optional[datetime] = None
     duration_ms: Optional[int] = None
     status: str
-    metadata: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        validation_alias=AliasChoices("session_metadata", "metadata")
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -90,7 +124,7 @@ class CallSessionEnd(BaseModel):
 # Transcript Schemas
 class TranscriptEntryResponse(BaseModel):
     """Schema for transcript entry response"""
-    id: UUID
+    id: int
     session_id: UUID
     timestamp_ms: int
     speaker: str
@@ -107,19 +141,25 @@ class TranscriptListResponse(BaseModel):
     session_id: UUID
     transcripts: List[TranscriptEntryResponse]
     total_count: int
+    # Keyset cursor for the next page; unset once the last page is returned
+    next_after_timestamp_ms: Optional[int] = None
+    next_after_id: Optional[int] = None
 
 
 # Entity Schemas
 class ExtractedEntityResponse(BaseModel):
     """Schema for extracted entity response"""
-    id: UUID
-    transcript_id: UUID
+    id: int
+    transcript_id: int
     entity_type: str
     entity_value: str
     confidence_score: float
     start_char: int
     end_char: int
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        validation_alias=AliasChoices("entity_metadata", "metadata")
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -130,7 +170,7 @@ class CallerProfile(BaseModel):
     name: str
     age: Optional[int] = None
     gender: Optional[str] = None
-    initial_emotional_state: str = "calm"
+    initial_emotional_state: Literal["calm", "neutral", "anxious", "fearful", "panicked", "hysterical"] = "calm"
     personality_traits: List[str] = Field(default_factory=list)
     background_story: Optional[str] = None
 
@@ -154,13 +194,11 @@ class TrainingScenarioCreate(BaseModel):
     difficulty_level: Literal["beginner", "intermediate", "advanced", "expert"] = "beginner"
 
 
-class TrainingScenarioResponse(BaseModel):
-    """Schema for training scenario response"""
+class TrainingScenarioSummary(BaseModel):
+    """Schema for a training scenario in list views (no JSONB configuration)"""
     id: UUID
     name: str
     description: str
-    caller_profile: Dict[str, Any]
-    scenario_script: Dict[str, Any]
     difficulty_level: str
     created_at: datetime
     updated_at: datetime
@@ -168,9 +206,15 @@ class TrainingScenarioResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TrainingScenarioResponse(TrainingScenarioSummary):
+    """Schema for training scenario response"""
+    caller_profile: Dict[str, Any]
+    scenario_script: Dict[str, Any]
+
+
 class TrainingScenarioListResponse(BaseModel):
     """Schema for list of training scenarios"""
-    scenarios: List[TrainingScenarioResponse]
+    scenarios: List[TrainingScenarioSummary]
     total_count: int
 
 
@@ -1,12 +1,35 @@
 """Audio encoding/decoding service"""
 
 import logging
-import base64
 import io
-from typing import Optional, Dict, Any
+import struct
+import zlib
+from typing import Optional, Dict, Any, Tuple
+
+import numpy as np
+import pybase64
+import soxr
 
 logger = logging.getLogger(__name__)
 
+# Leading magic bytes for header-based format detection, checked in order
+AUDIO_FORMAT_MAGIC = (
+    (b"RIFF", "wav"),
+    (b"OggS", "ogg"),
+    ((b"ID3", b"\xff\xfb"), "mp3"),
+)
+
+# Preamble of a binary audio WebSocket frame: timestamp_ms (u64) and sequence
+# number (u32), network byte order, followed directly by the raw audio bytes
+AUDIO_FRAME_HEADER = struct.Struct("!QI")
+
+# Canonical WAV "fmt " chunk body at offset 20: audio format, channels,
+# sample rate, byte rate, block align, bits per sample
+WAV_FMT = struct.Struct("<HHIIHH")
+WAV_FMT_OFFSET = 20
+# Chunk header: four-byte id and little-endian u32 size
+WAV_CHUNK_HEADER = struct.Struct("<4sI")
+
 
 class AudioService:
     """Service for audio encoding, decoding, and format conversion"""
@@ -25,9 +48,10 @@ class AudioService:
             Base64 encoded string
         """
         try:
-            return base64.b64encode(audio_bytes).decode('utf-8')
+            # ASCII is all base64 can contain and decodes faster than UTF-8
+            return pybase64.b64encode(audio_bytes).decode('ascii')
         except Exception as e:
-            logger.error(f"Audio encoding failed: {e}")
+            logger.error("Audio encoding failed: %s", e)
             raise ValueError(f"Failed to encode audio: {e}")
 
     def decode_audio(self, audio_base64: str) -> bytes:
@@ -41,9 +65,9 @@ class AudioService:
             Raw audio bytes
         """
         try:
-            return base64.b64decode(audio_base64)
+            return pybase64.b64decode(audio_base64, validate=False)
         except Exception as e:
-            logger.error(f"Audio decoding failed: {e}")
+            logger.error("Audio decoding failed: %s", e)
             raise ValueError(f"Failed to decode audio: {e}")
 
     def validate_audio_chunk(
@@ -62,21 +86,58 @@ class AudioService:
             bool: True if valid
         """
         try:
-            # Check if valid base64
-            audio_bytes = base64.b64decode(audio_data)
-
-            # Check size
-            size_kb = len(audio_bytes) / 1024
-            if size_kb > max_size_kb:
-                logger.warning(f"Audio chunk too large: {size_kb:.2f}KB > {max_size_kb}KB")
+            # Decoded size follows from the encoded length and padding, so
+            # oversized chunks are rejected without decoding anything
+            size_bytes = len(audio_data) * 3 // 4 - audio_data[-2:].count("=")
+            if size_bytes > max_size_kb * 1024:
+                logger.warning("Audio chunk too large: %.2fKB > %sKB", size_bytes / 1024, max_size_kb)
                 return False
 
+            # Strict decode validates the alphabet and padding in the same
+            # pass instead of silently discarding invalid characters
+            pybase64.b64decode(audio_data, validate=True)
+
             return True
 
         except Exception as e:
-            logger.error(f"Audio validation failed: {e}")
+            logger.error("Audio validation failed: %s", e)
             return False
 
+    def pack_audio_frame(self, audio_bytes: bytes, timestamp_ms: int, seq: int) -> bytes:
+        """
+        Build a binary audio WebSocket frame.
+
+        Args:
+            audio_bytes: Raw audio bytes
+            timestamp_ms: Milliseconds since call start
+            seq: Chunk sequence number
+
+        Returns:
+            Header followed by the audio bytes
+        """
+        return AUDIO_FRAME_HEADER.pack(timestamp_ms, seq) + audio_bytes
+
+    def unpack_audio_frame(self, frame: bytes) -> Tuple[int, int, memoryview]:
+        """
+        Split a binary audio WebSocket frame into header fields and audio.
+
+        The audio is returned as a view into the frame, so nothing is copied
+        or base64 decoded on the ingest path.
+
+        Args:
+            frame: Binary frame from pack_audio_frame
+
+        Returns:
+            Tuple of (timestamp_ms, seq, audio)
+
+        Raises:
+            ValueError: If the frame is shorter than the header
+        """
+        if len(frame) < AUDIO_FRAME_HEADER.size:
+            raise ValueError(f"Audio frame shorter than {AUDIO_FRAME_HEADER.size}-byte header")
+        timestamp_ms, seq = AUDIO_FRAME_HEADER.unpack_from(frame)
+        return timestamp_ms, seq, memoryview(frame)[AUDIO_FRAME_HEADER.size:]
+
     def concatenate_audio_chunks(
         self,
         chunks: list[bytes],
@@ -99,7 +160,7 @@ class AudioService:
                 # For non-WAV formats, simple concatenation
                 return b"".join(chunks)
         except Exception as e:
-            logger.error(f"Audio concatenation failed: {e}")
+            logger.error("Audio concatenation failed: %s", e)
             raise
 
     def _concatenate_wav_chunks(self, chunks: list[bytes]) -> bytes:
@@ -135,23 +196,30 @@ class AudioService:
             size_bytes = len(audio_bytes)
             size_kb = size_bytes / 1024
 
-            # Try to detect format from header
+            # Try to detect format from header; startswith compares in place
+            # without slicing a new bytes object per check
             format_detected = "unknown"
-            if audio_bytes[:4] == b"RIFF":
-                format_detected = "wav"
-            elif audio_bytes[:4] == b"OggS":
-                format_detected = "ogg"
-            elif audio_bytes[:3] == b"ID3" or audio_bytes[:2] == b"\xff\xfb":
-                format_detected = "mp3"
+            if size_bytes >= 2:
+                for magic, audio_format in AUDIO_FORMAT_MAGIC:
+                    if audio_bytes.startswith(magic):
+                        format_detected = audio_format
+                        break
 
-            return {
+            metadata = {
                 "size_bytes": size_bytes,
                 "size_kb": size_kb,
-                "format": format_detected
+                "format": format_detected,
+                # CRC-32 runs in C over the whole buffer; cheap enough to key
+                # deduplication of identical uploads
+                "content_hash": f"{zlib.crc32(audio_bytes):08x}"
             }
+            if format_detected == "wav":
+                metadata.update(self.parse_wav_header(audio_bytes))
+
+            return metadata
 
         except Exception as e:
-            logger.error(f"Failed to extract audio metadata: {e}")
+            logger.error("Failed to extract audio metadata: %s", e)
             return {
                 "size_bytes": len(audio_bytes),
                 "size_kb": len(audio_bytes) / 1024,
@@ -159,6 +227,52 @@ class AudioService:
                 "error": str(e)
             }
 
+    def parse_wav_header(self, audio_bytes: bytes) -> Dict[str, Any]:
+        """
+        Read stream parameters from a canonical RIFF/WAVE header.
+
+        Fields are unpacked in place with struct.unpack_from, without
+        slicing the buffer. Only the header is needed, so the first chunk of
+        a streamed file is enough.
+
+        Args:
+            audio_bytes: WAV bytes, or at least their leading chunk
+
+        Returns:
+            Dict with audio_format, channels, sample_rate, bits_per_sample
+            and, once the "data" chunk header is reached, duration_ms; empty
+            if the header is not the canonical "WAVE" + "fmt " layout
+        """
+        if (
+            len(audio_bytes) < WAV_FMT_OFFSET + WAV_FMT.size
+            or not audio_bytes.startswith(b"WAVE", 8)
+            or not audio_bytes.startswith(b"fmt ", 12)
+        ):
+            return {}
+
+        audio_format, channels, sample_rate, byte_rate, block_align, bits_per_sample = (
+            WAV_FMT.unpack_from(audio_bytes, WAV_FMT_OFFSET)
+        )
+        header = {
+            "audio_format": audio_format,
+            "channels": channels,
+            "sample_rate": sample_rate,
+            "bits_per_sample": bits_per_sample,
+        }
+
+        # Walk the chunks after "fmt " to the "data" chunk for the duration
+        offset = 12
+        while offset + WAV_CHUNK_HEADER.size <= len(audio_bytes):
+            chunk_id, chunk_size = WAV_CHUNK_HEADER.unpack_from(audio_bytes, offset)
+            if chunk_id == b"data":
+                if byte_rate:
+                    header["duration_ms"] = chunk_size * 1000 // byte_rate
+                break
+            # Chunks are padded to an even size
+            offset += WAV_CHUNK_HEADER.size + chunk_size + (chunk_size & 1)
+
+        return header
+
     def convert_sample_rate(
         self,
         audio_bytes: bytes,
@@ -166,20 +280,29 @@ class AudioService:
         target_rate: int
     ) -> bytes:
         """
-        Convert audio sample rate.
+        Convert the sample rate of mono 16-bit PCM audio.
 
-        Note: This is a placeholder. In production, use librosa, scipy, or ffmpeg.
+        Uses soxr's vectorized polyphase resampler.
 
         Args:
-            audio_bytes: Raw audio bytes
+            audio_bytes: Raw little-endian int16 PCM samples
             source_rate: Source sample rate
             target_rate: Target sample rate
 
         Returns:
             Converted audio bytes
         """
-        logger.warning("Sample rate conversion not implemented - returning original audio")
-        return audio_bytes
+        if source_rate == target_rate or not audio_bytes:
+            return audio_bytes
+
+        try:
+            samples = np.frombuffer(audio_bytes, dtype="<i2")
+            # int16 in, int16 out: soxr keeps the sample type, no float copies
+            resampled = soxr.resample(samples, source_rate, target_rate, quality="HQ")
+            return resampled.tobytes()
+        except Exception as e:
+            logger.error("Sample rate conversion failed: %s", e)
+            raise ValueError(f"Failed to convert sample rate: {e}")
 
 
 # Global service instance
@@ -1,32 +1,214 @@
 """Dialogue manager for conversation context and state management"""
 
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-import json
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+import orjson
 import redis.asyncio as redis
-from app.core.config import settings
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def _context_key(session_id: str) -> str:
+    # Redis hash with one orjson-encoded value per context field, so an
+    # update writes only the fields it changes instead of the whole context
+    return f"session:{session_id}:context"
+
+
+def _history_key(session_id: str) -> str:
+    # Conversation turns live in their own Redis list so the context stays
+    # small and recent turns can be read with LRANGE instead of the whole call
+    return f"session:{session_id}:history"
+
+
+def _entities_key(session_id: str) -> str:
+    # Set of orjson-encoded [entity_type, entity_value] pairs; SADD
+    # deduplicates without reading the entities back
+    return f"session:{session_id}:entities"
+
+
+def _turns_key(session_id: str) -> str:
+    # Timestamps of operator turns already handled, for retry deduplication
+    return f"session:{session_id}:turns"
+
+
+# Applies one batch of context updates atomically and in one round trip.
+# Does nothing and returns 0 when the context is gone (session ended or
+# expired), so late updates cannot recreate a partial context.
+#   KEYS: context hash, history list, entities set
+#   ARGV: ttl, max history turns kept, encoded emotional state or "",
+#         number of turns N, N encoded turns, then encoded entity pairs
+APPLY_BATCH_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local ttl = ARGV[1]
+if ARGV[3] ~= '' then
+    redis.call('HSET', KEYS[1], 'current_emotional_state', ARGV[3])
+end
+local turns = tonumber(ARGV[4])
+if turns > 0 then
+    redis.call('RPUSH', KEYS[2], unpack(ARGV, 5, 4 + turns))
+    redis.call('LTRIM', KEYS[2], -tonumber(ARGV[2]), -1)
+    redis.call('HINCRBY', KEYS[1], 'turn_count', turns)
+    redis.call('EXPIRE', KEYS[2], ttl)
+end
+if #ARGV > 4 + turns then
+    redis.call('SADD', KEYS[3], unpack(ARGV, 5 + turns, #ARGV))
+    redis.call('EXPIRE', KEYS[3], ttl)
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+return 1
+"""
+
+# Overwrites context hash fields only if the context exists.
+#   KEYS: context hash
+#   ARGV: ttl, then alternating field names and encoded values
+UPDATE_FIELDS_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def _build_turn(
+    speaker: str,
+    text: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build a conversation turn entry"""
+    return {
+        "role": "assistant" if speaker == "caller" else "user",
+        "content": text,
+        "speaker": speaker,
+        # Epoch nanoseconds; an int is cheaper to produce and encode than an
+        # ISO string, and nothing reads it back on the hot path
+        "timestamp_ns": time.time_ns(),
+        "metadata": metadata or {}
+    }
+
+
+def _encode_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+    """Encode context fields for HSET"""
+    return {name: orjson.dumps(value) for name, value in fields.items()}
+
+
+def _group_entities(members) -> Dict[str, List[str]]:
+    """Rebuild the extracted_entities mapping from entities set members"""
+    extracted: Dict[str, List[str]] = {}
+    # Sets are unordered; sort so prompts built from the context are stable
+    for member in sorted(members):
+        entity_type, entity_value = orjson.loads(member)
+        extracted.setdefault(entity_type, []).append(entity_value)
+    return extracted
+
+
+def _mirror_updates(
+    context: Optional[Dict[str, Any]],
+    emotional_state: Optional[str] = None,
+    turn_count: int = 0,
+    entities: Optional[List[Tuple[str, str]]] = None
+) -> None:
+    """Apply updates already written to Redis to a caller's context dict"""
+    if context is None:
+        return
+    if emotional_state is not None:
+        context["current_emotional_state"] = emotional_state
+    context["turn_count"] = context.get("turn_count", 0) + turn_count
+    for entity_type, entity_value in entities or []:
+        values = context.setdefault("extracted_entities", {}).setdefault(entity_type, [])
+        if entity_value not in values:
+            values.append(entity_value)
+
+
+class SessionContextBatch:
+    """
+    Accumulates several context updates for one session.
+
+    Updates are collected in memory and applied when the block exits by a
+    single APPLY_BATCH_LUA call: emotional state, new conversation turns and
+    the turn count, and extracted entities, atomically and in one round trip
+    without reading the context first.
+    """
+
+    def __init__(self, redis_client, session_id: str):
+        self.redis_client = redis_client
+        self.session_id = session_id
+        self.emotional_state: Optional[str] = None
+        self.new_turns: List[Dict[str, Any]] = []
+        self.entities: List[Tuple[str, str]] = []
+
+    def add_conversation_turn(
+        self,
+        speaker: str,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a conversation turn to history"""
+        self.new_turns.append(_build_turn(speaker, text, metadata))
+
+    async def get_conversation_history(self, max_turns: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get conversation history, including turns added in this batch"""
+        if max_turns and max_turns <= len(self.new_turns):
+            return self.new_turns[-max_turns:]
+
+        # Only fetch the stored turns still needed to fill max_turns
+        start = -(max_turns - len(self.new_turns)) if max_turns else 0
+        stored = await self.redis_client.lrange(_history_key(self.session_id), start, -1)
+        return [orjson.loads(turn) for turn in stored] + self.new_turns
+
+    def update_emotional_state(self, emotional_state: str) -> None:
+        """Update caller's emotional state"""
+        self.emotional_state = emotional_state
+
+    def add_extracted_entities(self, entities: List[Tuple[str, str]]) -> None:
+        """Add (entity_type, entity_value) pairs to the context"""
+        self.entities.extend(entities)
+
+
 class DialogueManager:
     """Manages conversation context and state for call sessions"""
 
     def __init__(self):
         self.redis_client = None
+        self._apply_batch = None
+        self._update_fields = None
+        self.session_ttl: Optional[int] = None
+        self.max_history_turns: Optional[int] = None
 
     async def initialize(self):
-        """Initialize Redis connection"""
+        """Read the session settings and initialize Redis connection"""
+        settings = get_settings()
+        self.session_ttl = settings.session_ttl
+        self.max_history_turns = settings.max_history_turns
         try:
-            self.redis_client = await redis.from_url(
+            # Every socket's turn handling shares this client; a bounded
+            # blocking pool queues bursts for a free connection instead of
+            # opening new ones, and keepalive stops idle connections from
+            # being silently dropped by NAT or load balancers
+            pool = redis.BlockingConnectionPool.from_url(
                 settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                socket_keepalive=True,
+                # RESP3 replies are typed, so hiredis builds maps and sets
+                # directly instead of pairing up flat RESP2 arrays
+                protocol=3,
                 encoding="utf-8",
                 decode_responses=True
             )
+            self.redis_client = redis.Redis.from_pool(pool)
+            # Runs by EVALSHA, loading the script on first use or after a
+            # Redis restart
+            self._apply_batch = self.redis_client.register_script(APPLY_BATCH_LUA)
+            self._update_fields = self.redis_client.register_script(UPDATE_FIELDS_LUA)
             logger.info("DialogueManager initialized with Redis connection")
         except Exception as e:
-            logger.error(f"Failed to initialize DialogueManager: {e}")
+            logger.error("Failed to initialize DialogueManager: %s", e)
             raise
 
     async def close(self):
@@ -35,6 +217,46 @@ class DialogueManager:
             await self.redis_client.close()
             logger.info("DialogueManager Redis connection closed")
 
+    def _batch_call(
+        self,
+        session_id: str,
+        emotional_state: Optional[str] = None,
+        turns: Optional[List[Dict[str, Any]]] = None,
+        entities: Optional[List[Tuple[str, str]]] = None,
+        client=None
+    ):
+        """Start an APPLY_BATCH_LUA call, on a pipeline if one is given"""
+        turns = turns or []
+        args = [
+            self.session_ttl,
+            self.max_history_turns,
+            orjson.dumps(emotional_state) if emotional_state is not None else "",
+            len(turns),
+            *(orjson.dumps(turn) for turn in turns),
+            *(orjson.dumps([entity_type, entity_value]) for entity_type, entity_value in entities or []),
+        ]
+        return self._apply_batch(
+            keys=[_context_key(session_id), _history_key(session_id), _entities_key(session_id)],
+            args=args,
+            client=client
+        )
+
+    async def _apply(
+        self,
+        session_id: str,
+        emotional_state: Optional[str] = None,
+        turns: Optional[List[Dict[str, Any]]] = None,
+        entities: Optional[List[Tuple[str, str]]] = None
+    ) -> None:
+        """
+        Apply context updates with one APPLY_BATCH_LUA call.
+
+        Raises:
+            ValueError: If the session context does not exist
+        """
+        if not await self._batch_call(session_id, emotional_state, turns, entities):
+            raise ValueError(f"Session context not found: {session_id}")
+
     async def create_session_context(
         self,
         session_id: str,
@@ -54,25 +276,22 @@ class DialogueManager:
                 "session_id": session_id,
                 "scenario": scenario_data,
                 "caller_profile": caller_profile,
-                "conversation_history": [],
                 "current_emotional_state": caller_profile.get("initial_emotional_state", "calm"),
-                "extracted_entities": {},
                 "key_info_revealed": [],
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at_ns": time.time_ns(),
                 "turn_count": 0
             }
 
-            key = f"session:{session_id}:context"
-            await self.redis_client.set(
-                key,
-                json.dumps(context),
-                ex=settings.session_ttl
-            )
+            key = _context_key(session_id)
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=_encode_fields(context))
+                pipe.expire(key, self.session_ttl)
+                await pipe.execute()
 
-            logger.info(f"Session context created: {session_id}")
+            logger.info("Session context created: %s", session_id)
 
         except Exception as e:
-            logger.error(f"Failed to create session context: {e}")
+            logger.error("Failed to create session context: %s", e)
             raise
 
     async def get_session_context(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -86,17 +305,21 @@ class DialogueManager:
             Session context dict or None if not found
         """
         try:
-            key = f"session:{session_id}:context"
-            data = await self.redis_client.get(key)
-
-            if data:
-                return json.loads(data)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(_context_key(session_id))
+                pipe.smembers(_entities_key(session_id))
+                fields, entities = await pipe.execute()
+
+            if fields:
+                context = {name: orjson.loads(value) for name, value in fields.items()}
+                context["extracted_entities"] = _group_entities(entities)
+                return context
             else:
-                logger.warning(f"Session context not found: {session_id}")
+                logger.warning("Session context not found: %s", session_id)
                 return None
 
         except Exception as e:
-            logger.error(f"Failed to get session context: {e}")
+            logger.error("Failed to get session context: %s", e)
             return None
 
     async def update_session_context(
@@ -107,29 +330,28 @@ class DialogueManager:
         """
         Update session context with new information.
 
+        Only the given fields are written. Use add_extracted_entities for
+        entities and add_conversation_turn for turns.
+
         Args:
             session_id: Call session ID
             updates: Dictionary of fields to update
         """
         try:
-            context = await self.get_session_context(session_id)
-            if not context:
-                raise ValueError(f"Session context not found: {session_id}")
+            if not updates:
+                return
 
-            # Update context
-            context.update(updates)
+            args = [self.session_ttl]
+            for name, value in _encode_fields(updates).items():
+                args.extend((name, value))
 
-            key = f"session:{session_id}:context"
-            await self.redis_client.set(
-                key,
-                json.dumps(context),
-                ex=settings.session_ttl
-            )
+            if not await self._update_fields(keys=[_context_key(session_id)], args=args):
+                raise ValueError(f"Session context not found: {session_id}")
 
-            logger.debug(f"Session context updated: {session_id}")
+            logger.debug("Session context updated: %s", session_id)
 
         except Exception as e:
-            logger.error(f"Failed to update session context: {e}")
+            logger.error("Failed to update session context: %s", e)
             raise
 
     async def add_conversation_turn(
@@ -142,6 +364,9 @@ class DialogueManager:
         """
         Add a conversation turn to history.
 
+        Appends the turn, bumps turn_count and refreshes the TTLs in one
+        atomic script call.
+
         Args:
             session_id: Call session ID
             speaker: "operator" or "caller"
@@ -149,25 +374,52 @@ class DialogueManager:
             metadata: Optional metadata
         """
         try:
-            context = await self.get_session_context(session_id)
-            if not context:
-                raise ValueError(f"Session context not found: {session_id}")
+            await self._apply(session_id, turns=[_build_turn(speaker, text, metadata)])
 
-            turn = {
-                "role": "assistant" if speaker == "caller" else "user",
-                "content": text,
-                "speaker": speaker,
-                "timestamp": datetime.utcnow().isoformat(),
-                "metadata": metadata or {}
-            }
+        except Exception as e:
+            logger.error("Failed to add conversation turn: %s", e)
+            raise
 
-            context["conversation_history"].append(turn)
-            context["turn_count"] = len(context["conversation_history"])
+    async def add_turn_and_get_history(
+        self,
+        session_id: str,
+        speaker: str,
+        text: str,
+        max_turns: int,
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Add a conversation turn and read the latest turns in one round trip.
 
-            await self.update_session_context(session_id, context)
+        The append script and the LRANGE are sent on one pipeline; the script
+        runs first, so the returned history ends with the new turn.
+
+        Args:
+            session_id: Call session ID
+            speaker: "operator" or "caller"
+            text: Utterance text
+            max_turns: Number of most recent turns to return
+            context: Caller-held context to update in place, as in pipeline()
+
+        Returns:
+            List of conversation turns, oldest first
+
+        Raises:
+            ValueError: If the session context does not exist
+        """
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                await self._batch_call(session_id, turns=[_build_turn(speaker, text)], client=pipe)
+                pipe.lrange(_history_key(session_id), -max_turns, -1)
+                applied, history = await pipe.execute()
+
+            if not applied:
+                raise ValueError(f"Session context not found: {session_id}")
+            _mirror_updates(context, turn_count=1)
+            return [orjson.loads(turn) for turn in history]
 
         except Exception as e:
-            logger.error(f"Failed to add conversation turn: {e}")
+            logger.error("Failed to add conversation turn: %s", e)
             raise
 
     async def get_conversation_history(
@@ -178,27 +430,22 @@ class DialogueManager:
         """
         Get conversation history for a session.
 
+        Only the requested tail of the history list is read from Redis.
+
         Args:
             session_id: Call session ID
             max_turns: Optional limit on number of turns to return
 
         Returns:
-            List of conversation turns
+            List of conversation turns, oldest first
         """
         try:
-            context = await self.get_session_context(session_id)
-            if not context:
-                return []
-
-            history = context.get("conversation_history", [])
-
-            if max_turns:
-                return history[-max_turns:]
-            else:
-                return history
+            start = -max_turns if max_turns else 0
+            history = await self.redis_client.lrange(_history_key(session_id), start, -1)
+            return [orjson.loads(turn) for turn in history]
 
         except Exception as e:
-            logger.error(f"Failed to get conversation history: {e}")
+            logger.error("Failed to get conversation history: %s", e)
             return []
 
     async def update_emotional_state(
@@ -214,14 +461,11 @@ class DialogueManager:
             emotional_state: New emotional state
         """
         try:
-            await self.update_session_context(
-                session_id,
-                {"current_emotional_state": emotional_state}
-            )
-            logger.info(f"Emotional state updated to '{emotional_state}' for session {session_id}")
+            await self._apply(session_id, emotional_state=emotional_state)
+            logger.info("Emotional state updated to '%s' for session %s", emotional_state, session_id)
 
         except Exception as e:
-            logger.error(f"Failed to update emotional state: {e}")
+            logger.error("Failed to update emotional state: %s", e)
             raise
 
     async def add_extracted_entity(
@@ -239,22 +483,123 @@ class DialogueManager:
             entity_value: Entity value
         """
         try:
-            context = await self.get_session_context(session_id)
-            if not context:
-                raise ValueError(f"Session context not found: {session_id}")
+            await self._apply(session_id, entities=[(entity_type, entity_value)])
 
-            if entity_type not in context["extracted_entities"]:
-                context["extracted_entities"][entity_type] = []
+        except Exception as e:
+            logger.error("Failed to add extracted entity: %s", e)
+            raise
 
-            if entity_value not in context["extracted_entities"][entity_type]:
-                context["extracted_entities"][entity_type].append(entity_value)
+    async def add_extracted_entities(
+        self,
+        session_id: str,
+        entities: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Add several extracted entities with one SADD.
 
-            await self.update_session_context(session_id, context)
+        Args:
+            session_id: Call session ID
+            entities: (entity_type, entity_value) pairs
+        """
+        try:
+            await self._apply(session_id, entities=entities)
 
         except Exception as e:
-            logger.error(f"Failed to add extracted entity: {e}")
+            logger.error("Failed to add extracted entities: %s", e)
             raise
 
+    @asynccontextmanager
+    async def pipeline(
+        self,
+        session_id: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[SessionContextBatch]:
+        """
+        Batch several context updates into one atomic Redis call.
+
+        Usage:
+            async with dialogue_manager.pipeline(session_id, context) as dm:
+                dm.add_conversation_turn("caller", text)
+                dm.update_emotional_state("anxious")
+                history = await dm.get_conversation_history(max_turns=10)
+
+        Args:
+            session_id: Call session ID
+            context: Context from get_session_context held by the caller for
+                the whole call; updated in place once the batch is written,
+                so it stays current without reading it back from Redis
+
+        Yields:
+            SessionContextBatch applying updates in memory
+
+        If the block raises, the batch is discarded and nothing is written.
+
+        Raises:
+            ValueError: On exit, if the session context does not exist
+        """
+        batch = SessionContextBatch(self.redis_client, session_id)
+        yield batch
+
+        try:
+            await self._apply(
+                session_id,
+                emotional_state=batch.emotional_state,
+                turns=batch.new_turns,
+                entities=batch.entities
+            )
+            _mirror_updates(context, batch.emotional_state, len(batch.new_turns), batch.entities)
+            logger.debug("Session context updated: %s", session_id)
+
+        except Exception as e:
+            logger.error("Failed to write session context batch: %s", e)
+            raise
+
+    async def claim_operator_turn(self, session_id: str, timestamp_ms: int) -> bool:
+        """
+        Mark an operator turn as handled, once per timestamp.
+
+        Clients retry a transcript after a dropped frame or reconnect with the
+        same timestamp_ms. One SADD tells a new turn from a redelivery, so a
+        retry is dropped before it reaches the LLM or the database. If the
+        turn then fails before it is stored, release_operator_turn lets the
+        next retry through.
+
+        Args:
+            session_id: Call session ID
+            timestamp_ms: Client timestamp of the operator turn
+
+        Returns:
+            bool: True if the turn is new, False if it was already claimed
+        """
+        try:
+            turns_key = _turns_key(session_id)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.sadd(turns_key, timestamp_ms)
+                pipe.expire(turns_key, self.session_ttl)
+                added, _ = await pipe.execute()
+            return bool(added)
+
+        except Exception as e:
+            # Fail open: a duplicate turn is better than a dropped one
+            logger.error("Failed to claim operator turn: %s", e)
+            return True
+
+    async def release_operator_turn(self, session_id: str, timestamp_ms: int) -> None:
+        """
+        Undo claim_operator_turn for a turn that failed before it was stored.
+
+        Args:
+            session_id: Call session ID
+            timestamp_ms: Client timestamp of the operator turn
+        """
+        try:
+            await self.redis_client.srem(_turns_key(session_id), timestamp_ms)
+
+        except Exception as e:
+            # The retry will be skipped as a duplicate; the client has
+            # already been sent the processing error
+            logger.error("Failed to release operator turn: %s", e)
+
     async def delete_session_context(self, session_id: str) -> None:
         """
         Delete session context (called when session ends).
@@ -263,12 +608,16 @@ class DialogueManager:
             session_id: Call session ID
         """
         try:
-            key = f"session:{session_id}:context"
-            await self.redis_client.delete(key)
-            logger.info(f"Session context deleted: {session_id}")
+            await self.redis_client.delete(
+                _context_key(session_id),
+                _history_key(session_id),
+                _entities_key(session_id),
+                _turns_key(session_id)
+            )
+            logger.info("Session context deleted: %s", session_id)
 
         except Exception as e:
-            logger.error(f"Failed to delete session context: {e}")
+            logger.error("Failed to delete session context: %s", e)
 
 
 # Global service instance
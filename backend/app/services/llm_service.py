@@ -1,131 +1,270 @@
 """OpenRouter LLM integration service for AI caller responses"""
 
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple
 import httpx
-from app.core.config import settings
+import orjson
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Whitespace after sentence-ending punctuation, but not after a trailing
+# "..." the caller is likely to speak straight through
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])(?<!\.\.\.)\s+")
+
+# Emotional escalation indicators, one alternation per category so each is
+# counted in a single regex pass
+PANIC_WORDS = re.compile("|".join(map(re.escape, ["help", "hurry", "dying", "bleeding", "can't breathe", "please"])))
+CALM_WORDS = re.compile("|".join(map(re.escape, ["okay", "fine", "stable", "better", "calm"])))
+
+# Canned caller lines used when the LLM is unavailable, by emotional state
+FALLBACK_RESPONSES = MappingProxyType({
+    "calm": "Yes, I understand. What do you need to know?",
+    "anxious": "I... I'm trying to stay calm. What should I do?",
+    "panicked": "Please help! I don't know what to do! Please hurry!"
+})
+
+
+@lru_cache(maxsize=4096)
+def _render_system_prompt(
+    name: str,
+    age: Any,
+    background_story: str,
+    personality_traits: Tuple[str, ...],
+    initial_situation: str,
+    emergency_type: str,
+    location_type: str,
+    emotional_state: str
+) -> str:
+    """Render the caller system prompt; cached per distinct set of inputs"""
+    return f"""You are roleplaying as a 911 caller in a training simulation.
+
+Caller Profile:
+- Name: {name}
+- Age: {age}
+- Background: {background_story}
+- Personality: {', '.join(personality_traits)}
+
+Current Situation:
+{initial_situation}
+
+Emergency Type: {emergency_type}
+Location: {location_type}
+
+Current Emotional State: {emotional_state}
+
+Instructions:
+1. Stay in character as the caller
+2. Respond naturally and realistically to the operator's questions
+3. Show appropriate emotion based on your current state
+4. Gradually reveal information as the operator asks questions
+5. Keep responses brief (1-3 sentences) as in a real emergency call
+6. Show stress, fear, or confusion appropriate to the situation
+7. Do not volunteer all information at once - make the operator work for it
+
+Respond only as the caller would speak on the phone. Do not include stage directions or explanations."""
+
 
 class LLMService:
     """Service for interacting with OpenRouter LLM API"""
 
     def __init__(self):
-        self.api_key = settings.openrouter_api_key
-        self.base_url = settings.llm_base_url
+        self.model: Optional[str] = None
+        self.temperature: Optional[float] = None
+        self.max_tokens: Optional[int] = None
+        self.completions_url: Optional[str] = None
+        self.headers: Dict[str, str] = {}
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+    def initialize(self, http_client: httpx.AsyncClient):
+        """
+        Read the LLM settings and use the application's shared HTTP client,
+        keeping connections warm.
+        """
+        settings = get_settings()
         self.model = settings.llm_model
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
+        self.completions_url = f"{settings.llm_base_url}/chat/completions"
+        # Built once; identical for every request
+        self.headers = {
+            "Authorization": f"Bearer {settings.openrouter_api_key}",
+            "Content-Type": "application/json",
+        }
+        self.http_client = http_client
 
     async def generate_caller_response(
         self,
         conversation_history: List[Dict[str, str]],
         caller_profile: Dict[str, Any],
         scenario_context: Dict[str, Any],
-        current_emotional_state: str = "calm"
+        current_emotional_state: str = "calm",
+        on_sentence: Optional[Callable[[str, str], None]] = None
     ) -> Dict[str, Any]:
         """
         Generate AI caller response based on conversation context.
 
+        Drains stream_caller_response. If on_sentence is given, it is called
+        with each complete sentence and the emotional state read so far as
+        soon as that sentence has streamed in, so speech synthesis can start
+        before the completion finishes.
+
         Args:
             conversation_history: List of previous messages
             caller_profile: Caller's personality and background
             scenario_context: Current scenario information
             current_emotional_state: Current emotional state of caller
+            on_sentence: Optional callback for each finished sentence
 
         Returns:
             Dict containing response text, emotional state, and metadata
         """
+        usage: Dict[str, Any] = {}
+        parts: List[str] = []
+        pending = ""
+
         try:
-            # Build system prompt
-            system_prompt = self._build_system_prompt(
+            async for delta in self.stream_caller_response(
+                conversation_history,
                 caller_profile,
                 scenario_context,
-                current_emotional_state
-            )
-
-            # Prepare messages
-            messages = [{"role": "system", "content": system_prompt}]
-            messages.extend(conversation_history)
-
-            # Call OpenRouter API
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "temperature": self.temperature,
-                        "max_tokens": self.max_tokens,
-                    }
-                )
-                response.raise_for_status()
-                result = response.json()
-
-            # Extract response
-            response_text = result["choices"][0]["message"]["content"]
-
-            # Analyze emotional state from response
-            new_emotional_state = self._analyze_emotional_state(
-                response_text,
-                current_emotional_state
-            )
-
-            return {
-                "response_text": response_text,
-                "emotional_state": new_emotional_state,
-                "confidence": 0.9,
-                "metadata": {
-                    "model": self.model,
-                    "tokens_used": result.get("usage", {}).get("total_tokens", 0)
-                }
-            }
+                current_emotional_state,
+                usage=usage
+            ):
+                parts.append(delta)
+                if on_sentence is None:
+                    continue
+                pending += delta
+                *sentences, pending = SENTENCE_BREAK.split(pending)
+                for sentence in sentences:
+                    on_sentence(sentence, self._analyze_emotional_state("".join(parts), current_emotional_state))
 
-        except httpx.HTTPError as e:
-            logger.error(f"LLM API request failed: {e}")
-            return self._get_fallback_response(current_emotional_state)
         except Exception as e:
-            logger.error(f"Unexpected error in LLM service: {e}")
-            return self._get_fallback_response(current_emotional_state)
+            if isinstance(e, httpx.HTTPError):
+                logger.error("LLM API request failed: %s", e)
+            else:
+                logger.error("Unexpected error in LLM service: %s", e)
+            # Text that already streamed may already be playing; keep it
+            # rather than swapping in a fallback line
+            if not parts:
+                fallback = self._get_fallback_response(current_emotional_state)
+                if on_sentence is not None:
+                    on_sentence(fallback["response_text"], fallback["emotional_state"])
+                return fallback
 
-    def _build_system_prompt(
+        response_text = "".join(parts)
+
+        # Analyze emotional state from response
+        new_emotional_state = self._analyze_emotional_state(
+            response_text,
+            current_emotional_state
+        )
+
+        if on_sentence is not None and pending.strip():
+            on_sentence(pending, new_emotional_state)
+
+        return {
+            "response_text": response_text,
+            "emotional_state": new_emotional_state,
+            "confidence": 0.9,
+            "metadata": {
+                "model": self.model,
+                "tokens_used": usage.get("total_tokens", 0)
+            }
+        }
+
+    async def stream_caller_response(
         self,
+        conversation_history: List[Dict[str, str]],
         caller_profile: Dict[str, Any],
         scenario_context: Dict[str, Any],
-        emotional_state: str
-    ) -> str:
-        """Build system prompt for LLM"""
-        return f"""You are roleplaying as a 911 caller in a training simulation.
+        current_emotional_state: str = "calm",
+        usage: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the AI caller response as text deltas.
 
-Caller Profile:
-- Name: {caller_profile.get('name', 'Anonymous')}
-- Age: {caller_profile.get('age', 'Unknown')}
-- Background: {caller_profile.get('background_story', 'N/A')}
-- Personality: {', '.join(caller_profile.get('personality_traits', []))}
+        Requests a server-sent event stream and yields each content delta as
+        it arrives. Errors propagate to the caller.
 
-Current Situation:
-{scenario_context.get('initial_situation', '')}
+        Args:
+            conversation_history: List of previous messages
+            caller_profile: Caller's personality and background
+            scenario_context: Current scenario information
+            current_emotional_state: Current emotional state of caller
+            usage: Optional dict to fill with the token usage reported by
+                the final event
 
-Emergency Type: {scenario_context.get('emergency_type', 'Unknown')}
-Location: {scenario_context.get('location_type', 'Unknown')}
+        Yields:
+            Response text fragments in order
+        """
+        # Build system prompt
+        system_prompt = self._build_system_prompt(
+            caller_profile,
+            scenario_context,
+            current_emotional_state
+        )
 
-Current Emotional State: {emotional_state}
+        # Prepare messages
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend(conversation_history)
 
-Instructions:
-1. Stay in character as the caller
-2. Respond naturally and realistically to the operator's questions
-3. Show appropriate emotion based on your current state
-4. Gradually reveal information as the operator asks questions
-5. Keep responses brief (1-3 sentences) as in a real emergency call
-6. Show stress, fear, or confusion appropriate to the situation
-7. Do not volunteer all information at once - make the operator work for it
+        # Call OpenRouter API
+        async with self.http_client.stream(
+            "POST",
+            self.completions_url,
+            headers=self.headers,
+            # Encoded with orjson rather than httpx's stdlib json encoder
+            content=orjson.dumps({
+                "model": self.model,
+                "messages": messages,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+                "stream": True,
+            }),
+            timeout=30.0
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Events arrive as "data: <json>" lines; blank separators and
+                # ": ..." keepalive comments carry nothing
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
 
-Respond only as the caller would speak on the phone. Do not include stage directions or explanations."""
+                event = orjson.loads(data)
+                if usage is not None and event.get("usage"):
+                    usage.update(event["usage"])
+                choices = event.get("choices")
+                if choices:
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+
+    def _build_system_prompt(
+        self,
+        caller_profile: Dict[str, Any],
+        scenario_context: Dict[str, Any],
+        emotional_state: str
+    ) -> str:
+        """Build system prompt for LLM"""
+        # Only the hashable fields the prompt uses form the cache key, so
+        # every turn of a session reuses the rendered prompt
+        return _render_system_prompt(
+            caller_profile.get('name', 'Anonymous'),
+            caller_profile.get('age', 'Unknown'),
+            caller_profile.get('background_story', 'N/A'),
+            tuple(caller_profile.get('personality_traits', [])),
+            scenario_context.get('initial_situation', ''),
+            scenario_context.get('emergency_type', 'Unknown'),
+            scenario_context.get('location_type', 'Unknown'),
+            emotional_state
+        )
 
     def _analyze_emotional_state(
         self,
@@ -140,12 +279,10 @@ Respond only as the caller would speak on the phone. Do not include stage direct
         """
         text_lower = response_text.lower()
 
-        # Check for escalation indicators
-        panic_words = ["help", "hurry", "dying", "bleeding", "can't breathe", "please"]
-        calm_words = ["okay", "fine", "stable", "better", "calm"]
-
-        panic_count = sum(1 for word in panic_words if word in text_lower)
-        calm_count = sum(1 for word in calm_words if word in text_lower)
+        # Check for escalation indicators; counts are of distinct words
+        # present, not repetitions
+        panic_count = len(set(PANIC_WORDS.findall(text_lower)))
+        calm_count = len(set(CALM_WORDS.findall(text_lower)))
 
         # Determine state based on current state and indicators
         if panic_count > 2:
@@ -159,14 +296,8 @@ Respond only as the caller would speak on the phone. Do not include stage direct
 
     def _get_fallback_response(self, emotional_state: str) -> Dict[str, Any]:
         """Get fallback response if LLM fails"""
-        fallback_responses = {
-            "calm": "Yes, I understand. What do you need to know?",
-            "anxious": "I... I'm trying to stay calm. What should I do?",
-            "panicked": "Please help! I don't know what to do! Please hurry!"
-        }
-
         return {
-            "response_text": fallback_responses.get(emotional_state, "I... I need help."),
+            "response_text": FALLBACK_RESPONSES.get(emotional_state, "I... I need help."),
             "emotional_state": emotional_state,
             "confidence": 0.5,
             "metadata": {"fallback": True}
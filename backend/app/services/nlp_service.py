@@ -1,14 +1,31 @@
 """NLP service for entity extraction using spaCy"""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+import os
+import re
+from typing import Iterable, List, Dict, Any, Optional, Set, Tuple
 import time
 
+import ahocorasick
+
 logger = logging.getLogger(__name__)
 
 # Lazy load spaCy model
 _nlp = None
 
+# Only the NER output is used; these components would run for nothing
+UNUSED_PIPES = ["tagger", "parser", "lemmatizer", "attribute_ruler"]
+
+# Sentiment indicators, one alternation per category so each is counted in a
+# single regex pass
+PANIC_INDICATORS = re.compile("|".join(map(re.escape, ["help", "emergency", "dying", "can't breathe", "hurry"])))
+CALM_INDICATORS = re.compile("|".join(map(re.escape, ["okay", "fine", "stable", "calm", "better"])))
+
+# Micro-batching of concurrent NER requests
+NER_BATCH_SIZE = 32
+NER_BATCH_WINDOW_S = 0.010
+
 
 def get_nlp():
     """Lazy load spaCy model"""
@@ -16,15 +33,37 @@ def get_nlp():
     if _nlp is None:
         try:
             import spacy
-            _nlp = spacy.load("en_core_web_sm")
+            _nlp = spacy.load("en_core_web_sm", disable=UNUSED_PIPES)
             logger.info("spaCy model loaded successfully")
         except Exception as e:
-            logger.error(f"Failed to load spaCy model: {e}")
+            logger.error("Failed to load spaCy model: %s", e)
             logger.info("Run: python -m spacy download en_core_web_sm")
             raise
     return _nlp
 
 
+def _build_keyword_automaton(entity_types: Dict[str, List[str]]) -> ahocorasick.Automaton:
+    """
+    Compile keyword lists into one Aho-Corasick automaton.
+
+    Keywords are matched against lowercased text, so they are added
+    lowercased. Each match yields (entity_type, keyword).
+    """
+    automaton = ahocorasick.Automaton()
+    for entity_type, keywords in entity_types.items():
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (entity_type, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+def _fail_pending(futures: Iterable[asyncio.Future]) -> None:
+    """Fail parse futures that will never get a result"""
+    for future in futures:
+        if not future.done():
+            future.set_exception(RuntimeError("NLP service closed"))
+
+
 class NLPService:
     """Service for natural language processing and entity extraction"""
 
@@ -37,6 +76,114 @@ class NLPService:
         "TIME_REFERENCE": ["minutes ago", "just now", "earlier", "hour ago"],
     }
 
+    def __init__(self):
+        # Finds every keyword in a single pass over the text instead of one
+        # substring scan (plus an index() rescan) per keyword
+        self._keyword_automaton = _build_keyword_automaton(self.EMERGENCY_ENTITY_TYPES)
+        self._ner_queue: Optional[asyncio.Queue] = None
+        self._ner_worker: Optional[asyncio.Task] = None
+        # Batches being parsed, held so they aren't garbage collected
+        # mid-parse and can be cancelled on close
+        self._ner_batches: Set[asyncio.Task] = set()
+        # Batches parsed at once, one worker thread each; more would only
+        # contend for the same cores
+        self._ner_slots = asyncio.Semaphore(os.cpu_count() or 4)
+
+    def initialize(self):
+        """Start the NER batching worker on the running event loop"""
+        self._ner_queue = asyncio.Queue()
+        self._ner_worker = asyncio.create_task(self._run_ner_batches())
+
+    async def close(self):
+        """Stop the NER batching worker, failing any parses still pending"""
+        if self._ner_worker:
+            self._ner_worker.cancel()
+            try:
+                await self._ner_worker
+            except asyncio.CancelledError:
+                pass
+            self._ner_worker = None
+
+        batches = list(self._ner_batches)
+        for task in batches:
+            task.cancel()
+        await asyncio.gather(*batches, return_exceptions=True)
+
+        if self._ner_queue is not None:
+            while not self._ner_queue.empty():
+                _, future = self._ner_queue.get_nowait()
+                _fail_pending([future])
+            self._ner_queue = None
+
+    async def _run_ner_batches(self):
+        """
+        Parse queued texts in batches.
+
+        Waits for one request, then collects more for up to
+        NER_BATCH_WINDOW_S or NER_BATCH_SIZE texts, and runs them through a
+        single nlp.pipe call in a worker thread. Concurrent sessions share
+        one vectorized pass instead of parsing one utterance each. Up to
+        one batch per CPU is parsed at a time.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._ner_queue.get()]
+            try:
+                deadline = loop.time() + NER_BATCH_WINDOW_S
+                while len(batch) < NER_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._ner_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Wait for a free slot, then keep collecting while it parses
+                await self._ner_slots.acquire()
+            except asyncio.CancelledError:
+                _fail_pending(future for _, future in batch)
+                raise
+
+            task = asyncio.create_task(self._parse_batch(batch))
+            self._ner_batches.add(task)
+            task.add_done_callback(self._ner_batches.discard)
+            # A batch cancelled on close, even before it started, must not
+            # leave its callers waiting
+            task.add_done_callback(
+                lambda _, batch=batch: _fail_pending(future for _, future in batch)
+            )
+
+    async def _parse_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Parse one batch in a worker thread and resolve its futures"""
+        try:
+            texts = [text for text, _ in batch]
+            docs = await asyncio.to_thread(
+                lambda: list(get_nlp().pipe(texts, batch_size=NER_BATCH_SIZE))
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._ner_slots.release()
+
+        for (_, future), doc in zip(batch, docs):
+            if not future.done():
+                future.set_result(doc)
+
+    async def _parse(self, text: str):
+        """Run spaCy on one text through the batching worker"""
+        if self._ner_worker is None:
+            # Not started (e.g. scripts and tests): parse directly
+            async with self._ner_slots:
+                return await asyncio.to_thread(get_nlp(), text)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._ner_queue.put((text, future))
+        return await future
+
     async def extract_entities(
         self,
         text: str,
@@ -54,11 +201,12 @@ class NLPService:
         Returns:
             Dict containing extracted entities and processing metadata
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            nlp = get_nlp()
-            doc = nlp(text)
+            # spaCy parsing is CPU-bound; it runs off the event loop so
+            # concurrent LLM/TTS requests keep making progress
+            doc = await self._parse(text)
 
             entities = []
 
@@ -77,25 +225,28 @@ class NLPService:
                         }
                     })
 
-            # Extract emergency-specific entities using keyword matching
+            # Extract emergency-specific entities using keyword matching,
+            # reporting the first occurrence of each keyword
             text_lower = text.lower()
-            for entity_type, keywords in self.EMERGENCY_ENTITY_TYPES.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        start_pos = text_lower.index(keyword)
-                        entities.append({
-                            "entity_type": entity_type,
-                            "entity_value": keyword,
-                            "confidence_score": 0.90,
-                            "start_char": start_pos,
-                            "end_char": start_pos + len(keyword),
-                            "metadata": {
-                                "detection_method": "keyword_match",
-                                "is_emergency_entity": True
-                            }
-                        })
-
-            processing_time = (time.time() - start_time) * 1000
+            seen_keywords = set()
+            for end_index, (entity_type, keyword) in self._keyword_automaton.iter(text_lower):
+                if keyword in seen_keywords:
+                    continue
+                seen_keywords.add(keyword)
+                start_pos = end_index - len(keyword) + 1
+                entities.append({
+                    "entity_type": entity_type,
+                    "entity_value": keyword,
+                    "confidence_score": 0.90,
+                    "start_char": start_pos,
+                    "end_char": end_index + 1,
+                    "metadata": {
+                        "detection_method": "keyword_match",
+                        "is_emergency_entity": True
+                    }
+                })
+
+            processing_time = (time.monotonic_ns() - start_ns) / 1_000_000
 
             return {
                 "entities": entities,
@@ -105,11 +256,11 @@ class NLPService:
             }
 
         except Exception as e:
-            logger.error(f"Entity extraction failed: {e}")
+            logger.error("Entity extraction failed: %s", e)
             return {
                 "entities": [],
                 "text": text,
-                "processing_time_ms": (time.time() - start_time) * 1000,
+                "processing_time_ms": (time.monotonic_ns() - start_ns) / 1_000_000,
                 "error": str(e)
             }
 
@@ -128,11 +279,9 @@ class NLPService:
             # In production, use a proper sentiment model
             text_lower = text.lower()
 
-            panic_indicators = ["help", "emergency", "dying", "can't breathe", "hurry"]
-            calm_indicators = ["okay", "fine", "stable", "calm", "better"]
-
-            panic_score = sum(1 for word in panic_indicators if word in text_lower)
-            calm_score = sum(1 for word in calm_indicators if word in text_lower)
+            # Scores count distinct indicators present, not repetitions
+            panic_score = len(set(PANIC_INDICATORS.findall(text_lower)))
+            calm_score = len(set(CALM_INDICATORS.findall(text_lower)))
 
             if panic_score > calm_score:
                 emotion = "panicked" if panic_score > 2 else "anxious"
@@ -154,7 +303,7 @@ class NLPService:
             }
 
         except Exception as e:
-            logger.error(f"Sentiment analysis failed: {e}")
+            logger.error("Sentiment analysis failed: %s", e)
             return {
                 "emotion": "neutral",
                 "confidence": 0.5,
@@ -0,0 +1,160 @@
+"""Redis lookaside cache for training scenario lookups"""
+
+import logging
+from typing import Dict, Any, Optional
+from uuid import UUID
+import orjson
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+
+from app.core.config import get_settings
+from app.models.database import TrainingScenario
+
+logger = logging.getLogger(__name__)
+
+
+class ScenarioCache:
+    """
+    Caches training scenarios and scenario list responses.
+
+    Scenarios are read-mostly master data, so lookups are served from Redis
+    and fall back to PostgreSQL on a miss. Redis errors are logged and treated
+    as misses; the database stays the source of truth.
+    """
+
+    LIST_KEY_PREFIX = "scenarios:list:"
+
+    def __init__(self):
+        self.redis_client = None
+        self.ttl: Optional[int] = None
+        self.list_ttl: Optional[int] = None
+
+    async def initialize(self):
+        """Read the cache settings and initialize Redis connection"""
+        settings = get_settings()
+        self.ttl = settings.scenario_cache_ttl
+        self.list_ttl = settings.scenario_list_cache_ttl
+        try:
+            self.redis_client = await redis.from_url(
+                settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True
+            )
+            logger.info("ScenarioCache initialized with Redis connection")
+        except Exception as e:
+            logger.error("Failed to initialize ScenarioCache: %s", e)
+            raise
+
+    async def close(self):
+        """Close Redis connection"""
+        if self.redis_client:
+            await self.redis_client.close()
+            logger.info("ScenarioCache Redis connection closed")
+
+    @staticmethod
+    def _key(scenario_id: UUID) -> str:
+        return f"scenario:{scenario_id}"
+
+    async def get(self, scenario_id: UUID, db: AsyncSession) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached fields of a scenario, loading them on a miss.
+
+        Args:
+            scenario_id: Training scenario ID
+            db: Database session used on a cache miss
+
+        Returns:
+            Dict with the TrainingScenarioResponse fields, or None if the
+            scenario does not exist
+        """
+        key = self._key(scenario_id)
+
+        try:
+            data = await self.redis_client.get(key)
+            if data:
+                return orjson.loads(data)
+        except Exception as e:
+            logger.warning("Scenario cache read failed for %s: %s", scenario_id, e)
+
+        result = await db.execute(
+            select(TrainingScenario)
+            .options(raiseload("*"))
+            .where(TrainingScenario.id == scenario_id)
+        )
+        scenario = result.scalar_one_or_none()
+        if not scenario:
+            return None
+
+        scenario_data = {
+            "id": str(scenario.id),
+            "name": scenario.name,
+            "description": scenario.description,
+            "scenario_script": scenario.scenario_script,
+            "difficulty_level": scenario.difficulty_level.value,
+            "caller_profile": scenario.caller_profile,
+            "created_at": scenario.created_at.isoformat(),
+            "updated_at": scenario.updated_at.isoformat()
+        }
+
+        try:
+            await self.redis_client.set(key, orjson.dumps(scenario_data), ex=self.ttl)
+        except Exception as e:
+            logger.warning("Scenario cache write failed for %s: %s", scenario_id, e)
+
+        return scenario_data
+
+    def _list_key(self, difficulty: Optional[str], skip: int, limit: int) -> str:
+        return f"{self.LIST_KEY_PREFIX}{difficulty or ''}:{skip}:{limit}"
+
+    async def get_list(self, difficulty: Optional[str], skip: int, limit: int) -> Optional[str]:
+        """
+        Get a cached scenario list response.
+
+        Args:
+            difficulty: Normalized difficulty filter, if any
+            skip: Page offset
+            limit: Page size
+
+        Returns:
+            Serialized TrainingScenarioListResponse JSON, or None on a miss
+        """
+        try:
+            return await self.redis_client.get(self._list_key(difficulty, skip, limit))
+        except Exception as e:
+            logger.warning("Scenario list cache read failed: %s", e)
+            return None
+
+    async def set_list(self, difficulty: Optional[str], skip: int, limit: int, payload: str) -> None:
+        """
+        Cache a serialized scenario list response.
+
+        Args:
+            difficulty: Normalized difficulty filter, if any
+            skip: Page offset
+            limit: Page size
+            payload: Serialized TrainingScenarioListResponse JSON
+        """
+        try:
+            await self.redis_client.set(self._list_key(difficulty, skip, limit), payload, ex=self.list_ttl)
+        except Exception as e:
+            logger.warning("Scenario list cache write failed: %s", e)
+
+    async def invalidate(self, scenario_id: UUID) -> None:
+        """
+        Drop a scenario and every cached list page after a scenario changes.
+
+        Args:
+            scenario_id: Training scenario ID
+        """
+        try:
+            keys = [self._key(scenario_id)]
+            keys.extend([key async for key in self.redis_client.scan_iter(match=f"{self.LIST_KEY_PREFIX}*")])
+            await self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.warning("Scenario cache invalidation failed for %s: %s", scenario_id, e)
+
+
+# Global service instance
+scenario_cache = ScenarioCache()
@@ -1,20 +1,54 @@
 """S3/MinIO storage service for audio recordings"""
 
+import asyncio
+import io
 import logging
-from typing import Optional, BinaryIO
-from datetime import datetime, timedelta
+import time
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+from datetime import datetime, timedelta, timezone
 import uuid
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-from app.core.config import settings
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Recordings above 8MB go up as multipart uploads with parts sent in
+# parallel; memory in flight is bounded by part size times concurrency
+AUDIO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+# Upper bound on cached presigned URLs; expired entries are pruned first
+PRESIGN_CACHE_SIZE = 1024
+
 
 class StorageService:
-    """Service for storing and retrieving files from S3/MinIO"""
+    """
+    Service for storing and retrieving files from S3/MinIO.
+
+    boto3 is blocking, so every request runs in a worker thread via
+    asyncio.to_thread; the client is thread-safe and shared. Presigned URLs
+    are computed locally and stay synchronous.
+    """
 
     def __init__(self):
+        self.s3_client = None
+        self.endpoint_url: Optional[str] = None
+        self.bucket_name: Optional[str] = None
+        # (file_key, expiration) -> (monotonic reuse deadline, url)
+        self._presign_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+
+    async def initialize(self) -> None:
+        """Build the S3 client and ensure the bucket exists, once at startup"""
+        settings = get_settings()
+        self.endpoint_url = settings.s3_endpoint
+        self.bucket_name = settings.s3_bucket_name
         self.s3_client = boto3.client(
             's3',
             endpoint_url=settings.s3_endpoint,
@@ -23,29 +57,36 @@ class StorageService:
             region_name=settings.s3_region,
             use_ssl=settings.s3_secure
         )
-        self.bucket_name = settings.s3_bucket_name
-        self._ensure_bucket_exists()
+        await asyncio.to_thread(self._ensure_bucket_exists)
 
     def _ensure_bucket_exists(self) -> None:
         """Ensure the S3 bucket exists, create if not"""
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"S3 bucket '{self.bucket_name}' exists")
+            logger.info("S3 bucket '%s' exists", self.bucket_name)
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == '404':
-                logger.info(f"Creating S3 bucket '{self.bucket_name}'")
+                logger.info("Creating S3 bucket '%s'", self.bucket_name)
                 try:
                     self.s3_client.create_bucket(Bucket=self.bucket_name)
-                    logger.info(f"S3 bucket '{self.bucket_name}' created successfully")
+                    logger.info("S3 bucket '%s' created successfully", self.bucket_name)
                 except Exception as create_error:
-                    logger.error(f"Failed to create bucket: {create_error}")
+                    logger.error("Failed to create bucket: %s", create_error)
             else:
-                logger.error(f"Error checking bucket: {e}")
+                logger.error("Error checking bucket: %s", e)
+
+    def _read_object(self, file_key: str) -> bytes:
+        """Fetch an object and read its body (blocking)"""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=file_key
+        )
+        return response['Body'].read()
 
     async def upload_audio_recording(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, BinaryIO],
         session_id: uuid.UUID,
         filename: Optional[str] = None,
         content_type: str = "audio/wav"
@@ -53,8 +94,11 @@ class StorageService:
         """
         Upload audio recording to S3.
 
+        File objects are streamed with a managed transfer, so large
+        recordings never need to be held in memory as one buffer.
+
         Args:
-            audio_data: Audio file bytes
+            audio_data: Audio file bytes, or a readable binary file object
             session_id: Call session ID
             filename: Optional custom filename
             content_type: MIME type of the audio
@@ -64,34 +108,41 @@ class StorageService:
         """
         try:
             if filename is None:
-                timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+                timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
                 filename = f"recordings/{session_id}/{timestamp}.wav"
 
+            if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                audio_data = io.BytesIO(audio_data)
+
             # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=filename,
-                Body=audio_data,
-                ContentType=content_type,
-                Metadata={
-                    'session_id': str(session_id),
-                    'uploaded_at': datetime.utcnow().isoformat()
-                }
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                audio_data,
+                self.bucket_name,
+                filename,
+                ExtraArgs={
+                    'ContentType': content_type,
+                    'Metadata': {
+                        'session_id': str(session_id),
+                        'uploaded_at': datetime.now(timezone.utc).isoformat()
+                    }
+                },
+                Config=AUDIO_TRANSFER_CONFIG
             )
 
             # Generate URL
-            url = f"{settings.s3_endpoint}/{self.bucket_name}/{filename}"
-            logger.info(f"Audio recording uploaded: {url}")
+            url = f"{self.endpoint_url}/{self.bucket_name}/{filename}"
+            logger.info("Audio recording uploaded: %s", url)
 
             return url
 
         except Exception as e:
-            logger.error(f"Failed to upload audio recording: {e}")
+            logger.error("Failed to upload audio recording: %s", e)
             raise
 
     async def upload_transcript_chunk(
         self,
-        transcript_data: bytes,
+        transcript_data: Union[bytes, Dict[str, Any]],
         session_id: uuid.UUID,
         chunk_id: str
     ) -> str:
@@ -99,7 +150,7 @@ class StorageService:
         Upload transcript chunk to S3.
 
         Args:
-            transcript_data: Transcript data bytes
+            transcript_data: Encoded transcript bytes, or a dict to encode as JSON
             session_id: Call session ID
             chunk_id: Unique chunk identifier
 
@@ -108,19 +159,22 @@ class StorageService:
         """
         try:
             filename = f"transcripts/{session_id}/{chunk_id}.json"
+            if isinstance(transcript_data, dict):
+                transcript_data = orjson.dumps(transcript_data, option=orjson.OPT_SERIALIZE_NUMPY)
 
-            self.s3_client.put_object(
+            await asyncio.to_thread(
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=filename,
                 Body=transcript_data,
                 ContentType="application/json"
             )
 
-            url = f"{settings.s3_endpoint}/{self.bucket_name}/{filename}"
+            url = f"{self.endpoint_url}/{self.bucket_name}/{filename}"
             return url
 
         except Exception as e:
-            logger.error(f"Failed to upload transcript chunk: {e}")
+            logger.error("Failed to upload transcript chunk: %s", e)
             raise
 
     async def get_file(
@@ -137,18 +191,14 @@ class StorageService:
             File bytes
         """
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=file_key
-            )
-            return response['Body'].read()
+            return await asyncio.to_thread(self._read_object, file_key)
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
-                logger.error(f"File not found: {file_key}")
+                logger.error("File not found: %s", file_key)
                 raise FileNotFoundError(f"File not found: {file_key}")
             else:
-                logger.error(f"Failed to retrieve file: {e}")
+                logger.error("Failed to retrieve file: %s", e)
                 raise
 
     async def delete_file(
@@ -165,15 +215,16 @@ class StorageService:
             bool: True if successful
         """
         try:
-            self.s3_client.delete_object(
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=file_key
             )
-            logger.info(f"File deleted: {file_key}")
+            logger.info("File deleted: %s", file_key)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to delete file: {e}")
+            logger.error("Failed to delete file: %s", e)
             return False
 
     async def generate_presigned_url(
@@ -184,6 +235,10 @@ class StorageService:
         """
         Generate presigned URL for temporary access to file.
 
+        A signed URL is reused for the first half of its lifetime, so
+        repeated requests for the same file skip SigV4 signing while every
+        URL handed out stays valid for at least expiration / 2 seconds.
+
         Args:
             file_key: S3 object key
             expiration: URL expiration time in seconds
@@ -191,6 +246,12 @@ class StorageService:
         Returns:
             Presigned URL
         """
+        cache_key = (file_key, expiration)
+        now = time.monotonic()
+        cached = self._presign_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+
         try:
             url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -200,10 +261,20 @@ class StorageService:
                 },
                 ExpiresIn=expiration
             )
+
+            if len(self._presign_cache) >= PRESIGN_CACHE_SIZE:
+                self._presign_cache = {
+                    key: entry for key, entry in self._presign_cache.items() if entry[0] > now
+                }
+                if len(self._presign_cache) >= PRESIGN_CACHE_SIZE:
+                    # Still full of live entries: drop the oldest
+                    del self._presign_cache[next(iter(self._presign_cache))]
+            self._presign_cache[cache_key] = (now + expiration / 2, url)
+
             return url
 
         except Exception as e:
-            logger.error(f"Failed to generate presigned URL: {e}")
+            logger.error("Failed to generate presigned URL: %s", e)
             raise
 
     async def list_session_files(
@@ -221,7 +292,8 @@ class StorageService:
         """
         try:
             prefix = f"recordings/{session_id}/"
-            response = self.s3_client.list_objects_v2(
+            response = await asyncio.to_thread(
+                self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name,
                 Prefix=prefix
             )
@@ -232,7 +304,7 @@ class StorageService:
                 return []
 
         except Exception as e:
-            logger.error(f"Failed to list session files: {e}")
+            logger.error("Failed to list session files: %s", e)
             return []
 
     async def health_check(self) -> bool:
@@ -243,10 +315,10 @@ class StorageService:
             bool: True if service is healthy
         """
         try:
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.bucket_name)
             return True
         except Exception as e:
-            logger.error(f"S3 health check failed: {e}")
+            logger.error("S3 health check failed: %s", e)
             return False
 
 
@@ -1,22 +1,53 @@
 """Coqui TTS integration service for text-to-speech"""
 
+import asyncio
+import hashlib
 import logging
-import base64
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import httpx
-from app.core.config import settings
+import orjson
+from app.core.config import get_settings
+from app.services.audio_service import audio_service
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched model catalog is reused
+MODELS_CACHE_TTL = 60.0
+
+# Streamed read size for synthesized audio
+TTS_READ_CHUNK = 64 * 1024
+
 
 class TTSService:
     """Service for text-to-speech using Coqui TTS"""
 
     def __init__(self):
+        self.tts_url: Optional[str] = None
+        self.model: Optional[str] = None
+        self.vocoder: Optional[str] = None
+        self.sample_rate: Optional[int] = None
+        self.cache_size = 0
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # (WAV bytes, parsed header) by content key, least recently used first
+        self._audio_cache: "OrderedDict[bytes, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[bytes, asyncio.Task] = {}
+        # (monotonic fetch time, catalog) of the last successful fetch
+        self._models_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def initialize(self, http_client: httpx.AsyncClient):
+        """
+        Read the TTS settings and use the application's shared HTTP client,
+        keeping connections warm.
+        """
+        settings = get_settings()
         self.tts_url = settings.coqui_tts_url
         self.model = settings.tts_model
         self.vocoder = settings.tts_vocoder
         self.sample_rate = settings.tts_sample_rate
+        self.cache_size = settings.tts_cache_size
+        self.http_client = http_client
 
     async def synthesize_speech(
         self,
@@ -33,47 +64,96 @@ class TTSService:
             speaker_profile: Optional speaker characteristics
 
         Returns:
-            Dict containing audio data, sample rate, duration, and format
+            Dict containing raw audio_bytes, sample rate, duration, and
+            format; callers base64 encode only if their transport needs it
         """
         try:
             # Adjust text based on emotional state
             processed_text = self._apply_emotional_prosody(text, emotional_state)
 
-            # Call Coqui TTS API
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.tts_url}/api/tts",
-                    params={
-                        "text": processed_text,
-                        "model_name": self.model,
-                        "vocoder_name": self.vocoder,
-                    }
-                )
-                response.raise_for_status()
-
-            # Encode audio data to base64
-            audio_bytes = response.content
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-
-            # Calculate approximate duration (rough estimate)
-            # Actual duration depends on speech rate, typically ~150 words/minute
-            word_count = len(text.split())
-            estimated_duration_ms = int((word_count / 150) * 60 * 1000)
+            audio_bytes, wav_header = await self._synthesize_audio(processed_text)
+
+            # Exact duration from the WAV header; without a standard header,
+            # estimate it at a typical ~150 words/minute speech rate
+            duration_ms = wav_header.get("duration_ms")
+            if duration_ms is None:
+                word_count = len(text.split())
+                duration_ms = int((word_count / 150) * 60 * 1000)
 
             return {
-                "audio_data": audio_base64,
-                "sample_rate": self.sample_rate,
-                "duration_ms": estimated_duration_ms,
+                "audio_bytes": audio_bytes,
+                "sample_rate": wav_header.get("sample_rate", self.sample_rate),
+                "duration_ms": duration_ms,
                 "format": "wav"
             }
 
         except httpx.HTTPError as e:
-            logger.error(f"TTS API request failed: {e}")
+            logger.error("TTS API request failed: %s", e)
             raise Exception(f"TTS service unavailable: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error in TTS service: {e}")
+            logger.error("Unexpected error in TTS service: %s", e)
             raise
 
+    async def _synthesize_audio(self, processed_text: str) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Get synthesized audio for prosody-adjusted text.
+
+        Stock phrases repeat across calls, so clips are cached by a hash of
+        the model, vocoder and text. Only the raw bytes are kept, so an entry
+        costs no more than the clip itself. Concurrent requests for the same
+        audio share one Coqui request.
+        """
+        key = hashlib.blake2b(
+            f"{self.model}|{self.vocoder}|{processed_text}".encode(),
+            digest_size=16
+        ).digest()
+
+        audio = self._audio_cache.get(key)
+        if audio is not None:
+            self._audio_cache.move_to_end(key)
+            return audio
+
+        request = self._in_flight.get(key)
+        if request is None:
+            request = asyncio.create_task(self._request_audio(processed_text))
+            self._in_flight[key] = request
+            request.add_done_callback(lambda done: self._store_audio(key, done))
+
+        # Shielded so one cancelled waiter doesn't cancel it for the others
+        return await asyncio.shield(request)
+
+    async def _request_audio(self, processed_text: str) -> Tuple[bytes, Dict[str, Any]]:
+        """Call Coqui TTS API, parsing the WAV header from the first read"""
+        chunks = []
+        wav_header: Dict[str, Any] = {}
+        async with self.http_client.stream(
+            "POST",
+            f"{self.tts_url}/api/tts",
+            params={
+                "text": processed_text,
+                "model_name": self.model,
+                "vocoder_name": self.vocoder,
+            },
+            timeout=30.0
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(TTS_READ_CHUNK):
+                if not chunks:
+                    wav_header = audio_service.parse_wav_header(chunk)
+                chunks.append(chunk)
+
+        return b"".join(chunks), wav_header
+
+    def _store_audio(self, key: bytes, request: asyncio.Task) -> None:
+        """Cache a finished synthesis, evicting the least recently used"""
+        del self._in_flight[key]
+        if request.cancelled() or request.exception() is not None:
+            return
+
+        self._audio_cache[key] = request.result()
+        if len(self._audio_cache) > self.cache_size:
+            self._audio_cache.popitem(last=False)
+
     def _apply_emotional_prosody(self, text: str, emotional_state: Optional[str]) -> str:
         """
         Apply emotional prosody markers to text.
@@ -102,16 +182,23 @@ class TTSService:
         """
         Get list of available TTS models.
 
+        The catalog rarely changes, so it is reused for MODELS_CACHE_TTL
+        seconds after a successful fetch.
+
         Returns:
             Dict containing available models and vocoders
         """
+        if self._models_cache and time.monotonic() - self._models_cache[0] < MODELS_CACHE_TTL:
+            return self._models_cache[1]
+
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.tts_url}/api/models")
-                response.raise_for_status()
-                return response.json()
+            response = await self.http_client.get(f"{self.tts_url}/api/models", timeout=10.0)
+            response.raise_for_status()
+            models = orjson.loads(response.content)
+            self._models_cache = (time.monotonic(), models)
+            return models
         except Exception as e:
-            logger.error(f"Failed to fetch TTS models: {e}")
+            logger.error("Failed to fetch TTS models: %s", e)
             return {"models": [], "vocoders": []}
 
     async def health_check(self) -> bool:
@@ -122,11 +209,11 @@ class TTSService:
             bool: True if service is healthy
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.tts_url}/api/models")
-                return response.status_code == 200
+            # HEAD answers with the GET status without sending the model list
+            response = await self.http_client.head(f"{self.tts_url}/api/models", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
-            logger.error(f"TTS health check failed: {e}")
+            logger.error("TTS health check failed: %s", e)
             return False
 
 
@@ -22,11 +22,18 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
 
+    reload = settings.environment == "development"
     uvicorn.run(
         "app.main:app",
         host=settings.backend_host,
         port=settings.backend_port,
-        reload=settings.environment == "development",
+        loop="uvloop",
+        http="httptools",
+        # uvicorn ignores workers when reloading
+        workers=1 if reload else settings.backend_workers,
+        reload=reload,
         log_level=settings.log_level.lower(),
-        access_log=True
+        # Access lines are formatted and written synchronously on every
+        # request, so they are only kept for local development
+        access_log=reload
     )
@@ -0,0 +1,159 @@
+"""DialogueManager scripts and batching against an in-process Redis"""
+
+import fakeredis
+import pytest
+import pytest_asyncio
+
+from app.services.dialogue_manager import (
+    APPLY_BATCH_LUA,
+    UPDATE_FIELDS_LUA,
+    DialogueManager,
+    _context_key,
+    _entities_key,
+    _history_key,
+)
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest_asyncio.fixture
+async def manager():
+    """A DialogueManager wired as initialize() does, on fakeredis"""
+    dm = DialogueManager()
+    dm.session_ttl = 60
+    dm.max_history_turns = 4
+    dm.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    dm._apply_batch = dm.redis_client.register_script(APPLY_BATCH_LUA)
+    dm._update_fields = dm.redis_client.register_script(UPDATE_FIELDS_LUA)
+    yield dm
+    await dm.redis_client.aclose()
+
+
+@pytest_asyncio.fixture
+async def context(manager):
+    await manager.create_session_context(SESSION_ID, {"name": "test"}, {"initial_emotional_state": "anxious"})
+    return await manager.get_session_context(SESSION_ID)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_applies_batch(manager, context):
+    """One batch writes turns, entities and emotional state, and mirrors them"""
+    async with manager.pipeline(SESSION_ID, context) as dm:
+        dm.add_conversation_turn("operator", "911, what is your emergency?")
+        dm.add_conversation_turn("caller", "There is a fire")
+        dm.add_extracted_entities([("LOCATION", "Oak Street"), ("LOCATION", "Oak Street")])
+        dm.update_emotional_state("panicked")
+
+    stored = await manager.get_session_context(SESSION_ID)
+    assert stored["turn_count"] == 2
+    assert stored["current_emotional_state"] == "panicked"
+    assert stored["extracted_entities"] == {"LOCATION": ["Oak Street"]}
+    history = await manager.get_conversation_history(SESSION_ID)
+    assert [turn["speaker"] for turn in history] == ["operator", "caller"]
+
+    assert context["turn_count"] == 2
+    assert context["current_emotional_state"] == "panicked"
+    assert context["extracted_entities"] == {"LOCATION": ["Oak Street"]}
+
+
+@pytest.mark.asyncio
+async def test_history_is_trimmed(manager, context):
+    """Only the last max_history_turns turns are kept, turn_count keeps counting"""
+    async with manager.pipeline(SESSION_ID, context) as dm:
+        for number in range(6):
+            dm.add_conversation_turn("operator", f"turn {number}")
+
+    history = await manager.get_conversation_history(SESSION_ID)
+    assert [turn["content"] for turn in history] == ["turn 2", "turn 3", "turn 4", "turn 5"]
+    assert (await manager.get_session_context(SESSION_ID))["turn_count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_pipeline_discards_batch_on_error(manager, context):
+    """A turn that fails inside the block leaves Redis untouched"""
+    with pytest.raises(RuntimeError):
+        async with manager.pipeline(SESSION_ID, context) as dm:
+            dm.add_conversation_turn("operator", "Where are you?")
+            history = await dm.get_conversation_history(max_turns=10)
+            assert [turn["content"] for turn in history] == ["Where are you?"]
+            raise RuntimeError("LLM unavailable")
+
+    assert await manager.get_conversation_history(SESSION_ID) == []
+    assert (await manager.get_session_context(SESSION_ID))["turn_count"] == 0
+    assert context["turn_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_get_history_reads_stored_tail(manager, context):
+    """The batch's history view is the stored tail followed by pending turns"""
+    async with manager.pipeline(SESSION_ID, context) as dm:
+        for number in range(3):
+            dm.add_conversation_turn("operator", f"turn {number}")
+
+    async with manager.pipeline(SESSION_ID, context) as dm:
+        dm.add_conversation_turn("caller", "pending")
+        history = await dm.get_conversation_history(max_turns=2)
+
+    assert [turn["content"] for turn in history] == ["turn 2", "pending"]
+
+
+@pytest.mark.asyncio
+async def test_batch_without_context_writes_nothing(manager):
+    """An ended session is not recreated by a late batch"""
+    with pytest.raises(ValueError):
+        async with manager.pipeline(SESSION_ID) as dm:
+            dm.add_conversation_turn("caller", "Hello?")
+            dm.add_extracted_entities([("PERSON", "John")])
+
+    for key in (_context_key(SESSION_ID), _history_key(SESSION_ID), _entities_key(SESSION_ID)):
+        assert not await manager.redis_client.exists(key)
+
+
+@pytest.mark.asyncio
+async def test_add_turn_and_get_history(manager, context):
+    """The append and the read share one round trip; the result ends with the new turn"""
+    for number in range(3):
+        history = await manager.add_turn_and_get_history(
+            SESSION_ID, "operator", f"turn {number}", max_turns=2, context=context
+        )
+
+    assert [turn["content"] for turn in history] == ["turn 1", "turn 2"]
+    assert context["turn_count"] == 3
+    assert (await manager.get_session_context(SESSION_ID))["turn_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_add_turn_and_get_history_without_context(manager):
+    with pytest.raises(ValueError):
+        await manager.add_turn_and_get_history(SESSION_ID, "operator", "Hello?", max_turns=10)
+    assert not await manager.redis_client.exists(_history_key(SESSION_ID))
+
+
+@pytest.mark.asyncio
+async def test_update_session_context_requires_context(manager, context):
+    await manager.update_session_context(SESSION_ID, {"key_info_revealed": ["address"]})
+    assert (await manager.get_session_context(SESSION_ID))["key_info_revealed"] == ["address"]
+
+    with pytest.raises(ValueError):
+        await manager.update_session_context("missing", {"key_info_revealed": []})
+    assert not await manager.redis_client.exists(_context_key("missing"))
+
+
+@pytest.mark.asyncio
+async def test_claim_operator_turn(manager, context):
+    """A timestamp is claimed once, and a released claim can be taken again"""
+    assert await manager.claim_operator_turn(SESSION_ID, 12345)
+    assert not await manager.claim_operator_turn(SESSION_ID, 12345)
+    assert await manager.claim_operator_turn(SESSION_ID, 12346)
+
+    await manager.release_operator_turn(SESSION_ID, 12345)
+    assert await manager.claim_operator_turn(SESSION_ID, 12345)
+
+
+@pytest.mark.asyncio
+async def test_delete_session_context_drops_claims(manager, context):
+    await manager.claim_operator_turn(SESSION_ID, 12345)
+    await manager.delete_session_context(SESSION_ID)
+
+    assert await manager.get_session_context(SESSION_ID) is None
+    assert await manager.claim_operator_turn(SESSION_ID, 12345)
@@ -0,0 +1,41 @@
+"""Schema creation against a real PostgreSQL database"""
+
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models.database import Base
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL,
+    reason="TEST_DATABASE_URL not set; needs an empty PostgreSQL database (postgresql+asyncpg://...)",
+)
+
+
+@pytest.mark.asyncio
+async def test_create_all_on_empty_database():
+    """create_all, as run by init_db, succeeds through asyncpg and installs every after_create DDL"""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+            triggers = await conn.scalars(text(
+                "SELECT tgname FROM pg_trigger WHERE tgrelid = 'performance_metrics'::regclass"
+            ))
+            assert "trg_performance_metrics_rollup" in set(triggers)
+
+            partitions = await conn.scalars(text(
+                "SELECT relname FROM pg_class WHERE relname IN "
+                "('call_transcripts_default', 'extracted_entities_default')"
+            ))
+            assert set(partitions) == {"call_transcripts_default", "extracted_entities_default"}
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.execute(text("DROP FUNCTION IF EXISTS performance_metrics_rollup()"))
+        await engine.dispose()
@@ -0,0 +1,57 @@
+"""Batching of the per-turn transcript and entity inserts"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from app.api.routes.websocket import INSERT_ENTITIES, INSERT_TRANSCRIPTS
+
+
+def insert_batches(statement, rows):
+    """Statements insertmanyvalues would send to asyncpg for one execute()"""
+    compiled = statement.compile(
+        dialect=asyncpg_dialect(), column_keys=list(rows[0]), for_executemany=True
+    )
+    compiled_parameters = [compiled.construct_params(row) for row in rows]
+    parameters = [
+        tuple(params[key] for key in compiled.positiontup)
+        for params in compiled_parameters
+    ]
+    return list(compiled._deliver_insertmanyvalues_batches(
+        compiled.string, parameters, compiled_parameters, None, 1000, True, None
+    ))
+
+
+@pytest.mark.parametrize("statement, rows", [
+    (INSERT_TRANSCRIPTS, [
+        {
+            "session_id": uuid.uuid4(),
+            "timestamp_ms": timestamp_ms,
+            "speaker": "operator",
+            "text": "Where are you?",
+            "confidence_bp": 9500,
+        }
+        for timestamp_ms in range(3)
+    ]),
+    (INSERT_ENTITIES, [
+        {
+            "transcript_id": 1,
+            "transcript_created_at": datetime(2026, 1, 1),
+            "entity_type": "LOCATION",
+            "entity_value": f"{number} Main St",
+            "confidence_bp": 9000,
+            "start_char": 0,
+            "end_char": 11,
+            "entity_metadata": {},
+        }
+        for number in range(3)
+    ]),
+])
+def test_insert_returning_is_one_statement(statement, rows):
+    """Rows go out in one INSERT ... RETURNING, not one statement per row"""
+    batches = insert_batches(statement, rows)
+    assert len(batches) == 1
+    assert not batches[0].is_downgraded
+    assert len(batches[0].batch) == len(rows)